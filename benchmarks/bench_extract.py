@@ -0,0 +1,385 @@
+"""
+benchmarks.bench_extract
+========================
+
+Provides
+    - A command-line script that benchmarks the ``gdutils.extract``
+      pipeline (read, filter, reindex, write) on generated tables.
+
+Metadata
+--------
+:Filename:      `bench_extract.py <https://github.com/mggg/gdutils/>`_
+:Description:   Benchmark suite for ``gdutils.extract``
+:Dependencies:
+
+                - ``geopandas``
+                - ``gdutils.extract``
+                - ``numpy``
+                - ``pandas``
+
+Usage
+-----
+Synthetic attribute-only and polygon tables are generated in every
+supported input filetype. For each table, the script times ``ExtractTable``
+construction, ``value`` filtering, ``extract()`` reindexing, and
+``extract_to_file`` for every supported output filetype. Each table is
+benchmarked in a fresh process so that its peak memory can be reported,
+and every stage is run several times; the fastest run is reported.
+::
+
+    $ python benchmarks/bench_extract.py
+    $ python benchmarks/bench_extract.py --rows 10000 100000 1000000
+    $ python benchmarks/bench_extract.py --compare benchmarks/baselines.json
+    $ python benchmarks/bench_extract.py --save benchmarks/baselines.json
+
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+
+from typing import Any, Dict, List, NoReturn, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+KINDS =             ['attribute', 'polygon']
+INPUT_FORMATS =     ['.csv', '.geojson', '.json', '.pkl', '.shp', '.xlsx',
+                     '.zip']
+OUTPUT_FORMATS =    ['.bz2', '.csv', '.geojson', '.gpkg', '.gzip', '.html',
+                     '.json', '.md', '.pkl', '.tex', '.xlsx', '.zip']
+XLSX_MAX_ROWS =     1048575
+N_COUNTIES =        50
+
+
+
+#########################################
+#                                       #
+#       Table Generation                #
+#                                       #
+#########################################
+
+def generate_table(kind: str, rows: int, seed: Optional[int] = 0):
+    """
+    Returns a synthetic precinct-like table of the given kind ('attribute'
+    or 'polygon') with the given number of rows.
+
+    """
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+            'GEOID':    ['{:012d}'.format(i) for i in range(rows)],
+            'COUNTY':   ['C{:02d}'.format(c)
+                            for c in rng.integers(0, N_COUNTIES, rows)],
+            'TOTPOP':   rng.integers(0, 5000, rows),
+            'PRES16D':  rng.integers(0, 2000, rows),
+            'PRES16R':  rng.integers(0, 2000, rows),
+            'SHARE':    rng.random(rows)})
+
+    if kind == 'attribute':
+        return df
+
+    side = int(np.ceil(np.sqrt(rows)))
+    (x, y) = (np.arange(rows) % side, np.arange(rows) // side)
+    geometry = gpd.GeoSeries.from_wkt(
+            ['POLYGON (({0} {1}, {2} {1}, {2} {3}, {0} {3}, {0} {1}))'.format(
+                    x0, y0, x0 + 1, y0 + 1) for x0, y0 in zip(x, y)])
+    return gpd.GeoDataFrame(df, geometry=geometry, crs='EPSG:4326')
+
+
+def write_table(table, kind: str, ext: str, dirpath: str) -> Optional[str]:
+    """
+    Writes the given table in the given input filetype and returns its path.
+    Returns ``None`` if the filetype cannot hold the table.
+
+    """
+    import pandas as pd
+
+    path = os.path.join(dirpath, '{}{}'.format(kind, ext))
+    is_geometric = kind == 'polygon'
+
+    if ext == '.csv':
+        pd.DataFrame(table).to_csv(path)
+    elif ext == '.xlsx':
+        if len(table) > XLSX_MAX_ROWS:
+            return None
+        pd.DataFrame(table).assign(**({'geometry': table.geometry.to_wkt()}
+                                      if is_geometric else {})
+                                   ).to_excel(path)
+    elif ext == '.pkl':
+        table.to_pickle(path)
+    elif ext == '.json':
+        pd.DataFrame(table).drop(columns='geometry', errors='ignore'
+                                 ).to_json(path)
+    elif ext in ('.geojson', '.shp'):
+        if not is_geometric:
+            return None
+        table.to_file(path, driver='GeoJSON' if ext == '.geojson' else None)
+    elif ext == '.zip':
+        member = write_table(table, kind, '.shp' if is_geometric else '.csv',
+                             os.path.join(dirpath, 'members'))
+        with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zipped:
+            stem = os.path.splitext(member)[0]
+            for sidecar in os.listdir(os.path.dirname(member)):
+                full = os.path.join(os.path.dirname(member), sidecar)
+                if os.path.splitext(full)[0] == stem:
+                    zipped.write(full, sidecar)
+    else:
+        raise ValueError('Unsupported input filetype {}'.format(ext))
+
+    return path
+
+
+
+#########################################
+#                                       #
+#       Benchmarking                    #
+#                                       #
+#########################################
+
+def bench_file(path: str, rows: int, outputs: List[str],
+               outdir: str, repeat: int) -> Dict[str, Any]:
+    """
+    Times each stage of the extraction pipeline on the given input file,
+    running it the given number of times. Meant to be run in a fresh
+    process so that peak memory is meaningful.
+
+    """
+    # imported up front so the first read doesn't pay for lazy imports
+    import geopandas
+    import shapely.wkt
+    import gdutils.extract as et
+
+    results = {}
+
+    def timed(stage, func, rows_processed):
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            runs.append(time.perf_counter() - start)
+
+        seconds = min(runs)
+        results[stage] = {'seconds': seconds,
+                          'median_seconds': statistics.median(runs),
+                          'rows_per_sec': rows_processed / seconds
+                                          if seconds > 0 else None}
+
+    values = ['C{:02d}'.format(c) for c in range(0, N_COUNTIES, 10)]
+    holder = {}
+
+    timed('read', lambda: holder.update(table=et.ExtractTable(path)), rows)
+    table = holder['table']
+    results['read']['mb_per_sec'] = (
+            os.path.getsize(path) / 1e6 / results['read']['seconds'])
+
+    table.column = 'COUNTY'
+    timed('filter', lambda: setattr(table, 'value', values), rows)
+    timed('reindex', table.extract, len(table.extract()))
+
+    # some writers (e.g. '.json') need a unique index, so the same filtered
+    # rows are written indexed by GEOID
+    geoids = list(table.extract()['GEOID'])
+    table.column = 'GEOID'
+    table.value = geoids
+
+    for ext in outputs:
+        if ext == '.xlsx' and rows > XLSX_MAX_ROWS:
+            continue
+        outfile = os.path.join(outdir, 'out{}'.format(ext))
+        try:
+            timed('write' + ext, lambda: table.extract_to_file(outfile),
+                  len(table.extract()))
+        except Exception as e:
+            results['write' + ext] = {'error': str(e)}
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    results['peak_rss_mb'] = ( # ru_maxrss is in bytes on macOS, else KiB
+            maxrss / 1024 ** 2 if sys.platform == 'darwin' else maxrss / 1024)
+    return results
+
+
+def run(kinds: List[str],
+        sizes: List[int],
+        inputs: List[str],
+        outputs: List[str],
+        repeat: int
+        ) -> Dict[str, Dict[str, Any]]:
+    """
+    Generates tables and benchmarks each one in its own process. Returns a
+    dictionary keyed by ``'<kind>/<rows>/<filetype>'``.
+
+    """
+    results = {}
+    ctx = multiprocessing.get_context('spawn')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for kind in kinds:
+            for rows in sizes:
+                table = generate_table(kind, rows)
+                for ext in inputs:
+                    casedir = os.path.join(tmp, kind, str(rows), ext[1:])
+                    os.makedirs(os.path.join(casedir, 'members'))
+                    path = write_table(table, kind, ext, casedir)
+                    if path is None:
+                        continue
+
+                    key = '{}/{}/{}'.format(kind, rows, ext)
+                    sys.stderr.write('benchmarking {}\n'.format(key))
+                    with ctx.Pool(1) as pool:
+                        results[key] = pool.apply(
+                                bench_file, 
+                                (path, rows, outputs, casedir, repeat))
+                del table
+
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]],
+            baselines: Dict[str, Dict[str, Any]],
+            tolerance: float) -> List[str]:
+    """
+    Returns a list of report lines comparing stage timings with stored
+    baselines. Lines of stages slower than ``1 + tolerance`` times their
+    baseline are marked as regressions. Stages that failed now or in the
+    baseline, or that have no baseline, are reported as such.
+
+    """
+    row = '{:<32} {:<14} {:>10} {:>10} {:>7}{}'
+    lines = []
+    for key, stages in results.items():
+        for stage, res in stages.items():
+            if stage == 'peak_rss_mb':
+                continue
+
+            base = baselines.get(key, {}).get(stage)
+            if base is None:
+                lines.append(row.format(key, stage, '', '', '', 
+                                        '  NO BASELINE'))
+            elif 'error' in res or 'error' in base:
+                lines.append(row.format(
+                        key, stage, 'error' if 'error' in res else '',
+                        'error' if 'error' in base else '', '', '  FAILED'))
+            else:
+                (now, then) = (res['seconds'], base['seconds'])
+                ratio = now / then if then > 0 else float('inf')
+                lines.append(row.format(
+                        key, stage, '{:.4f}s'.format(now), 
+                        '{:.4f}s'.format(then), '{:.2f}x'.format(ratio),
+                        '  REGRESSION' if ratio > 1 + tolerance else ''))
+    return lines
+
+
+def machine() -> Dict[str, Any]:
+    """Returns a description of the current machine."""
+    return {'platform':     platform.platform(),
+            'processor':    platform.processor(),
+            'python':       platform.python_version(),
+            'cpus':         os.cpu_count()}
+
+
+def report(results: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Returns a list of report lines of timings, throughput and memory."""
+    lines = []
+    for key, stages in results.items():
+        lines.append('{}  (peak rss {:.1f} MB)'.format(
+                        key, stages['peak_rss_mb']))
+        for stage, res in stages.items():
+            if stage == 'peak_rss_mb':
+                continue
+            elif 'error' in res:
+                lines.append('    {:<14} error: {}'.format(
+                                stage, res['error']))
+            else:
+                lines.append('    {:<14} {:>9.4f}s {:>14,.0f} rows/s'.format(
+                                stage, res['seconds'],
+                                res['rows_per_sec'] or 0))
+    return lines
+
+
+
+#########################################
+#                                       #
+#       Command-Line Parsing            #
+#                                       #
+#########################################
+
+def parse_arguments() -> argparse.Namespace:
+    """Parses command-line arguments and returns a Namespace of values."""
+    parser = argparse.ArgumentParser(
+                description='Benchmarks the gdutils.extract pipeline.')
+    parser.add_argument(
+                '--rows', dest='rows', metavar='N', type=int, nargs='+',
+                default=[10000], help='table sizes to benchmark')
+    parser.add_argument(
+                '--kinds', dest='kinds', nargs='+', choices=KINDS,
+                default=KINDS, help='kinds of tables to benchmark')
+    parser.add_argument(
+                '--inputs', dest='inputs', nargs='+', default=INPUT_FORMATS,
+                help='input filetypes to benchmark')
+    parser.add_argument(
+                '--outputs', dest='outputs', nargs='+',
+                default=OUTPUT_FORMATS, help='output filetypes to benchmark')
+    parser.add_argument(
+                '--save', dest='save', metavar='BASELINE',
+                help='store results as baselines in the given JSON file')
+    parser.add_argument(
+                '--compare', dest='compare', metavar='BASELINE',
+                help='compare results with baselines in the given JSON file')
+    parser.add_argument(
+                '--tolerance', dest='tolerance', type=float, default=0.25,
+                help='allowed slowdown relative to baselines '
+                     '(default: 0.25)')
+    parser.add_argument(
+                '--repeat', dest='repeat', type=int, default=5,
+                help='runs per stage; the fastest is reported (default: 5)')
+    return parser.parse_args()
+
+
+
+#########################################
+#                                       #
+#               Main                    #
+#                                       #
+#########################################
+
+def main() -> NoReturn:
+    """Parses command-line arguments, runs benchmarks, reports results."""
+    args = parse_arguments()
+    results = run(args.kinds, args.rows, args.inputs, args.outputs,
+                  args.repeat)
+    print('\n'.join(report(results)))
+
+    if args.compare is not None:
+        with open(args.compare) as infile:
+            baselines = json.load(infile)
+        if baselines.get('machine') != machine():
+            sys.stderr.write(
+                'warning: baselines were recorded on a different machine '
+                '({}); ratios reflect hardware as well as code.\n'.format(
+                    baselines.get('machine')))
+        print('\n{:<32} {:<14} {:>10} {:>10} {:>7}'.format(
+                'case', 'stage', 'now', 'baseline', 'ratio'))
+        print('\n'.join(compare(results, baselines['results'], 
+                                args.tolerance)))
+
+    if args.save is not None:
+        with open(args.save, 'w') as outfile:
+            json.dump({'machine': machine(), 'results': results}, 
+                      outfile, indent=2)
+
+    sys.exit()
+
+
+if __name__ == "__main__":
+    main()
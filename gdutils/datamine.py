@@ -29,16 +29,24 @@ Additionally, documentation can be found on `Read the Docs
 <https://gdutils.readthedocs.io>`_.
 
 """
+from __future__ import annotations
+
+import hashlib
 import json
 import os
 import pathlib
 import requests
+import sqlite3
 import subprocess
 import sys
+import time
 import urllib.parse
 
-from typing import (Dict, Hashable, Iterable, List, NoReturn, Optional, Tuple,
-                    Union)
+from typing import (TYPE_CHECKING, Any, ContextManager, Dict, Hashable, 
+                    Iterable, List, NoReturn, Optional, Tuple, Union)
+
+if TYPE_CHECKING: # heavy dependencies are imported lazily where needed
+    import pandas as pd
 
 
 #########################################
@@ -377,6 +385,278 @@ def get_keys_by_category(dictionary: Dict[Hashable, List[Iterable]],
                                   for key in dictionary[item]])
 
 
+def build_catalog(catalog: Union[str, pathlib.Path],
+                  dirpath: Optional[Union[str, pathlib.Path]] = '.',
+                  filetypes: Optional[Union[str, List[str]]] = None,
+                  exclude_hidden: Optional[bool] = True
+                  ) -> Dict[str, int]:
+    """
+    Records the schema, row count, CRS, bounds and fingerprint of each file
+    of the given types in the given directory in a SQLite catalog, so that
+    later questions about the files do not need to open them.
+
+    A file already in the catalog is only scanned again if its size or 
+    modification time changed, and then only read again if its contents,
+    fingerprinted by SHA-256, changed. Files that are no longer in the
+    directory are removed from the catalog.
+
+    Parameters
+    ----------
+    catalog : str | pathlib.Path
+        Name/path of the SQLite database file. Created if it does not exist.
+    dirpath : str | pathlib.Path, optional, default = ``'.'``
+        Path to directory from which file listing begins. Defaults to
+        current working directory if not specified.
+    filetypes : str | List[str] | None, optional, default = ``None``
+        File extension(s) of files to catalog. Defaults to 
+        ``['.csv', '.geojson', '.gpkg', '.parquet', '.shp', '.zip']``.
+    exclude_hidden : bool, optional, default = ``True``
+        If false, function includes hidden files in the catalog.
+
+    Returns
+    -------
+    Dict[str, int]
+        Numbers of files ``'added'`` to, ``'updated'`` in, ``'unchanged'`` 
+        in and ``'removed'`` from the catalog, and of files that 
+        ``'failed'`` to be read, whose errors are recorded in the catalog.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if unable to find given directory.
+
+    See Also
+    --------
+    datamine.read_catalog
+    datamine.files_with_columns
+    datamine.files_intersecting
+
+    Examples
+    --------
+    >>> summary = datamine.build_catalog('catalog.db', 'repos/')
+    # records every data file in 'repos/'
+    >>> print(summary)
+    {'added': 412, 'updated': 0, 'unchanged': 0, 'removed': 0, 'failed': 3}
+
+    >>> summary = datamine.build_catalog('catalog.db', 'repos/')
+    # re-scans only files that changed since
+    >>> print(summary)
+    {'added': 0, 'updated': 1, 'unchanged': 411, 'removed': 0, 'failed': 0}
+
+    """
+    root = os.path.abspath(__get_validated_path(dirpath))
+    files = [os.path.abspath(file) for file in list_files_of_type(
+                filetypes or ['.csv', '.geojson', '.gpkg', '.parquet', 
+                              '.shp', '.zip'], 
+                root, exclude_hidden)]
+    summary = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0, 
+               'failed': 0}
+
+    with __connect_catalog(catalog) as connection:
+        known = {path: (size, mtime, fingerprint) for 
+                 (path, size, mtime, fingerprint) in connection.execute(
+                    "SELECT path, size, mtime_ns, fingerprint FROM files")}
+
+        for file in files:
+            stat = os.stat(file)
+            (size, mtime) = (stat.st_size, stat.st_mtime_ns)
+            if file in known and known[file][:2] == (size, mtime):
+                summary['unchanged'] += 1
+                continue
+
+            fingerprint = __fingerprint(file)
+            if file in known and known[file][2] == fingerprint:
+                connection.execute(
+                    "UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                    (size, mtime, file))
+                summary['unchanged'] += 1
+                continue
+
+            entry = __scan_file(file)
+            connection.execute("DELETE FROM columns WHERE path = ?", (file,))
+            connection.execute(
+                "INSERT OR REPLACE INTO files VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (file, size, mtime, fingerprint, entry['rows'], entry['crs'],
+                 *entry['bounds'], entry['error'], time.time()))
+            connection.executemany(
+                "INSERT INTO columns VALUES (?, ?, ?)",
+                [(file, i, column) for (i, column) in 
+                 enumerate(entry['columns'])])
+            summary['updated' if file in known else 'added'] += 1
+            if entry['error'] is not None:
+                summary['failed'] += 1
+
+        removed = [path for path in set(known) - set(files) 
+                   if path.startswith(os.path.join(root, ''))]
+        connection.executemany("DELETE FROM files WHERE path = ?", 
+                               [(path,) for path in removed])
+        connection.executemany("DELETE FROM columns WHERE path = ?", 
+                               [(path,) for path in removed])
+        summary['removed'] = len(removed)
+
+    return summary
+
+
+def read_catalog(catalog: Union[str, pathlib.Path]) -> pd.DataFrame:
+    """
+    Returns the files recorded in the given SQLite catalog.
+
+    Parameters
+    ----------
+    catalog : str | pathlib.Path
+        Name/path of a SQLite database file built by 
+        ``datamine.build_catalog``.
+
+    Returns
+    -------
+    pd.DataFrame
+        A row per file, sorted by path, with its ``'path'``, ``'size'`` in
+        bytes, modification time (``'mtime_ns'``), SHA-256 
+        ``'fingerprint'``, ``'columns'`` (a list), number of ``'rows'``, 
+        ``'crs'`` (e.g. ``'EPSG:4269'``), bounds (``'minx'``, ``'miny'``, 
+        ``'maxx'``, ``'maxy'``), the ``'error'`` raised reading it (or 
+        ``None``), and the time it was ``'scanned'``. Statistics that could
+        not be read are missing.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the catalog does not exist.
+
+    Examples
+    --------
+    >>> files = datamine.read_catalog('catalog.db')
+    >>> print(files.loc[files['rows'] > 1000, ['path', 'rows', 'crs']])
+                                     path  rows        crs
+    0  /repos/AK-shapefiles/AK_precincts.zip  441  EPSG:4269
+
+    """
+    import pandas as pd
+
+    if not os.path.isfile(catalog):
+        raise FileNotFoundError("Unable to find catalog '{}'".format(catalog))
+
+    with __connect_catalog(catalog) as connection:
+        files = pd.read_sql_query("SELECT * FROM files ORDER BY path", 
+                                  connection)
+        columns = pd.read_sql_query(
+                    "SELECT path, name FROM columns ORDER BY path, position",
+                    connection)
+
+    files['rows'] = files['rows'].astype('Int64')
+    columns = columns.groupby('path', sort=False)['name'].agg(list)
+    files.insert(4, 'columns', [columns.get(path, []) 
+                                for path in files['path']])
+    return files
+
+
+def files_with_columns(catalog: Union[str, pathlib.Path],
+                       columns: Union[str, List[str]],
+                       match_all: Optional[bool] = True
+                       ) -> List[str]:
+    """
+    Returns the paths of the files in the given SQLite catalog that have the
+    given column(s).
+
+    Parameters
+    ----------
+    catalog : str | pathlib.Path
+        Name/path of a SQLite database file built by 
+        ``datamine.build_catalog``.
+    columns : str | List[str]
+        Name(s) of columns to look for.
+    match_all : bool, optional, default = ``True``
+        If false, returns the files that have any of the columns rather 
+        than all of them.
+
+    Returns
+    -------
+    List[str]
+        Sorted paths of the files that have the column(s).
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the catalog does not exist.
+
+    Examples
+    --------
+    >>> files = datamine.files_with_columns('catalog.db', ['TOTPOP', 'VAP'])
+    # lists the files with both a 'TOTPOP' and a 'VAP' column
+    >>> print(files)
+    ['/repos/AK-shapefiles/AK_precincts.zip', 
+     '/repos/CT-shapefiles/CT_precincts.zip']
+
+    """
+    if not os.path.isfile(catalog):
+        raise FileNotFoundError("Unable to find catalog '{}'".format(catalog))
+    if isinstance(columns, str):
+        columns = [columns]
+    columns = sorted(set(columns))
+
+    with __connect_catalog(catalog) as connection:
+        return [path for (path,) in connection.execute(
+                    "SELECT path FROM columns WHERE name IN ({}) GROUP BY "
+                    "path HAVING COUNT(DISTINCT name) >= ? ORDER BY "
+                    "path".format(', '.join('?' * len(columns))),
+                    (*columns, len(columns) if match_all else 1))]
+
+
+def files_intersecting(catalog: Union[str, pathlib.Path],
+                       bounds: Tuple[float, float, float, float],
+                       crs: Optional[Any] = None
+                       ) -> List[str]:
+    """
+    Returns the paths of the files in the given SQLite catalog whose bounds
+    intersect the given bounds.
+
+    Parameters
+    ----------
+    catalog : str | pathlib.Path
+        Name/path of a SQLite database file built by 
+        ``datamine.build_catalog``.
+    bounds : Tuple[float, float, float, float]
+        Bounds ``(minx, miny, maxx, maxy)`` to intersect.
+    crs : Any | None, optional, default = ``None``
+        CRS of the bounds, e.g. ``'EPSG:4269'``, in any form accepted by
+        ``pyproj.CRS``. If given, only files in the same CRS are returned.
+        Bounds are not reprojected.
+
+    Returns
+    -------
+    List[str]
+        Sorted paths of the files whose bounds intersect the given bounds.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the catalog does not exist.
+
+    Examples
+    --------
+    >>> files = datamine.files_intersecting(
+    ...             'catalog.db', (-180, 50, -130, 72), crs='EPSG:4269')
+    >>> print(files)
+    ['/repos/AK-shapefiles/AK_precincts.zip']
+
+    """
+    if not os.path.isfile(catalog):
+        raise FileNotFoundError("Unable to find catalog '{}'".format(catalog))
+
+    (minx, miny, maxx, maxy) = bounds
+    query = ("SELECT path FROM files WHERE minx <= ? AND maxx >= ? AND "
+             "miny <= ? AND maxy >= ?")
+    parameters = [maxx, minx, maxy, miny]
+    if crs is not None:
+        query += " AND crs = ?"
+        parameters.append(__normalize_crs(crs))
+
+    with __connect_catalog(catalog) as connection:
+        return [path for (path,) in connection.execute(
+                    query + " ORDER BY path", parameters)]
+
+
 
 #########################################
 #                                       #
@@ -455,6 +735,129 @@ def __list_repos(dirpath: Optional[Union[str, pathlib.Path]] = '.'
             if pathlib.Path(subdir).name == '.git']
 
 
+def __connect_catalog(catalog: Union[str, pathlib.Path]
+                      ) -> ContextManager[sqlite3.Connection]:
+    """
+    Returns a context manager yielding a connection to the given SQLite 
+    catalog, creating its tables if they do not exist. The connection 
+    commits, or rolls back on errors, and closes on exit.
+
+    """
+    import contextlib
+
+    connection = sqlite3.connect(os.fspath(catalog))
+    connection.executescript("""
+        CREATE TABLE IF NOT EXISTS files (
+            path        TEXT PRIMARY KEY,
+            size        INTEGER,
+            mtime_ns    INTEGER,
+            fingerprint TEXT,
+            rows        INTEGER,
+            crs         TEXT,
+            minx        REAL,
+            miny        REAL,
+            maxx        REAL,
+            maxy        REAL,
+            error       TEXT,
+            scanned     REAL);
+        CREATE TABLE IF NOT EXISTS columns (
+            path        TEXT,
+            position    INTEGER,
+            name        TEXT,
+            PRIMARY KEY (path, position));
+        CREATE INDEX IF NOT EXISTS columns_by_name ON columns (name);
+        """)
+
+    @contextlib.contextmanager
+    def transaction():
+        try:
+            with connection: # commits, or rolls back on errors
+                yield connection
+        finally:
+            connection.close()
+
+    return transaction()
+
+
+def __fingerprint(filename: str) -> str:
+    """
+    Returns the SHA-256 hex digest of the contents of the given file.
+
+    """
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as infile:
+        for block in iter(lambda: infile.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def __scan_file(filename: str) -> Dict[str, Any]:
+    """
+    Returns the columns, number of rows, CRS and bounds of the given file,
+    and the error raised reading them, if any. Spatial files are read from
+    their headers where possible and other files are read in chunks. Of a
+    zipfile, the member extract.zip_member names is read.
+
+    """
+    import gdutils.extract as et
+
+    entry = {'columns': [], 'rows': None, 'crs': None, 
+             'bounds': (None,) * 4, 'error': None}
+    try:
+        entry['columns'] = et.read_columns(filename)
+        (path, ext) = (filename, os.path.splitext(filename)[1].lower())
+        if ext == '.zip': # the member read_columns and iter_chunks read
+            member = et.zip_member(filename)
+            (path, ext) = ('zip://{}!{}'.format(os.path.abspath(filename), 
+                                                member),
+                           os.path.splitext(member)[1].lower())
+
+        if ext in ('.shp', '.geojson', '.gpkg'):
+            import fiona
+
+            with fiona.open(path) as source:
+                entry['rows'] = len(source)
+                entry['crs'] = __normalize_crs(source.crs_wkt or None)
+                if entry['rows']:
+                    entry['bounds'] = tuple(source.bounds)
+        else:
+            import numpy as np
+
+            bounds = np.full(4, np.nan)
+            entry['rows'] = 0
+            columns = (['geometry'] if 'geometry' in entry['columns'] else 
+                       entry['columns'][:1])
+            for chunk in et.iter_chunks(filename, columns=columns):
+                entry['rows'] += len(chunk)
+                if hasattr(chunk, 'total_bounds'):
+                    entry['crs'] = __normalize_crs(chunk.crs)
+                    new = chunk.total_bounds
+                    bounds = np.concatenate([np.fmin(bounds[:2], new[:2]), 
+                                             np.fmax(bounds[2:], new[2:])])
+            if not np.isnan(bounds).any():
+                entry['bounds'] = tuple(float(bound) for bound in bounds)
+    except Exception as e:
+        entry['error'] = repr(e)
+
+    return entry
+
+
+def __normalize_crs(crs: Any) -> Optional[str]:
+    """
+    Returns the given CRS as an authority string, e.g. ``'EPSG:4269'``, or
+    as WKT if it has no authority.
+
+    """
+    if crs is None:
+        return None
+
+    import pyproj
+
+    crs = pyproj.CRS.from_user_input(crs)
+    authority = crs.to_authority()
+    return ':'.join(authority) if authority else crs.to_wkt()
+
+
 def __get_validated_path(dirpath: Union[str, pathlib.Path]) -> pathlib.Path:
     try:
         root_path = pathlib.Path(dirpath)
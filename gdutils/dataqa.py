@@ -32,19 +32,24 @@ Additionally, documentation can be found on `Read the Docs
 <https://gdutils.readthedocs.io>`_.
 
 """
-import geopandas as gpd
+from __future__ import annotations
+
 import json
 import os
-import pandas as pd 
 import pathlib
-import requests
 import subprocess
 import sys
 import urllib.parse
 
+import argparse
 import gdutils.extract as et
-from typing import (Any, Dict, Hashable, Iterable, List, 
-                    NoReturn, Optional, Set, Tuple, Union)
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Hashable, Iterable, 
+                    List, NoReturn, Optional, Set, Tuple, Union)
+
+if TYPE_CHECKING: # heavy dependencies are imported lazily where needed
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
 
 
 
@@ -54,7 +59,7 @@ from typing import (Any, Dict, Hashable, Iterable, List,
 #                                       #
 #########################################
 
-def compare_column_names(table: Union[pd.DataFrame, gpd.GeoDataFrame],
+def compare_column_names(table: Union[pd.DataFrame, gpd.GeoDataFrame, str],
                          standards: Union[List[str], Set[str]]
                          ) -> Tuple[Set[str], Set[str]]:
     """
@@ -63,11 +68,14 @@ def compare_column_names(table: Union[pd.DataFrame, gpd.GeoDataFrame],
     between standardized column names and columns in the table and the set of
     columns names in the table that are not in the standards.
 
+    Given the path of a file instead, reads only the file's header or 
+    schema, by ``extract.read_columns``, rather than the whole table.
+
     Parameters
     ----------
-    table : pd.DataFrame | gpd.GeoDataFrame
+    table : pd.DataFrame | gpd.GeoDataFrame | str
         Tabular data whose column names are to be compared against the 
-        standards.
+        standards, or the name/path of a file of it.
     standards : List[str] | Set[str]
         List/set of standardized column names to be compared against the given
         tabular data.
@@ -98,13 +106,20 @@ def compare_column_names(table: Union[pd.DataFrame, gpd.GeoDataFrame],
     >>> print(discrepancies)
     {'col2'}
 
+    >>> for shp in datamine.list_files_of_type('.shp', 'repos/'):
+    ...     (_, discrepancies) = dataqa.compare_column_names(shp, standards)
+    # checks the columns of every shapefile without reading their rows
+
     """
-    intersection = set(standards).intersection(set(table.columns))
-    difference = set(table.columns) - intersection
+    columns = (et.read_columns(os.fspath(table)) 
+               if isinstance(table, (str, os.PathLike)) else table.columns)
+    intersection = set(standards).intersection(set(columns))
+    difference = set(columns) - intersection
     return (intersection, difference)
 
 
-def sum_column_values(table: Union[pd.DataFrame, gpd.GeoDataFrame],
+def sum_column_values(table: Union[pd.DataFrame, gpd.GeoDataFrame, str,
+                                   et.ExtractTable],
                       columns: Union[List[str], Set[str]]
                       ) -> List[Tuple[str, int]]:
     """
@@ -113,10 +128,15 @@ def sum_column_values(table: Union[pd.DataFrame, gpd.GeoDataFrame],
     their values. It is an unchecked runtime error if a column containing 
     non-numerical values is passed into the function.
 
+    Given the path of a file instead, reads the file in chunks, with bounded
+    memory, and returns the same sums. Floats are summed exactly, so sums
+    do not depend on how the values are chunked.
+
     Parameters
     ----------
-    table : pd.DataFrame, gpd.GeoDataFrame
-        Tabular data containing columns whose values are to be summed.
+    table : pd.DataFrame, gpd.GeoDataFrame, str, extract.ExtractTable
+        Tabular data containing columns whose values are to be summed, or
+        the name/path of a file of it, read by ``extract.iter_chunks``.
     columns: List[str] | Set[str]
         A list/set of column names whose values are to be summed.
     
@@ -150,8 +170,100 @@ def sum_column_values(table: Union[pd.DataFrame, gpd.GeoDataFrame],
     COL1: 5
     COL3: 9 
 
+    >>> totals = dataqa.sum_column_values('huge.csv', cols)
+    # sums the columns of 'huge.csv' without loading all of it
+
+    """
+    columns = list(columns)
+    sums = {col: (None, None, 0.0) for col in columns}
+    for chunk in __iter_tables(table, columns):
+        for col in columns:
+            sums[col] = __add_to_sum(sums[col], chunk[col])
+
+    return [(col, __finish_sum(sums[col])) for col in columns]
+
+
+def sum_column_values_by(table: Union[pd.DataFrame, gpd.GeoDataFrame],
+                         columns: Union[List[str], Set[str]],
+                         by: Union[str, List[str]]
+                         ) -> pd.DataFrame:
+    """
+    Given a pandas DataFrame or a geopandas GeoDataFrame, a list of column 
+    names, and the column(s) to group rows by, returns the sums of the 
+    columns' values in each group, e.g. the vote totals of each county. 
+    Rows are grouped once for all columns. Integers that could overflow
+    64 bits and floats are summed exactly, and missing values are skipped.
+
+    Parameters
+    ----------
+    table : pd.DataFrame, gpd.GeoDataFrame
+        Tabular data containing columns whose values are to be summed.
+    columns: List[str] | Set[str]
+        A list/set of names of numeric columns whose values are to be summed.
+    by : str | List[str]
+        Column(s) whose values group the rows. Missing values form a group.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Sums of each group and column, one per row, sorted by group, with 
+        the grouping columns, the ``'column'`` summed and its ``'sum'``.
+    
+    Raises
+    ------
+    KeyError
+        Raised if given column name does not exist in table.
+    TypeError
+        Raised if a column to sum is not numeric.
+
+    See Also
+    --------
+    dataqa.sum_column_values
+    
+    Examples
+    --------
+    >>> df = pd.DataFrame(data=[['a', 1, 0.1], ['b', 4, 0.2], ['a', 2, 0.2]],
+    ...                   columns=['county', 'votes', 'share'])
+    >>> print(dataqa.sum_column_values_by(df, ['votes', 'share'], 'county'))
+      county column  sum
+    0      a  votes    3
+    1      a  share  0.3
+    2      b  votes    4
+    3      b  share  0.2
+
     """
-    return [(col, table[col].sum()) for col in list(columns)]
+    import numpy as np
+    import pandas as pd
+
+    by = [by] if isinstance(by, str) else list(by)
+    columns = list(columns)
+
+    grouped = table.groupby(by, sort=True, dropna=False)
+    codes = grouped.ngroup().to_numpy()
+    order = np.argsort(codes, kind='stable')
+    sizes = np.bincount(codes, minlength=grouped.ngroups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]).astype(int)
+
+    sums = {}
+    for column in columns:
+        values = table[column]
+        if not (pd.api.types.is_numeric_dtype(values) or 
+                pd.api.types.is_bool_dtype(values)):
+            raise TypeError('Column {} is not numeric.'.format(column))
+        if pd.api.types.is_extension_array_dtype(values): # skips pd.NA
+            values = values.to_numpy(dtype=values.dtype.numpy_dtype, 
+                                     na_value=0)
+        else:
+            values = values.to_numpy()
+        sums[column] = __sum_groups(values[order], starts, sizes)
+
+    wide = pd.DataFrame(sums, index=grouped.size().index, columns=columns)
+    if wide.dtypes.nunique() > 1: # keeps integers exact
+        wide = wide.astype(object)
+    tidy = wide.melt(ignore_index=False, var_name='column', 
+                     value_name='sum').reset_index()
+    return tidy.sort_values(by, kind='stable', na_position='last', 
+                            ignore_index=True)
 
 
 def compare_column_values(
@@ -160,12 +272,15 @@ def compare_column_values(
         columns1: List[str], 
         columns2: List[str],
         rows1: Optional[List[Hashable]] = None,
-        rows2: Optional[List[Hashable]] = None
+        rows2: Optional[List[Hashable]] = None,
+        keys1: Optional[Union[str, List[str]]] = None,
+        keys2: Optional[Union[str, List[str]]] = None
         ) -> Dict[str, List[Tuple[Hashable, Any]]]:
     """
     Given two tables and their corresponding columns and rows to compare,
     returns a dictionary containing the compared columns and a corresponding 
     list of tuples containing row names and the differences of values.
+    A view of the DataFrame returned by ``dataqa.diff_column_values``.
 
     *Note:* The comparison is a one-to-one and onto function. I.e. Each element 
     in one given list must correspond to another element in the other list.
@@ -186,6 +301,11 @@ def compare_column_values(
     rows2: List[Hashable], optional, default = ``None``
         Rows in table2 to compare. AKA value(s) of table's index.
         If ``None``, function compares all rows.
+    keys1: str | List[str], optional, default = ``None``
+        Key column(s) in table1 to align the tables on instead of
+        comparing rows by position. See ``dataqa.align_tables``.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in table2 matching keys1. If ``None``, uses keys1.
 
     Returns
     -------
@@ -198,6 +318,8 @@ def compare_column_values(
             {'c1 [vs] c2': [('row1 [vs] row1', 2), ('row2 [vs] row2', 0)],
              'cA [vs] cB': [('rowA1 [vs] rowB1', 5)]}
 
+        If keys are given, rows are named after their keys instead.
+
     Raises
     ------
     KeyError
@@ -205,11 +327,12 @@ def compare_column_values(
     TypeError
         Raised if unable to calculate the difference between
         two values.
-    RuntimeError
+    ValueError
         Raised if given lists cannot be compared.
     
     See Also
     --------
+    dataqa.diff_column_values
     dataqa.compare_column_sums
     
     Examples
@@ -257,34 +380,484 @@ def compare_column_values(
     [('0 [vs] 1', -1), ('1 [vs] 0', -1)]
 
     """
+    diff = diff_column_values(table1, table2, columns1, columns2, 
+                              rows1, rows2, keys1, keys2)
+    if keys1 is None:
+        labels = ['{} [vs] {}'.format(row1, row2) 
+                  for (row1, row2) in diff.index]
+    else:
+        labels = ['{}'.format(key) for key in diff.index]
+
+    return {column: list(zip(labels, values.tolist())) 
+            for (column, values) in diff.items()}
+
+
+def diff_column_values(
+        table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+        table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+        columns1: List[str], 
+        columns2: List[str],
+        rows1: Optional[List[Hashable]] = None,
+        rows2: Optional[List[Hashable]] = None,
+        keys1: Optional[Union[str, List[str]]] = None,
+        keys2: Optional[Union[str, List[str]]] = None
+        ) -> pd.DataFrame:
+    """
+    Given two tables and their corresponding columns and rows to compare,
+    returns a DataFrame of the differences of their values, with a column 
+    for each pair of compared columns and a row for each pair of compared 
+    rows. Each pair of columns is subtracted as a whole, so large tables 
+    are compared quickly.
+
+    *Note:* The comparison is a one-to-one and onto function. I.e. Each element 
+    in one given list must correspond to another element in the other list.
+
+    Parameters
+    ----------
+    table1: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare.
+    table2: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare.
+    columns1: List[str]
+        Columns in table1 to compare.
+    columns2: List[str]
+        Columns in table2 to compare.
+    rows1: List[Hashable], optional, default = ``None``
+        Rows in table1 to compare. AKA value(s) of table's index.
+        If ``None``, function compares all rows, in order.
+    rows2: List[Hashable], optional, default = ``None``
+        Rows in table2 to compare. AKA value(s) of table's index.
+        If ``None``, function compares all rows, in order.
+    keys1: str | List[str], optional, default = ``None``
+        Key column(s) in table1 to align the tables on instead of
+        comparing rows by position. Rows whose keys are only in one of the 
+        tables are left out; see ``dataqa.align_tables`` to list them.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in table2 matching keys1. If ``None``, uses keys1.
+
+    Returns
+    -------
+    pd.DataFrame
+        Differences of the values in table1 and table2, with columns named
+        after the compared columns and indexed by the compared rows of 
+        table1 and table2 (index levels ``'row1'`` and ``'row2'``), or by
+        the keys of table1 if keys are given. E.g.
+        ::
+
+                       c1 [vs] c2  cA [vs] cB
+            row1 row2
+            row1 row1           2           5
+            row2 row2           0          -1
+
+    Raises
+    ------
+    KeyError
+        Raised if unable to find column or row in tables.
+    TypeError
+        Raised if unable to calculate the difference between
+        two values.
+    ValueError
+        Raised if given lists cannot be compared, if no rows or keys are 
+        given and the tables have different numbers of rows, or if keys are
+        not unique.
+    
+    See Also
+    --------
+    dataqa.compare_column_values
+    dataqa.align_tables
+
+    Examples
+    --------
+    >>> df1 = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]],
+    ...                    columns=['COL1', 'COL2', 'COL3'])
+    >>> df2 = pd.DataFrame(data=[[4, 5], [1, 2]], columns=['col2', 'col1'])
+    >>> diff = dataqa.diff_column_values(df1, df2, ['COL1', 'COL3'], 
+    ...                                  ['col1', 'col2'])
+    >>> print(diff)
+               COL1 [vs] col1  COL3 [vs] col2
+    row1 row2                                
+    0    0                 -4              -1
+    1    1                  2               5
+
+    >>> diff = dataqa.diff_column_values(df1, df2, ['COL1'], ['col1'],
+    ...                                  [0, 1], [1, 0])
+    # compares rows 0 and 1 (table1) with rows 1 and 0 (table2)
+    >>> print(diff['COL1 [vs] col1'].tolist())
+    [-1, -1]
+
+    >>> df1['ID'] = ['a', 'b']
+    >>> df2['id'] = ['b', 'a']
+    >>> diff = dataqa.diff_column_values(df1, df2, ['COL1'], ['col1'],
+    ...                                  keys1='ID', keys2='id')
+    # compares rows with the same ID, wherever they are in each table
+    >>> print(diff)
+        COL1 [vs] col1
+    ID                
+    a               -1
+    b               -1
+
+    """
+    import pandas as pd
+
     if not __can_compare(columns1, columns2):
         raise ValueError(
             'Cannot compare columns {} and {}.'.format(columns1, columns2))
+
+    (index, positions1, positions2) = __pair_rows(table1, table2, rows1, 
+                                                  rows2, keys1, keys2)
+
+    diffs = {}
+    for (column1, column2) in zip(columns1, columns2):
+        diffs['{} [vs] {}'.format(column1, column2)] = (
+                    table1[column1].to_numpy()[positions1] - 
+                    table2[column2].to_numpy()[positions2])
+
+    return pd.DataFrame(diffs, index=index)
+
+
+def align_tables(
+        table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+        table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+        keys1: Union[str, List[str]],
+        keys2: Optional[Union[str, List[str]]] = None
+        ) -> Tuple[Union[pd.DataFrame, gpd.GeoDataFrame], 
+                   Union[pd.DataFrame, gpd.GeoDataFrame], 
+                   pd.Index, pd.Index]:
+    """
+    Given two tables and the key columns to align them on, returns the 
+    rows of each table whose keys are in both tables, in the same order, 
+    and the keys that are only in one of the tables. The tables are joined
+    with a hash lookup of the keys of table2, so tables with millions of 
+    rows in different orders are aligned quickly.
+
+    Parameters
+    ----------
+    table1: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data to align.
+    table2: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data to align.
+    keys1: str | List[str]
+        Key column(s) in table1, e.g. ``'GEOID'``. Keys must be unique.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in table2 matching keys1. If ``None``, uses keys1.
+        Keys must be unique and of the same type as keys1.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame | gpd.GeoDataFrame, pd.DataFrame | gpd.GeoDataFrame,
+          pd.Index, pd.Index]
+        1. Rows of table1 whose keys are in table2, indexed by their keys.
+        2. Rows of table2 matching those of table1, indexed by the keys 
+           of table1.
+        3. Keys of table1 that are not in table2.
+        4. Keys of table2 that are not in table1.
+
+    Raises
+    ------
+    KeyError
+        Raised if unable to find key columns in tables.
+    ValueError
+        Raised if keys cannot be compared or are not unique.
+
+    See Also
+    --------
+    dataqa.diff_column_values
+
+    Examples
+    --------
+    >>> df1 = pd.DataFrame({'GEOID': ['01', '02', '03'], 'pop': [1, 2, 3]})
+    >>> df2 = pd.DataFrame({'geoid': ['04', '03', '01'], 'pop': [4, 3, 1]})
+    >>> (df1, df2, only1, only2) = dataqa.align_tables(df1, df2, 'GEOID', 
+    ...                                                'geoid')
+    >>> print(df1)
+           pop
+    GEOID     
+    01       1
+    03       3
+    >>> print(df2)
+           pop
+    GEOID     
+    01       1
+    03       3
+    >>> print(only1.tolist(), only2.tolist())
+    ['02'] ['04']
+
+    """
+    (index, positions1, positions2, unmatched1, unmatched2) = __join_keys(
+                table1, table2, keys1, keys2)
     
-    if rows1 is None and rows2 is None:
-        return compare_column_values(table1, table2, columns1, columns2, 
-                                     table1.index.tolist(), 
-                                     table2.index.tolist())
+    keys1 = [keys1] if isinstance(keys1, str) else list(keys1)
+    keys2 = keys1 if keys2 is None else keys2
+    keys2 = [keys2] if isinstance(keys2, str) else list(keys2)
+    aligned1 = table1.drop(columns=keys1).take(positions1)
+    aligned2 = table2.drop(columns=keys2).take(positions2)
+    aligned1.index = aligned2.index = index
 
-    elif (rows1 is not None and rows2 is not None and 
-          not __can_compare(rows1, rows2)):
-        raise ValueError('Cannot compare rows {} and {}.'.format(rows1, rows2))
+    return (aligned1, aligned2, unmatched1, unmatched2)
 
-    else:
-        results = {}
-        for i in range(0, len(columns1)):
-            diff = [('{} [vs] {}'.format(rows1[j], rows2[j]), 
-                    (table1.at[rows1[j], columns1[i]] -
-                     table2.at[rows2[j], columns2[i]])) 
-                    for j in range(len(rows1))]
-            results['{} [vs] {}'.format(columns1[i], columns2[i])] = diff
-        
-        return results
 
+def summarize_column_differences(
+        table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+        table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+        columns1: List[str], 
+        columns2: List[str],
+        rows1: Optional[List[Hashable]] = None,
+        rows2: Optional[List[Hashable]] = None,
+        keys1: Optional[Union[str, List[str]]] = None,
+        keys2: Optional[Union[str, List[str]]] = None,
+        atol: float = 0.0,
+        rtol: float = 0.0,
+        top: int = 5
+        ) -> pd.DataFrame:
+    """
+    Given two tables and their corresponding numeric columns and rows to 
+    compare, returns a summary of the differences of their values, with 
+    a row for each pair of compared columns. Two values are equal if 
+    ``|value1 - value2| <= atol + rtol * |value2|``, or if both are missing.
+    All columns are compared at once as numeric arrays.
+
+    *Note:* The comparison is a one-to-one and onto function. I.e. Each element 
+    in one given list must correspond to another element in the other list.
 
-def compare_column_sums(
+    Parameters
+    ----------
+    table1: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare.
+    table2: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare. Relative 
+        differences are relative to the values of table2.
+    columns1: List[str]
+        Numeric columns in table1 to compare.
+    columns2: List[str]
+        Numeric columns in table2 to compare.
+    rows1: List[Hashable], optional, default = ``None``
+        Rows in table1 to compare. AKA value(s) of table's index.
+        If ``None``, function compares all rows, in order.
+    rows2: List[Hashable], optional, default = ``None``
+        Rows in table2 to compare. AKA value(s) of table's index.
+        If ``None``, function compares all rows, in order.
+    keys1: str | List[str], optional, default = ``None``
+        Key column(s) in table1 to align the tables on instead of
+        comparing rows by position. See ``dataqa.align_tables``.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in table2 matching keys1. If ``None``, uses keys1.
+    atol: float, optional, default = ``0.0``
+        Absolute tolerance of differences.
+    rtol: float, optional, default = ``0.0``
+        Relative tolerance of differences.
+    top: int, optional, default = ``5``
+        Maximum number of rows with the largest differences to list for
+        each pair of columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        Summary of differences, indexed by the names of the compared 
+        columns, with columns:
+
+        - ``'compared'``: number of compared rows.
+        - ``'different'``: number of rows whose values are not equal.
+        - ``'max_abs_diff'``: maximum absolute difference.
+        - ``'max_rel_diff'``: maximum relative difference.
+        - ``'top_rows'``: rows with the largest differences, largest first,
+          named as in ``dataqa.diff_column_values``. A value missing from 
+          only one table is the largest possible difference.
+
+    Raises
+    ------
+    KeyError
+        Raised if unable to find column or row in tables.
+    ValueError
+        Raised if given lists cannot be compared, or if a column is not
+        numeric.
+    
+    See Also
+    --------
+    dataqa.diff_column_values
+
+    Examples
+    --------
+    >>> df1 = pd.DataFrame(data=[[1.0, 2], [4.0, 5], [np.nan, 8]],
+    ...                    columns=['COL1', 'COL2'])
+    >>> df2 = pd.DataFrame(data=[[1.1, 2], [5.0, 5], [np.nan, 9]],
+    ...                    columns=['col1', 'col2'])
+    >>> summary = dataqa.summarize_column_differences(
+    ...                 df1, df2, ['COL1', 'COL2'], ['col1', 'col2'], 
+    ...                 atol=0.5)
+    >>> print(summary[['different', 'max_abs_diff']])
+                    different  max_abs_diff
+    COL1 [vs] col1          1           1.0
+    COL2 [vs] col2          1           1.0
+    >>> print(summary.at['COL2 [vs] col2', 'top_rows'])
+    [(2, 2)]
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not __can_compare(columns1, columns2):
+        raise ValueError(
+            'Cannot compare columns {} and {}.'.format(columns1, columns2))
+
+    (index, positions1, positions2) = __pair_rows(table1, table2, rows1, 
+                                                  rows2, keys1, keys2)
+
+    values1 = __numeric_block(table1, columns1, positions1)
+    values2 = __numeric_block(table2, columns2, positions2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        diffs = np.abs(values1 - values2)
+        rel_diffs = diffs / np.abs(values2)
+        equal = ((diffs <= atol + rtol * np.abs(values2)) | 
+                 (values1 == values2) | 
+                 (np.isnan(values1) & np.isnan(values2)))
+
+    # rank differing rows, treating a value missing on one side as largest
+    scores = np.where(equal, -np.inf, np.nan_to_num(diffs, nan=np.inf, 
+                                                     posinf=np.inf))
+    k = min(top, len(index))
+    if 0 < k < len(index):
+        tops = np.argpartition(-scores, k - 1, axis=0)[:k]
+    else:
+        tops = np.broadcast_to(np.arange(len(index))[:, None], scores.shape)
+    tops = np.take_along_axis(
+                tops, np.argsort(-np.take_along_axis(scores, tops, axis=0), 
+                                 axis=0, kind='stable'), axis=0)
+
+    labels = index.tolist()
+    top_rows = [[labels[i] for i in tops[:, j] if not equal[i, j]]
+                for j in range(len(columns1))]
+
+    return pd.DataFrame(
+                {'compared': len(index),
+                 'different': (~equal).sum(axis=0),
+                 'max_abs_diff': np.fmax.reduce(diffs, axis=0, 
+                                                initial=np.nan),
+                 'max_rel_diff': np.fmax.reduce(rel_diffs, axis=0, 
+                                                initial=np.nan),
+                 'top_rows': top_rows},
+                index=['{} [vs] {}'.format(column1, column2) for 
+                       (column1, column2) in zip(columns1, columns2)])
+
+
+def diff_rows(
         table1: Union[pd.DataFrame, gpd.GeoDataFrame],
         table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+        keys1: Union[str, List[str]],
+        keys2: Optional[Union[str, List[str]]] = None,
+        columns1: Optional[List[str]] = None,
+        columns2: Optional[List[str]] = None,
+        delta: Optional[str] = None
+        ) -> Dict[str, pd.Index]:
+    """
+    Given two versions of a table and their key columns, returns the keys of
+    the rows added to, removed from and changed in the second version. 
+    Rows are compared by a 64-bit hash of their values, computed for all
+    rows of each table at once, so that tables of tens of millions of rows
+    are compared without comparing them cell by cell. Geometries are 
+    hashed as WKB.
+
+    Values are hashed by type, except that numeric columns whose types 
+    differ between the versions, e.g. integers and floats, are hashed as 
+    floats. Missing values are equal to each other.
+
+    Parameters
+    ----------
+    table1: pd.DataFrame | gpd.GeoDataFrame
+        Old version of the table.
+    table2: pd.DataFrame | gpd.GeoDataFrame
+        New version of the table.
+    keys1: str | List[str]
+        Key column(s) in table1 identifying its rows. Keys must be unique.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in table2 matching keys1. If ``None``, uses keys1.
+    columns1: List[str], optional, default = ``None``
+        Columns in table1 to compare. If ``None``, compares the non-key 
+        columns that both tables have, in table1's order.
+    columns2: List[str], optional, default = ``None``
+        Columns in table2 matching columns1. If ``None``, uses columns1.
+    delta: str, optional, default = ``None``
+        Name/path of a file to write the changes to, in any format written 
+        by ``extract.ExtractTable.extract_to_file``. The delta holds 
+        table2's added and changed rows, in table2's order, then the keys 
+        of removed rows, each with its ``'change'``.
+
+    Returns
+    -------
+    Dict[str, pd.Index]
+        Keys of the ``'added'`` rows, in table2's order, and of the 
+        ``'removed'`` and ``'changed'`` rows, in table1's order.
+
+    Raises
+    ------
+    KeyError
+        Raised if unable to find a key or column in the tables.
+    ValueError
+        Raised if given lists cannot be compared or if keys are not unique.
+
+    See Also
+    --------
+    dataqa.align_tables
+    dataqa.summarize_column_differences
+
+    Examples
+    --------
+    >>> old = pd.DataFrame({'ID': ['a', 'b', 'c'], 'VOTES': [1, 2, 3]})
+    >>> new = pd.DataFrame({'ID': ['b', 'c', 'd'], 'VOTES': [2, 4, 5]})
+    >>> changes = dataqa.diff_rows(old, new, 'ID')
+    >>> print({change: keys.tolist() for (change, keys) in changes.items()})
+    {'added': ['d'], 'removed': ['a'], 'changed': ['c']}
+
+    >>> changes = dataqa.diff_rows(precincts_2018, precincts_2020, 'GEOID',
+    ...                            delta='precincts_delta.csv')
+    # writes the rows added, removed or changed since 2018
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    keys1 = [keys1] if isinstance(keys1, str) else list(keys1)
+    keys2 = keys1 if keys2 is None else keys2
+    keys2 = [keys2] if isinstance(keys2, str) else list(keys2)
+    if columns1 is None:
+        columns1 = [column for column in table1.columns 
+                    if column in table2.columns and 
+                    column not in keys1 + keys2]
+    columns2 = columns1 if columns2 is None else columns2
+    if len(columns1) != len(columns2) or (
+            len(columns1) and not __can_compare(columns1, columns2)):
+        raise ValueError(
+            'Cannot compare columns {} and {}.'.format(columns1, columns2))
+
+    (matched, positions1, positions2, removed, added) = __join_keys(
+            table1, table2, keys1, keys2)
+
+    (hashes1, hashes2) = __hash_rows(table1, table2, columns1, columns2)
+    changed = hashes1[positions1] != hashes2[positions2]
+    changes = {'added': added, 'removed': removed, 
+               'changed': matched[changed]}
+
+    if delta is not None:
+        index1 = __key_index(table1, keys1)
+        index2 = __key_index(table2, keys2)
+        removed_rows = table1[keys1].iloc[
+                    np.flatnonzero(~index1.isin(index2))]
+        table = pd.concat(
+                [table2.iloc[np.flatnonzero(~index2.isin(index1))].assign(
+                    change='added'),
+                 table2.iloc[np.sort(positions2[changed])].assign(
+                    change='changed'),
+                 pd.DataFrame(removed_rows.to_numpy(), columns=keys2).assign(
+                    change='removed')], 
+                ignore_index=True)
+        et.ExtractTable(table, delta).extract_to_file()
+
+    return changes
+
+
+def compare_column_sums(
+        table1: Union[pd.DataFrame, gpd.GeoDataFrame, str, et.ExtractTable],
+        table2: Union[pd.DataFrame, gpd.GeoDataFrame, str, et.ExtractTable],
         columns1: List[str],
         columns2: List[str]
         ) -> List[Tuple[Hashable, Any]]:
@@ -293,7 +866,8 @@ def compare_column_sums(
     returns a list of tuples containing the compared column names and the 
     difference between their corresponding sums. It is an unchecked runtime 
     error if a column containing non-numerical values is passed into the 
-    function.
+    function. Tables can be given as file paths, which are read in chunks,
+    as by ``dataqa.sum_column_values``.
 
     *Note:* The comparison is a one-to-one and onto function. I.e. each element 
     in one list of column names must correspond to another element in the other 
@@ -301,9 +875,9 @@ def compare_column_sums(
 
     Parameters
     ----------
-    table1: pd.DataFrame | gpd.GeoDataFrame
+    table1: pd.DataFrame | gpd.GeoDataFrame | str | extract.ExtractTable
         Tabular data containing column values to compare.
-    table2: pd.DataFrame | gpd.GeoDataFrame
+    table2: pd.DataFrame | gpd.GeoDataFrame | str | extract.ExtractTable
         Tabular data containing column values to compare.
     columns1: List[str]
         Column(s) in table1 to compare.
@@ -363,15 +937,134 @@ def compare_column_sums(
                                         (tup1[1] - tup2[1])), sums1, sums2))
 
 
-def has_missing_geometries(gdf: gpd.GeoDataFrame,
-                           threshold: Optional[float] = 0.0) -> bool:
+def compare_column_sums_by(
+        table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+        table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+        columns1: List[str],
+        columns2: List[str],
+        by1: Union[str, List[str]],
+        by2: Optional[Union[str, List[str]]] = None,
+        atol: float = 0.0,
+        rtol: float = 0.0
+        ) -> pd.DataFrame:
+    """
+    Given two tables, two lists of column names corresponding to the tables,
+    and the column(s) whose values group the rows of each table, returns the
+    groups whose column sums differ, e.g. the counties whose vote totals
+    disagree, largest difference first. Each table is grouped once, as by
+    ``dataqa.sum_column_values_by``, and the sums are joined on the groups.
+
+    *Note:* The comparison is a one-to-one and onto function. I.e. each element 
+    in one list of column names must correspond to another element in the other 
+    list.
+
+    Parameters
+    ----------
+    table1: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare.
+    table2: pd.DataFrame | gpd.GeoDataFrame
+        Tabular data containing column values to compare.
+    columns1: List[str]
+        Column(s) in table1 to compare.
+    columns2: List[str]
+        Column(s) in table2 to compare.
+    by1 : str | List[str]
+        Column(s) whose values group the rows of table1, e.g. county FIPS.
+    by2 : str | List[str], optional, default = ``None``
+        Column(s) of table2 matching by1. If ``None``, uses by1.
+    atol: float, optional, default = ``0.0``
+        Absolute tolerance of differences.
+    rtol: float, optional, default = ``0.0``
+        Relative tolerance of differences, relative to the sums of table2.
+
+    Returns
+    -------
+    pd.DataFrame
+        Groups whose sums differ by more than ``atol + rtol * |sum2|``, 
+        sorted by the magnitude of their differences, with the grouping 
+        columns of table1, the compared ``'column'``, the ``'sum1'`` of 
+        table1, the ``'sum2'`` of table2 and their difference ``'diff'``.
+        A group missing from one of the tables sums to 0 in it.
+
+    Raises
+    ------
+    KeyError
+        Raised if a given column name does not exist in a given table.
+    TypeError
+        Raised if a column to sum is not numeric.
+    ValueError
+        Raised if given columns cannot be compared.
+    
+    See Also
+    --------
+    dataqa.compare_column_sums
+    dataqa.sum_column_values_by
+
+    Examples
+    --------
+    >>> df1 = pd.DataFrame({'county': ['a', 'b', 'b', 'c'],
+    ...                     'votes':  [10, 20, 5, 7]})
+    >>> df2 = pd.DataFrame({'fips':   ['a', 'b', 'c'],
+    ...                     'VOTES':  [10, 24, 9]})
+    >>> print(dataqa.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'],
+    ...                                     'county', 'fips'))
+      county            column  sum1  sum2  diff
+    0      c  votes [vs] VOTES     7     9    -2
+    1      b  votes [vs] VOTES    25    24     1
+
+    >>> print(dataqa.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'],
+    ...                                     'county', 'fips', atol=1))
+    # ignores differences of 1 vote or less
+      county            column  sum1  sum2  diff
+    0      c  votes [vs] VOTES     7     9    -2
+
+    """
+    import numpy as np
+
+    if not __can_compare(columns1, columns2):
+        raise ValueError(
+            'Cannot compare columns {} and {}.'.format(columns1, columns2))
+
+    by1 = [by1] if isinstance(by1, str) else list(by1)
+    by2 = by1 if by2 is None else by2
+    by2 = [by2] if isinstance(by2, str) else list(by2)
+    if not __can_compare(by1, by2):
+        raise ValueError('Cannot compare groups {} and {}.'.format(by1, by2))
+
+    labels = ['{} [vs] {}'.format(column1, column2) 
+              for (column1, column2) in zip(columns1, columns2)]
+    sums1 = sum_column_values_by(table1, columns1, by1)
+    sums1['column'] = sums1['column'].map(dict(zip(columns1, labels)))
+    sums2 = sum_column_values_by(table2, columns2, by2)
+    sums2['column'] = sums2['column'].map(dict(zip(columns2, labels)))
+    sums2 = sums2.rename(columns=dict(zip(by2, by1)))
+
+    sums = sums1.merge(sums2, how='outer', on=by1 + ['column'], 
+                       suffixes=('1', '2'), sort=False)
+    for (side, dtype) in [('sum1', sums1['sum'].dtype), 
+                          ('sum2', sums2['sum'].dtype)]:
+        sums[side] = sums[side].fillna(0).astype(dtype)
+    sums['diff'] = sums['sum1'] - sums['sum2']
+
+    magnitudes = np.abs(sums['diff'].to_numpy(dtype=float))
+    limits = atol + rtol * np.abs(sums['sum2'].to_numpy(dtype=float))
+    differing = sums[magnitudes > limits].iloc[
+                    np.argsort(-magnitudes[magnitudes > limits], 
+                               kind='stable')]
+    return differing.reset_index(drop=True)
+
+
+def has_missing_geometries(
+        gdf: Union[gpd.GeoDataFrame, str, et.ExtractTable],
+        threshold: Optional[float] = 0.0) -> bool:
     """
     Returns True if the given GeoDataFrame has missing geometries.
 
     Parameters
     ----------
-    gdf : gpd.GeoDataFrame
-        GeoDataFrame whose geometries are to be checked.
+    gdf : gpd.GeoDataFrame | str | extract.ExtractTable
+        GeoDataFrame whose geometries are to be checked, or the name/path 
+        of a file of it, read in chunks by ``extract.iter_chunks``.
     threshold : float, optional, default = ``0.0``
         Percentage of rows that are allowed to have missing geometries.
         e.g. ``threshold = 0.5`` means that the function returns True
@@ -406,19 +1099,21 @@ def has_missing_geometries(gdf: gpd.GeoDataFrame,
     False
 
     """
-    return (list(gdf['geometry'].isna()).count(True) >
-            len(gdf['geometry']) * threshold)
+    profile = geometry_profile(gdf, include=['missing'])
+    return profile['missing'] > profile['rows'] * threshold
 
 
-def has_empty_geometries(gdf: gpd.GeoDataFrame,
-                         threshold: Optional[float] = 0.0) -> bool:
+def has_empty_geometries(
+        gdf: Union[gpd.GeoDataFrame, str, et.ExtractTable],
+        threshold: Optional[float] = 0.0) -> bool:
     """
     Returns True if the given GeoDataFrame has empty geometries.
 
     Parameters
     ----------
-    gdf : gpd.GeoDataFrame
-        GeoDataFrame whose geometries are to be checked.
+    gdf : gpd.GeoDataFrame | str | extract.ExtractTable
+        GeoDataFrame whose geometries are to be checked, or the name/path 
+        of a file of it, read in chunks by ``extract.iter_chunks``.
     threshold : float, optional, default = ``0.0``
         Percentage of rows that are allowed to have empty geometries.
         e.g. ``threshold = 0.5`` means that the function returns True
@@ -454,16 +1149,1250 @@ def has_empty_geometries(gdf: gpd.GeoDataFrame,
     False
 
     """
-    return (list(gdf['geometry'].is_empty).count(True) >
-            len(gdf['geometry']) * threshold)
+    profile = geometry_profile(gdf, include=['empty'])
+    return profile['empty'] > profile['rows'] * threshold
 
 
+def geometry_profile(gdf: Union[gpd.GeoDataFrame, str, et.ExtractTable],
+                     include: Optional[Iterable[str]] = None
+                     ) -> Dict[str, Any]:
+    """
+    Returns a profile of the geometries of the given GeoDataFrame, computed
+    in one pass over its 'geometry' column. Given the path of a file, reads
+    the file in chunks, with bounded memory, and returns the same profile.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame | str | extract.ExtractTable
+        GeoDataFrame whose geometries are to be profiled, or the name/path 
+        of a file of it, read in chunks by ``extract.iter_chunks``.
+    include : Iterable[str], optional, default = ``None``
+        Statistics to compute, out of ``'missing'``, ``'empty'``, 
+        ``'invalid'``, ``'non_simple'``, ``'geom_types'``, 
+        ``'total_bounds'``, and ``'vertices'``. If ``None``, computes all
+        statistics. Statistics that are not included are not computed.
+
+    Returns
+    -------
+    Dict[str, Any]
+        A dictionary containing the number of ``'rows'`` and the included
+        statistics:
+
+        - ``'missing'``: number of missing geometries.
+        - ``'empty'``: number of empty geometries.
+        - ``'invalid'``: number of invalid geometries.
+        - ``'non_simple'``: number of geometries that are not simple.
+        - ``'geom_types'``: number of geometries of each geometry type.
+        - ``'total_bounds'``: ``(minx, miny, maxx, maxy)`` of all 
+          geometries.
+        - ``'vertices'``: ``'min'``, ``'median'``, ``'mean'``, ``'max'``,
+          and ``'total'`` number of vertices of the geometries that are not
+          missing.
+
+    Raises
+    ------
+    KeyError
+        Raised if 'geometry' column is missing.
+    ValueError
+        Raised if asked to compute an unknown statistic.
+
+    See Also
+    --------
+    dataqa.has_missing_geometries
+    dataqa.has_empty_geometries
+
+    Examples
+    --------
+    >>> from shapely.geometry import Point as Pt
+    >>> from shapely.geometry import Polygon as Pg
+    >>> gdf = gpd.GeoDataFrame({'col'       : ['v1', 'v2', 'v3', 'v4'], 
+    ...                         'geometry'  : [None, Pt(1, 2), Pg([]),
+    ...                                        Pg([(0, 0), (1, 1), (1, 0)])]})
+    >>> profile = dataqa.geometry_profile(gdf)
+    >>> print(profile['missing'], profile['empty'], profile['invalid'])
+    1 1 0
+    >>> print(profile['geom_types'])
+    {'GeometryCollection': 1, 'Point': 1, 'Polygon': 1}
+    >>> print(profile['total_bounds'])
+    (0.0, 0.0, 1.0, 2.0)
+    >>> print(profile['vertices']['max'])
+    4
+
+    >>> print(dataqa.geometry_profile(gdf, include=['empty']))
+    # Only count empty geometries
+    {'rows': 4, 'empty': 1}
+
+    >>> profile = dataqa.geometry_profile('precincts.shp')
+
+    """
+    import numpy as np
+
+    include = (__geometry_statistics if include is None 
+               else list(dict.fromkeys(include)))
+    unknown = set(include) - set(__geometry_statistics)
+    if unknown:
+        raise ValueError('Unknown geometry statistics {}.'.format(
+                            sorted(unknown)))
+
+    profile = {'rows': 0, 'missing': 0, 'empty': 0, 'invalid': 0, 
+               'non_simple': 0, 'geom_types': {}, 
+               'total_bounds': (np.nan,) * 4, 
+               'vertices': np.zeros(0, dtype=int)} # histogram of counts
+    profile = {statistic: profile[statistic] 
+               for statistic in ['rows'] + include}
+
+    for chunk in __iter_tables(gdf, ['geometry']):
+        __add_to_profile(profile, chunk['geometry'], include)
+
+    if 'geom_types' in profile:
+        profile['geom_types'] = dict(sorted(profile['geom_types'].items()))
+    if 'vertices' in profile:
+        histogram = profile['vertices']
+        vertices = np.arange(len(histogram))
+        n = int(histogram.sum())
+        if n:
+            middle = np.searchsorted(np.cumsum(histogram), 
+                                     [(n - 1) // 2 + 1, n // 2 + 1])
+            total = int((vertices * histogram).sum())
+            profile['vertices'] = {
+                    'min': int(np.flatnonzero(histogram)[0]), 
+                    'median': float(vertices[middle].mean()), 
+                    'mean': total / n,
+                    'max': len(histogram) - 1, 
+                    'total': total}
+        else:
+            profile['vertices'] = {'min': 0, 'median': 0.0, 'mean': 0.0, 
+                                   'max': 0, 'total': 0}
+
+    return profile
+
+
+def check_validity(gdf: gpd.GeoDataFrame,
+                   workers: Optional[int] = None,
+                   chunksize: Optional[int] = None) -> pd.Series:
+    """
+    Returns the reason each geometry of the given GeoDataFrame is invalid,
+    e.g. ``'Self-intersection[1 1]'``, or ``'Valid Geometry'``. The 
+    geometries are checked in chunks across a pool of processes.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be checked.
+    workers : int, optional, default = ``None``
+        Number of processes to check geometries in. If ``None``, uses the
+        number of CPUs. If 1, checks geometries in this process.
+    chunksize : int, optional, default = ``None``
+        Number of geometries per chunk. If ``None``, splits the geometries
+        evenly across workers, in chunks of at least 10,000 geometries.
+
+    Returns
+    -------
+    pd.Series
+        Reasons, indexed like gdf. Missing geometries have no reason.
+
+    Raises
+    ------
+    KeyError
+        Raised if 'geometry' column is missing.
+
+    See Also
+    --------
+    dataqa.repair_geometries
+    dataqa.geometry_profile
+
+    Examples
+    --------
+    >>> from shapely.geometry import Point as Pt
+    >>> from shapely.geometry import Polygon as Pg
+    >>> bowtie = Pg([(0, 0), (2, 2), (2, 0), (0, 2)])
+    >>> gdf = gpd.GeoDataFrame({'col'       : ['v1', 'v2', 'v3'], 
+    ...                         'geometry'  : [Pt(1, 2), bowtie, None]})
+    >>> print(dataqa.check_validity(gdf).tolist())
+    ['Valid Geometry', 'Self-intersection[1 1]', None]
+
+    >>> reasons = dataqa.check_validity(gdf, workers=8, chunksize=100000)
+    # checks 100,000 geometries at a time in 8 processes
+
+    """
+    return __map_chunks(__validity_reasons, gdf['geometry'], 
+                        workers, chunksize)
+
+
+def repair_geometries(gdf: gpd.GeoDataFrame,
+                      workers: Optional[int] = None,
+                      chunksize: Optional[int] = None) -> gpd.GeoDataFrame:
+    """
+    Returns a copy of the given GeoDataFrame whose invalid geometries are
+    made valid, without losing any of their vertices. The geometries are 
+    repaired in chunks across a pool of processes.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be repaired.
+    workers : int, optional, default = ``None``
+        Number of processes to repair geometries in. If ``None``, uses the
+        number of CPUs. If 1, repairs geometries in this process.
+    chunksize : int, optional, default = ``None``
+        Number of geometries per chunk. If ``None``, splits the geometries
+        evenly across workers, in chunks of at least 10,000 geometries.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Copy of gdf with repaired geometries. Valid and missing geometries
+        are unchanged.
+
+    Raises
+    ------
+    KeyError
+        Raised if 'geometry' column is missing.
+
+    See Also
+    --------
+    dataqa.check_validity
+
+    Examples
+    --------
+    >>> from shapely.geometry import Polygon as Pg
+    >>> bowtie = Pg([(0, 0), (2, 2), (2, 0), (0, 2)])
+    >>> gdf = gpd.GeoDataFrame({'col': ['v1'], 'geometry': [bowtie]})
+    >>> repaired = dataqa.repair_geometries(gdf)
+    >>> print(repaired.geometry[0].geom_type, repaired.geometry[0].area)
+    MultiPolygon 2.0
+
+    """
+    repaired = gdf.copy()
+    repaired['geometry'] = __map_chunks(__make_valid, gdf['geometry'], 
+                                        workers, chunksize)
+    return repaired
+
+
+def find_overlaps(gdf: gpd.GeoDataFrame,
+                  tolerance: Optional[float] = 0.0,
+                  workers: Optional[int] = None,
+                  chunksize: Optional[int] = None) -> pd.DataFrame:
+    """
+    Returns the pairs of geometries of the given GeoDataFrame that overlap
+    by more than the given area. Candidate pairs are found with a spatial 
+    index, and their intersections are computed in chunks across a pool of
+    processes. Invalid geometries (e.g. self-intersecting polygons) are 
+    made valid, as by ``dataqa.repair_geometries``, before they are 
+    intersected, so their overlaps are those of their repaired shapes.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be checked.
+    tolerance : float, optional, default = ``0.0``
+        Largest area, in units of gdf's CRS, of an overlap to ignore. 
+        Geometries that only share edges overlap by an area of 0.
+    workers : int, optional, default = ``None``
+        Number of processes to intersect geometries in. If ``None``, uses 
+        the number of CPUs. If 1, intersects geometries in this process.
+    chunksize : int, optional, default = ``None``
+        Number of candidate pairs per chunk. If ``None``, splits the pairs
+        evenly across workers, in chunks of at least 10,000 pairs.
+
+    Returns
+    -------
+    pd.DataFrame
+        Overlapping pairs, largest overlap first, with columns ``'row1'`` 
+        and ``'row2'`` of their rows in gdf, ``'row1'`` coming first in 
+        gdf, and ``'area'`` of their overlap.
+
+    Raises
+    ------
+    KeyError
+        Raised if 'geometry' column is missing.
+
+    See Also
+    --------
+    dataqa.find_gaps
+
+    Examples
+    --------
+    >>> from shapely.geometry import box
+    >>> gdf = gpd.GeoDataFrame({'col'       : ['v1', 'v2', 'v3'],
+    ...                         'geometry'  : [box(0, 0, 2, 2), 
+    ...                                        box(1, 1, 3, 3), 
+    ...                                        box(2, 0, 3, 1)]})
+    >>> print(dataqa.find_overlaps(gdf))
+       row1  row2  area
+    0     0     1   1.0
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    geoms = __make_valid(gdf['geometry'])
+    (left, right) = __candidate_pairs(geoms)
+    (left, right) = (left[left < right], right[left < right])
+
+    values = np.asarray(geoms, dtype=object)
+    candidates = pd.DataFrame({'left': values[left], 'right': values[right]})
+    areas = __map_chunks(__intersection_areas, candidates, 
+                         workers, chunksize).to_numpy(dtype=float)
+    overlapping = areas > tolerance
+
+    overlaps = pd.DataFrame({'row1': geoms.index[left[overlapping]],
+                             'row2': geoms.index[right[overlapping]],
+                             'area': areas[overlapping]})
+    return overlaps.sort_values('area', ascending=False, kind='stable', 
+                                ignore_index=True)
+
+
+def find_gaps(gdf: gpd.GeoDataFrame,
+              tolerance: Optional[float] = 0.0) -> gpd.GeoDataFrame:
+    """
+    Returns the gaps between the geometries of the given GeoDataFrame, i.e.
+    the holes of their union that are larger than the given area. Gaps 
+    that open onto the outer boundary of the union are not found. Invalid
+    geometries are made valid, as by ``dataqa.repair_geometries``, before
+    their union is taken.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be checked.
+    tolerance : float, optional, default = ``0.0``
+        Largest area, in units of gdf's CRS, of a gap to ignore.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Gaps, largest first, with their ``'area'``, in gdf's CRS.
+
+    Raises
+    ------
+    KeyError
+        Raised if 'geometry' column is missing.
+
+    See Also
+    --------
+    dataqa.find_overlaps
+
+    Examples
+    --------
+    >>> from shapely.geometry import box
+    >>> gdf = gpd.GeoDataFrame({'col'       : ['v1', 'v2', 'v3', 'v4'],
+    ...                         'geometry'  : [box(0, 0, 3, 1), 
+    ...                                        box(0, 2, 3, 3),
+    ...                                        box(0, 1, 1, 2),
+    ...                                        box(2, 1, 3, 2)]})
+    >>> gaps = dataqa.find_gaps(gdf)
+    >>> print(gaps['area'].tolist(), gaps.geometry[0].bounds)
+    [1.0] (1.0, 1.0, 2.0, 2.0)
+
+    """
+    import geopandas as gpd
+    from shapely.geometry import Polygon
+    from shapely.ops import unary_union
+
+    geoms = __make_valid(gdf['geometry'])
+    union = unary_union(geoms[geoms.notna()].tolist())
+    polygons = getattr(union, 'geoms', [union])
+    holes = [Polygon(interior) for polygon in polygons 
+             for interior in getattr(polygon, 'interiors', [])]
+
+    gaps = gpd.GeoDataFrame(geometry=gpd.GeoSeries(holes, crs=gdf.crs))
+    gaps['area'] = gaps.geometry.area
+    gaps = gaps[gaps['area'] > tolerance]
+    return gaps.sort_values('area', ascending=False, kind='stable', 
+                            ignore_index=True)[['area', 'geometry']]
+
+
+def compare_geometries(gdf1: gpd.GeoDataFrame,
+                       gdf2: gpd.GeoDataFrame,
+                       keys1: Union[str, List[str]],
+                       keys2: Optional[Union[str, List[str]]] = None,
+                       tolerance: Optional[float] = 0.0,
+                       area_tolerance: Optional[float] = 0.0,
+                       workers: Optional[int] = None,
+                       chunksize: Optional[int] = None
+                       ) -> pd.DataFrame:
+    """
+    Given two versions of a GeoDataFrame and their key columns, returns the
+    features whose geometries deviate between the versions. The matched 
+    geometries are compared in chunks across a pool of processes.
+
+    A feature deviates if its geometries are not equal within the given
+    tolerance, vertex by vertex, and their Hausdorff distance exceeds the 
+    tolerance or the area of their symmetric difference exceeds the area 
+    tolerance. Invalid geometries are made valid before their symmetric 
+    difference is taken. A geometry missing from only one version deviates.
+    Features whose keys are in only one version are not compared; see 
+    ``dataqa.align_tables``.
+
+    Parameters
+    ----------
+    gdf1 : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be compared.
+    gdf2 : gpd.GeoDataFrame
+        GeoDataFrame whose geometries are to be compared, in gdf1's CRS.
+    keys1: str | List[str]
+        Key column(s) in gdf1 identifying its features. Keys must be unique.
+    keys2: str | List[str], optional, default = ``None``
+        Key column(s) in gdf2 matching keys1. If ``None``, uses keys1.
+    tolerance : float, optional, default = ``0.0``
+        Largest distance, in units of the CRS, by which geometries may 
+        deviate.
+    area_tolerance : float, optional, default = ``0.0``
+        Largest area, in units of the CRS, by which geometries may deviate.
+    workers : int | None, optional, default = ``None``
+        Number of worker processes. Defaults to the number of CPUs.
+    chunksize : int | None, optional, default = ``None``
+        Number of features per chunk. Defaults to an even split across 
+        workers, of at least 10000 features each.
+
+    Returns
+    -------
+    pd.DataFrame
+        The deviating features, indexed by their keys in gdf1's order, with
+        columns ``'hausdorff'`` (the Hausdorff distance of their geometries)
+        and ``'sym_diff_area'`` (the area of their symmetric difference),
+        which are missing if a geometry is missing.
+
+    Raises
+    ------
+    KeyError
+        Raised if a key or the 'geometry' column is missing.
+    ValueError
+        Raised if keys cannot be compared or are not unique.
+
+    See Also
+    --------
+    dataqa.diff_rows
+
+    Examples
+    --------
+    >>> from shapely.geometry import box
+    >>> gdf1 = gpd.GeoDataFrame({'ID'       : ['a', 'b', 'c'],
+    ...                          'geometry' : [box(0, 0, 1, 1), 
+    ...                                        box(1, 0, 2, 1),
+    ...                                        box(2, 0, 3, 1)]})
+    >>> gdf2 = gpd.GeoDataFrame({'ID'       : ['c', 'b', 'a'],
+    ...                          'geometry' : [box(2, 0, 3, 1.5), 
+    ...                                        box(1, 0, 2, 1.001),
+    ...                                        box(0, 0, 1, 1)]})
+    >>> print(dataqa.compare_geometries(gdf1, gdf2, 'ID', tolerance=0.01))
+        hausdorff  sym_diff_area
+    ID                          
+    c         0.5            0.5
+
+    """
+    import functools
+    import numpy as np
+    import pandas as pd
+
+    (matched, positions1, positions2, _, _) = __join_keys(gdf1, gdf2, 
+                                                          keys1, keys2)
+    pairs = pd.DataFrame(
+                {'left': np.asarray(gdf1['geometry'], 
+                                    dtype=object)[positions1],
+                 'right': np.asarray(gdf2['geometry'], 
+                                     dtype=object)[positions2]})
+    deviations = __map_chunks(
+                     functools.partial(__geometry_deviations, tolerance), 
+                     pairs, workers, chunksize)
+    deviations.index = matched
+
+    deviates = (~deviations['equal'].fillna(True) & 
+                ((deviations['hausdorff'] > tolerance) | 
+                 (deviations['sym_diff_area'] > area_tolerance)) |
+                deviations['equal'].isna())
+    return deviations.loc[deviates.to_numpy(), 
+                          ['hausdorff', 'sym_diff_area']]
+
+
+def run_checks(files:     Union[str, List[str]],
+               filetypes: Optional[Union[str, List[str]]] = None,
+               checks:    Optional[List[Union[str, Callable]]] = None,
+               workers:   Optional[int] = None,
+               report:    Optional[str] = None
+               ) -> pd.DataFrame:
+    """
+    Runs a set of QA checks on each of the given files and returns a report
+    with a row per file, in the order of the files. 
+
+    Each file is read once, and the files are checked across a pool of 
+    processes. A file that cannot be read, or a check that fails, does not
+    stop the other files and checks.
+
+    Parameters
+    ----------
+    files : str | List[str]
+        Names/paths of the files to check, or the path of a directory whose
+        files of the given types are checked, as listed by 
+        ``datamine.list_files_of_type``.
+    filetypes : str | List[str] | None, optional, default = ``None``
+        File extension(s) of the files to check in a directory. Defaults to
+        ``['.csv', '.shp', '.zip']``.
+    checks : List[str | Callable] | None, optional, default = ``None``
+        Checks to run on each file's table. Names of built-in checks are 
+        ``'rows'`` and ``'columns'`` (counts), ``'geometries'`` (counts of 
+        missing, empty, invalid and non-simple geometries and of vertices,
+        by ``dataqa.geometry_profile``), ``'duplicates'`` (count of 
+        duplicated rows, ignoring geometries) and ``'overlaps'`` (count of
+        overlapping pairs of geometries, by ``dataqa.find_overlaps``). 
+        Geometry checks are skipped for tables without spatial data, i.e.
+        without a 'geometry' column or with only missing geometries, as 
+        read from e.g. a ``.csv`` file without geometries.
+        A callable is given the table and returns a dict of report fields,
+        or a value reported under the callable's name; it must be picklable
+        to run in a worker process. Defaults to 
+        ``['rows', 'columns', 'geometries']``.
+    workers : int | None, optional, default = ``None``
+        Number of worker processes. Defaults to the number of CPUs.
+    report : str | None, optional, default = ``None``
+        Name/path of a ``.csv``, ``.parquet`` or ``.json`` file to write the
+        report to.
+
+    Returns
+    -------
+    pd.DataFrame
+        A report with each file's ``'file'``, its ``'status'`` (``'ok'`` or
+        ``'failed'``), an ``'error'`` message (or ``None``), the seconds 
+        spent reading it (``'read_seconds'``) and checking it 
+        (``'seconds'``), and the fields reported by the checks.
+
+    Raises
+    ------
+    ValueError
+        Raised if a check is unknown or the report's filetype is not 
+        supported.
+
+    See Also
+    --------
+    extract.run_manifest
+
+    Examples
+    --------
+    >>> report = dataqa.run_checks('AK-shapefiles', ['.shp', '.csv'])
+    # checks every shapefile and CSV under 'AK-shapefiles/'
+    >>> print(report[['file', 'status', 'rows', 'invalid']])
+                                 file  status  rows  invalid
+    0    AK-shapefiles/AK_ballots.csv      ok   441        0
+    1  AK-shapefiles/AK_precincts.shp      ok   441        2
+
+    >>> report = dataqa.run_checks(['a.shp', 'b.shp'], 
+    ...                            checks=['rows', 'overlaps'],
+    ...                            workers=4, report='qa.parquet')
+
+    """
+    import concurrent.futures
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(files, (str, os.PathLike)) and os.path.isdir(files):
+        import gdutils.datamine as dm
+        files = sorted(dm.list_files_of_type(
+                    filetypes or ['.csv', '.shp', '.zip'], files))
+    elif isinstance(files, (str, os.PathLike)):
+        files = [files]
+    files = [os.fspath(file) for file in files]
+
+    checks = list(checks or ['rows', 'columns', 'geometries'])
+    for check in checks:
+        if not callable(check) and check not in __qa_checks:
+            raise ValueError("Unknown check '{}'. Expected one of {} or a "
+                             "callable.".format(check, list(__qa_checks)))
+    if report is not None and os.path.splitext(report)[1].lower() not in \
+                              ('.csv', '.parquet', '.json'):
+        raise ValueError("Unsupported report filetype '{}'. Expected .csv, "
+                         ".parquet or .json.".format(report))
+
+    if workers == 1 or len(files) <= 1:
+        results = [__check_file(file, checks) for file in files]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(__check_file, file, checks) 
+                       for file in files]
+            results = []
+            for (file, future) in zip(files, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e: # e.g. a crashed worker
+                    results.append({'file': file, 'status': 'failed',
+                                    'error': repr(e), 'read_seconds': 0.0,
+                                    'seconds': 0.0})
+
+    fields = ['file', 'status', 'error', 'read_seconds', 'seconds']
+    fields = list(dict.fromkeys(
+                fields + [field for result in results for field in result]))
+    results = pd.DataFrame(results, columns=fields, dtype=object)
+    for field in fields: # counts stay integers where files lack the field
+        values = results[field].dropna()
+        if len(values) and all(isinstance(value, (int, np.integer)) and not 
+                               isinstance(value, (bool, np.bool_)) 
+                               for value in values):
+            results[field] = results[field].astype('Int64')
+    results = results.infer_objects()
+
+    if report is not None:
+        ext = os.path.splitext(report)[1].lower()
+        if ext == '.csv':
+            results.to_csv(report, index=False)
+        elif ext == '.parquet':
+            results.to_parquet(report, index=False)
+        else:
+            results.to_json(report, orient='records', indent=2)
+
+    return results
+
+
+
+#########################################
+#                                       #
+#           Helper Definitions          #
+#                                       #
+#########################################
+
+__geometry_statistics = ['missing', 'empty', 'invalid', 'non_simple', 
+                         'geom_types', 'total_bounds', 'vertices']
+__min_chunksize = 10000 # geometries per chunk sent to a process
+__float_scale = 1127 # finite floats are integer multiples of 2 ** -1127
+
+def __check_file(file: str, 
+                 checks: List[Union[str, Callable]]) -> Dict[str, Any]:
+    """
+    Returns the report of running the given checks on the given file.
+
+    """
+    import time
+
+    result = {'file': file, 'status': 'ok', 'error': None, 
+              'read_seconds': 0.0, 'seconds': 0.0}
+    start = time.perf_counter()
+    try:
+        table = et.read_file(file).extract()
+    except Exception as e:
+        result.update(status='failed', error=repr(e), 
+                      read_seconds=time.perf_counter() - start)
+        return result
+
+    result['read_seconds'] = time.perf_counter() - start
+    errors = []
+    start = time.perf_counter()
+    for check in checks:
+        name = getattr(check, '__name__', repr(check)) if callable(check) \
+               else check
+        try:
+            fields = (check if callable(check) else __qa_checks[check])(table)
+            result.update(fields if isinstance(fields, dict) else 
+                          {name: fields})
+        except Exception as e:
+            errors.append('{}: {!r}'.format(name, e))
+
+    result['seconds'] = time.perf_counter() - start
+    if errors:
+        result.update(status='failed', error='; '.join(errors))
+    return result
+
+
+def __check_rows(table: Union[pd.DataFrame, gpd.GeoDataFrame]
+                 ) -> Dict[str, Any]:
+    """Returns the number of rows of the given table."""
+    return {'rows': len(table)}
+
+
+def __check_columns(table: Union[pd.DataFrame, gpd.GeoDataFrame]
+                    ) -> Dict[str, Any]:
+    """Returns the number of columns of the given table."""
+    return {'columns': len(table.columns)}
+
+
+def __check_geometries(table: Union[pd.DataFrame, gpd.GeoDataFrame]
+                       ) -> Dict[str, Any]:
+    """Returns the counts of bad geometries and vertices of the table."""
+    if not __has_geometries(table):
+        return {}
+
+    profile = geometry_profile(table, include=['missing', 'empty', 
+                                               'invalid', 'non_simple', 
+                                               'vertices'])
+    return {'missing': profile['missing'], 'empty': profile['empty'],
+            'invalid': profile['invalid'], 
+            'non_simple': profile['non_simple'],
+            'vertices': profile['vertices']['total']}
+
+
+def __check_duplicates(table: Union[pd.DataFrame, gpd.GeoDataFrame]
+                       ) -> Dict[str, Any]:
+    """Returns the number of duplicated rows, ignoring geometries."""
+    import pandas as pd
+
+    attributes = pd.DataFrame(table.drop(columns='geometry', errors='ignore'))
+    return {'duplicate_rows': int(attributes.duplicated().sum())}
+
+
+def __check_overlaps(table: Union[pd.DataFrame, gpd.GeoDataFrame]
+                     ) -> Dict[str, Any]:
+    """Returns the number of overlapping pairs of geometries."""
+    if not __has_geometries(table):
+        return {}
+    return {'overlaps': len(find_overlaps(table))}
+
+
+def __has_geometries(table: Union[pd.DataFrame, gpd.GeoDataFrame]) -> bool:
+    """
+    Returns whether the given table has spatial data, i.e. a 'geometry' 
+    column that isn't only missing values, as read from e.g. a .csv file.
+
+    """
+    return 'geometry' in table and not table['geometry'].isna().all()
+
+
+__qa_checks = {'rows':          __check_rows,
+               'columns':       __check_columns,
+               'geometries':    __check_geometries,
+               'duplicates':    __check_duplicates,
+               'overlaps':      __check_overlaps}
+
+
+def __iter_tables(table: Union[pd.DataFrame, gpd.GeoDataFrame, str, 
+                                 et.ExtractTable],
+                  columns: Optional[List[str]] = None
+                  ) -> Iterable[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    """
+    Returns the given table in chunks: a file is read in chunks of its 
+    given columns, and any other table is returned whole.
+
+    """
+    if isinstance(table, (str, os.PathLike)):
+        return et.iter_chunks(os.fspath(table), columns=columns)
+    elif isinstance(table, et.ExtractTable):
+        return [table.extract()]
+    else:
+        return [table]
+
+
+def __add_to_sum(partial: Tuple[Any, Optional[int], float], 
+                 values: pd.Series) -> Tuple[Any, Optional[int], float]:
+    """
+    Adds the given values to a partial sum, held as the sum of the values 
+    that are not floats, the exact sum of the finite floats as an integer
+    multiple of 2 ** -1127 (None if there are no floats), and the sum of 
+    the infinite floats.
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    (total, floats, infinite) = partial
+    if pd.api.types.is_float_dtype(values):
+        array = values.to_numpy(dtype=float, na_value=np.nan)
+        array = array[~np.isnan(array)]
+        finite = np.isfinite(array)
+        if not finite.all():
+            with np.errstate(invalid='ignore'): # inf - inf is nan
+                infinite += float(array[~finite].sum())
+        return (total, (floats or 0) + __exact_sum(array[finite]), infinite)
+
+    if pd.api.types.is_integer_dtype(values) or \
+       pd.api.types.is_bool_dtype(values):
+        values = (values.to_numpy(values.dtype.numpy_dtype, na_value=0) 
+                  if pd.api.types.is_extension_array_dtype(values) else 
+                  values.to_numpy())
+        subtotal = int(__sum_groups(values, np.array([0]), 
+                                    np.array([len(values)]))[0])
+    else:
+        subtotal = values.sum()
+    return (subtotal if total is None else total + subtotal, floats, 
+            infinite)
+
+
+def __finish_sum(partial: Tuple[Any, Optional[int], float]) -> Any:
+    """
+    Returns the sum of a partial sum. Floats are correctly rounded.
+
+    """
+    import math
+    import numbers
+
+    (total, floats, infinite) = partial
+    if floats is None:
+        return 0 if total is None else total
+    elif isinstance(total, numbers.Integral):
+        floats += int(total) << __float_scale
+    
+    try:
+        result = floats / (1 << __float_scale) # correctly rounded
+    except OverflowError:
+        result = math.inf if floats > 0 else -math.inf
+    result += infinite
+
+    if total is None or isinstance(total, numbers.Integral):
+        return result
+    return total + result
+
+
+def __exact_sum(values: np.ndarray) -> int:
+    """
+    Returns the exact sum of the given finite floats, as an integer 
+    multiple of 2 ** -1127. Floats are split into their exponents and 
+    integer mantissas, whose halves are summed per exponent by numpy.
+
+    """
+    import numpy as np
+
+    if not len(values):
+        return 0
+    elif np.all(values == np.trunc(values)) and \
+         float(np.abs(values).max()) * len(values) < 2 ** 53: # sums exactly
+        return int(values.sum()) << __float_scale
+
+    (mantissas, exponents) = np.frexp(values)
+    mantissas = (mantissas * 2.0 ** 53).astype(np.int64)
+    lowest = int(exponents.min())
+    exponents -= lowest
+    (high, low) = (mantissas >> 26, mantissas & ((1 << 26) - 1))
+
+    total = 0
+    block = 1 << 26 # sums of fewer halves are exact in float64
+    for start in range(0, len(values), block):
+        highs = np.bincount(exponents[start:start + block], 
+                            weights=high[start:start + block])
+        lows = np.bincount(exponents[start:start + block], 
+                           weights=low[start:start + block])
+        for (shift, (h, l)) in enumerate(zip(highs.tolist(), 
+                                             lows.tolist())):
+            if h or l:
+                total += ((int(h) << 26) + int(l)) << shift
+
+    return total << (lowest - 53 + __float_scale)
+
+
+def __add_to_profile(profile: Dict[str, Any], 
+                     geoms: gpd.GeoSeries, 
+                     include: List[str]) -> NoReturn:
+    """
+    Adds the statistics of the given geometries to the given profile.
+
+    """
+    import numpy as np
+
+    geoms = geoms.reset_index(drop=True)
+    missing = geoms.isna()
+    present = geoms[~missing]
+    profile['rows'] += len(geoms)
+
+    for statistic in include:
+        if statistic == 'missing':
+            profile[statistic] += int(missing.sum())
+        elif statistic == 'empty':
+            profile[statistic] += int(present.is_empty.sum())
+        elif statistic == 'invalid':
+            profile[statistic] += int((~present.is_valid).sum())
+        elif statistic == 'non_simple':
+            profile[statistic] += int((~present.is_simple).sum())
+        elif statistic == 'geom_types':
+            counts = profile[statistic]
+            for (geom_type, count) in present.geom_type.value_counts().items():
+                counts[geom_type] = counts.get(geom_type, 0) + int(count)
+        elif statistic == 'total_bounds':
+            (old, new) = (profile[statistic], present.total_bounds)
+            profile[statistic] = (
+                    float(np.fmin(old[0], new[0])), 
+                    float(np.fmin(old[1], new[1])),
+                    float(np.fmax(old[2], new[2])), 
+                    float(np.fmax(old[3], new[3])))
+        elif statistic == 'vertices':
+            counts = np.bincount(
+                        __count_vertices(present.reset_index(drop=True)))
+            histogram = profile[statistic]
+            size = max(len(histogram), len(counts))
+            profile[statistic] = (
+                    np.pad(histogram, (0, size - len(histogram))) + 
+                    np.pad(counts, (0, size - len(counts))))
+
+
+def __map_chunks(func: Callable[[Union[pd.Series, pd.DataFrame]], 
+                                 Union[pd.Series, pd.DataFrame]],
+                 data: Union[pd.Series, pd.DataFrame],
+                 workers: Optional[int],
+                 chunksize: Optional[int]) -> Union[pd.Series, pd.DataFrame]:
+    """
+    Applies the given function to chunks of the rows of the given data
+    across a pool of processes, and returns the concatenated results.
+
+    """
+    import concurrent.futures
+    import pandas as pd
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(-(-len(data) // workers), __min_chunksize)
+    chunks = [data.iloc[i:i + chunksize] 
+              for i in range(0, len(data), chunksize)]
+
+    if workers == 1 or len(chunks) <= 1:
+        results = list(map(func, chunks))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(func, chunks))
+
+    return pd.concat(results) if results else func(data)
+
+
+def __validity_reasons(geoms: gpd.GeoSeries) -> pd.Series:
+    """
+    Returns the reason each of the given geometries is invalid, or 
+    'Valid Geometry'. Before shapely 2.0, only invalid geometries are 
+    explained, one by one.
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    try:
+        from shapely import is_valid_reason
+        return pd.Series(is_valid_reason(np.asarray(geoms)), 
+                         index=geoms.index, dtype=object)
+    except ImportError: # shapely < 2.0
+        from shapely.validation import explain_validity
+
+    missing = geoms.isna()
+    valid = geoms.is_valid
+    reasons = pd.Series('Valid Geometry', index=geoms.index, dtype=object)
+    reasons[missing] = None
+    invalid = ~valid & ~missing
+    reasons[invalid] = [explain_validity(geom) for geom in geoms[invalid]]
+    return reasons
+
+
+def __make_valid(geoms: gpd.GeoSeries) -> gpd.GeoSeries:
+    """
+    Returns the given geometries, with invalid geometries made valid.
+
+    """
+    invalid = ~geoms.is_valid & ~geoms.isna()
+    if not invalid.any():
+        return geoms
+
+    repaired = geoms.copy()
+    repaired[invalid] = geoms[invalid].make_valid()
+    return repaired
+
+
+def __candidate_pairs(geoms: gpd.GeoSeries) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the positions of the pairs of given geometries whose bounding 
+    boxes intersect, including each geometry paired with itself.
+
+    """
+    import numpy as np
+
+    try:
+        (left, right) = geoms.sindex.query_bulk(geoms, predicate='intersects')
+    except ImportError: # neither rtree nor pygeos: shapely 1.8's STRtree
+        import warnings
+        from shapely.strtree import STRtree
+
+        positions = np.flatnonzero(~geoms.isna().to_numpy() & 
+                                   ~geoms.is_empty.to_numpy())
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore') # items are removed in shapely 2
+            tree = STRtree(geoms.iloc[positions].tolist(), positions.tolist())
+            pairs = [(i, j) for i in positions 
+                     for j in tree.query_items(geoms.iat[i])]
+        (left, right) = (np.array(pairs, dtype=int).reshape(-1, 2).T 
+                         if pairs else (np.array([], dtype=int),) * 2)
+
+    return (np.asarray(left, dtype=int), np.asarray(right, dtype=int))
+
+
+def __intersection_areas(pairs: pd.DataFrame) -> pd.Series:
+    """
+    Returns the areas of the intersections of the given pairs of 
+    geometries.
+
+    """
+    import geopandas as gpd
+
+    left = gpd.GeoSeries(pairs['left'].to_numpy(), index=pairs.index)
+    right = gpd.GeoSeries(pairs['right'].to_numpy(), index=pairs.index)
+    return left.intersection(right).area
+
+
+def __geometry_deviations(tolerance: float, 
+                          pairs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns whether the given pairs of geometries are equal within the 
+    tolerance, their Hausdorff distances and the areas of their symmetric
+    differences. Pairs with one missing geometry are neither equal nor 
+    unequal, and pairs with two are equal. Symmetric differences are taken
+    of the geometries made valid. Before shapely 2.0, Hausdorff distances 
+    are computed one by one.
+
+    """
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+
+    left = gpd.GeoSeries(pairs['left'].to_numpy(), index=pairs.index)
+    right = gpd.GeoSeries(pairs['right'].to_numpy(), index=pairs.index)
+
+    (missing1, missing2) = (left.isna().to_numpy(), right.isna().to_numpy())
+    present = ~missing1 & ~missing2
+    (left, right) = (left[present], right[present])
+
+    equal = pd.array(np.where(missing1 & missing2, True, None), 
+                     dtype='boolean')
+    equal[present] = left.geom_equals_exact(right, tolerance).to_numpy()
+    hausdorff = np.full(len(pairs), np.nan)
+    try:
+        from shapely import hausdorff_distance
+        hausdorff[present] = hausdorff_distance(np.asarray(left), 
+                                                np.asarray(right))
+    except ImportError: # shapely < 2.0
+        hausdorff[present] = [geom1.hausdorff_distance(geom2) 
+                              for (geom1, geom2) in zip(left, right)]
+    sym_diff_area = np.full(len(pairs), np.nan)
+    sym_diff_area[present] = __make_valid(left).symmetric_difference(
+                                 __make_valid(right)).area
+
+    return pd.DataFrame({'equal': equal, 'hausdorff': hausdorff, 
+                         'sym_diff_area': sym_diff_area}, index=pairs.index)
+
+
+def __count_vertices(geoms: gpd.GeoSeries) -> np.ndarray:
+    """
+    Returns the number of vertices of each of the given geometries.
+
+    """
+    import numpy as np
+
+    try:
+        coordinates = geoms.get_coordinates()
+    except NotImplementedError: # shapely < 2.0 without pygeos
+        return np.array([__count_geometry_vertices(geom) for geom in geoms],
+                        dtype=int)
+    return np.bincount(coordinates.index.to_numpy(dtype=int), 
+                       minlength=len(geoms))
+
+
+def __count_geometry_vertices(geom: Any) -> int:
+    """
+    Returns the number of vertices of the given shapely geometry.
+
+    """
+    if hasattr(geom, 'geoms'):
+        return sum(__count_geometry_vertices(part) for part in geom.geoms)
+    if hasattr(geom, 'exterior'):
+        return (len(geom.exterior.coords) if not geom.is_empty else 0) + sum(
+                    len(interior.coords) for interior in geom.interiors)
+    return len(geom.coords)
+
+
+def __sum_groups(values: np.ndarray, 
+                 starts: np.ndarray, 
+                 sizes: np.ndarray) -> np.ndarray:
+    """
+    Returns the sums of the given values sorted by group, given the start
+    and size of each group. Integers are summed in 64 bits unless they 
+    could overflow, and otherwise summed exactly, as are floats.
+
+    """
+    import math
+    import numpy as np
+
+    if values.dtype == bool:
+        values = values.astype(np.int64)
+
+    if np.issubdtype(values.dtype, np.integer):
+        bound = (max(-int(values.min()), int(values.max())) * int(sizes.max())
+                 if len(values) else 0)
+        if bound <= np.iinfo(np.int64).max:
+            sums = np.zeros(len(sizes), dtype=np.int64)
+            present = sizes > 0
+            sums[present] = np.add.reduceat(values.astype(np.int64), 
+                                            starts[present])
+            return sums
+        values = values.tolist() # exact Python integers
+        return np.array([sum(values[start:start + size]) 
+                         for (start, size) in zip(starts, sizes)], 
+                        dtype=object)
+
+    values = values.astype(float)
+    values = np.where(np.isnan(values), 0.0, values).tolist()
+    sums = np.empty(len(sizes))
+    for (i, (start, size)) in enumerate(zip(starts, sizes)):
+        try:
+            sums[i] = math.fsum(values[start:start + size])
+        except ValueError: # inf - inf
+            sums[i] = np.nan
+    return sums
+
+
+def __pair_rows(table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+                table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+                rows1: Optional[List[Hashable]],
+                rows2: Optional[List[Hashable]],
+                keys1: Optional[Union[str, List[str]]] = None,
+                keys2: Optional[Union[str, List[str]]] = None
+                ) -> Tuple[pd.Index, np.ndarray, np.ndarray]:
+    """
+    Returns an index of the given pairs of rows to compare and the 
+    positions of the rows in each table. If keys are given, pairs the rows
+    with matching keys, and if neither rows nor keys are given, pairs all
+    rows in order.
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    if keys1 is not None or keys2 is not None:
+        if rows1 is not None or rows2 is not None:
+            raise ValueError('Cannot compare both rows and keys.')
+        (index, positions1, positions2, _, _) = __join_keys(
+                    table1, table2, keys1, keys2)
+        return (index, positions1, positions2)
+
+    if rows1 is None and rows2 is None:
+        if len(table1) != len(table2):
+            raise ValueError('Cannot compare tables of {} and {} rows.'.format(
+                                len(table1), len(table2)))
+        (rows1, rows2) = (table1.index, table2.index)
+        positions1 = positions2 = np.arange(len(table1))
+
+    elif (rows1 is not None and rows2 is not None and 
+          __can_compare(rows1, rows2)):
+        positions1 = __find_rows(table1.index, rows1)
+        positions2 = __find_rows(table2.index, rows2)
+
+    else:
+        raise ValueError('Cannot compare rows {} and {}.'.format(rows1, rows2))
+
+    index = pd.MultiIndex.from_arrays(
+                [pd.Index(rows1, tupleize_cols=False), 
+                 pd.Index(rows2, tupleize_cols=False)], names=['row1', 'row2'])
+    return (index, positions1, positions2)
+
+
+def __numeric_block(table: Union[pd.DataFrame, gpd.GeoDataFrame],
+                    columns: List[str], positions: np.ndarray) -> np.ndarray:
+    """
+    Returns the values of the given rows and columns of the table as a 
+    2-dimensional float array, with missing values as NaN.
+
+    """
+    import numpy as np
+
+    block = np.empty((len(positions), len(columns)))
+    for (j, column) in enumerate(columns):
+        try:
+            block[:, j] = table[column].to_numpy(
+                                dtype=float, na_value=np.nan)[positions]
+        except (TypeError, ValueError):
+            raise ValueError('Column {} is not numeric.'.format(column))
+    return block
+
+
+def __join_keys(table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+                table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+                keys1: Union[str, List[str]],
+                keys2: Optional[Union[str, List[str]]]
+                ) -> Tuple[pd.Index, np.ndarray, np.ndarray, 
+                           pd.Index, pd.Index]:
+    """
+    Hash joins the given tables on their keys and returns the matched keys,
+    the positions of the matched rows in each table, and the unmatched keys
+    of each table.
+
+    """
+    import numpy as np
+
+    keys1 = [keys1] if isinstance(keys1, str) else keys1
+    keys2 = keys1 if keys2 is None else keys2
+    keys2 = [keys2] if isinstance(keys2, str) else keys2
+    if not __can_compare(keys1, keys2):
+        raise ValueError('Cannot compare keys {} and {}.'.format(keys1, keys2))
+
+    index1 = __key_index(table1, keys1)
+    index2 = __key_index(table2, keys2)
+    for (index, keys) in [(index1, keys1), (index2, keys2)]:
+        if not index.is_unique:
+            raise ValueError('Keys {} are not unique, e.g. {}.'.format(
+                                keys, index[index.duplicated()][0]))
+
+    positions = index2.get_indexer(index1)
+    matched = positions >= 0
+    unmatched2 = np.ones(len(index2), dtype=bool)
+    unmatched2[positions[matched]] = False
+
+    return (index1[matched], np.flatnonzero(matched), positions[matched],
+            index1[~matched], index2[unmatched2])
+
+
+def __hash_rows(table1: Union[pd.DataFrame, gpd.GeoDataFrame],
+                table2: Union[pd.DataFrame, gpd.GeoDataFrame],
+                columns1: List[str],
+                columns2: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a 64-bit hash of the given columns of each row of each table.
+    Geometries are hashed as WKB, and numeric columns whose types differ
+    between the tables are hashed as floats.
+
+    """
+    import numpy as np
+    import pandas as pd
+
+    frames = ({}, {})
+    for (i, (column1, column2)) in enumerate(zip(columns1, columns2)):
+        (values1, values2) = (table1[column1], table2[column2])
+        if values1.dtype != values2.dtype and \
+           pd.api.types.is_numeric_dtype(values1) and \
+           pd.api.types.is_numeric_dtype(values2):
+            (values1, values2) = (values1.astype(float), 
+                                  values2.astype(float))
+
+        for (frame, values) in zip(frames, (values1, values2)):
+            if hasattr(values, 'to_wkb'): # a GeoSeries
+                values = pd.Series(values.to_wkb(), dtype=object)
+            frame[i] = values.reset_index(drop=True)
+
+    return tuple(pd.util.hash_pandas_object(pd.DataFrame(frame), 
+                                            index=False).to_numpy()
+                 if frame else np.zeros(len(table), dtype=np.uint64)
+                 for (frame, table) in zip(frames, (table1, table2)))
+
+
+def __key_index(table: Union[pd.DataFrame, gpd.GeoDataFrame],
+                keys: List[str]) -> pd.Index:
+    """
+    Returns the given key columns of the table as an index.
+
+    """
+    import pandas as pd
+
+    if len(keys) == 1:
+        return pd.Index(table[keys[0]], name=keys[0])
+    return pd.MultiIndex.from_frame(table[list(keys)])
+
+
+def __find_rows(index: pd.Index, rows: List[Hashable]) -> np.ndarray:
+    """
+    Returns the positions of the given rows in the given index, using the
+    first of duplicate rows.
+
+    """
+    import numpy as np
+
+    if index.is_unique:
+        positions = index.get_indexer(rows)
+    else:
+        first = ~index.duplicated()
+        positions = index[first].get_indexer(rows)
+        positions = np.where(positions < 0, -1, 
+                             np.flatnonzero(first)[positions])
+
+    if (positions < 0).any():
+        raise KeyError('Unable to find rows {}'.format(
+                        [row for (row, i) in zip(rows, positions) if i < 0]))
+    return positions
 
-#########################################
-#                                       #
-#           Helper Definitions          #
-#                                       #
-#########################################
 
 def __can_compare(xs: Union[Set[Hashable], List[Hashable]], 
                   ys: Union[Set[Hashable], List[Hashable]]) -> bool:
@@ -475,3 +2404,130 @@ def __can_compare(xs: Union[Set[Hashable], List[Hashable]],
         (xs is not None and ys is not None and isinstance(xs, type(ys)))
         and
         (not isinstance(xs, Hashable) and len(xs) > 0 and len(xs) == len(ys)))
+
+
+
+#########################################
+#                                       #
+#       Command-Line Parsing            #
+#                                       #
+#########################################
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parses command-line arguments and returns a Namespace of input values.
+
+    Parameters
+    ----------
+    argv : List[str] | None, optional, default = ``None``
+        Arguments to parse. Defaults to ``sys.argv[1:]``.
+
+    Returns
+    -------
+    An argparse Namespace object
+
+    """
+    files_help = ("names/paths of files to check, or of directories whose "
+                  "files of TYPE are checked")
+    types_help = "extension(s) of files to check in directories "\
+                 "(default: .csv .shp .zip)"
+    checks_help = ("checks to run on each file, of {} (default: rows "
+                   "columns geometries)".format(', '.join(__qa_checks)))
+    workers_help = "number of processes that check files"
+    report_help = ("name/path of .csv, .parquet or .json file to write the "
+                   "report to")
+
+    description = """Script to run QA checks on a batch of files. 
+
+Reads each file once, runs the checks on it in a pool of processes, and 
+reports a row per file with its status, errors, timings and check results.
+If no report is specified, outputs the report in plaintext to stdout.
+"""
+
+    examples = """examples:
+    python -m gdutils.dataqa AK-shapefiles/
+    python -m gdutils.dataqa repos/ -t .shp .csv -o qa.csv --workers 8
+    python -m gdutils.dataqa a.shp b.shp -c rows overlaps -o qa.json"""
+
+    parser = argparse.ArgumentParser(
+                description=description,
+                epilog=examples,
+                formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+                'files',
+                metavar='FILE',
+                nargs='+',
+                help=files_help)
+    parser.add_argument(
+                '-t',
+                '--types',
+                dest='filetypes',
+                metavar='TYPE',
+                type=str,
+                nargs='+',
+                help=types_help)
+    parser.add_argument(
+                '-c',
+                '--checks',
+                dest='checks',
+                metavar='CHECK',
+                choices=list(__qa_checks),
+                nargs='+',
+                help=checks_help)
+    parser.add_argument(
+                '--workers',
+                dest='workers',
+                metavar='N',
+                type=int,
+                help=workers_help)
+    parser.add_argument(
+                '-o',
+                '--output',
+                dest='report',
+                metavar='REPORT',
+                type=str,
+                help=report_help)
+
+    return parser.parse_args(argv)
+
+
+
+#########################################
+#                                       #
+#               Main                    #
+#                                       #
+#########################################
+
+def main() -> NoReturn:
+    """Validates input, parses command-line arguments, runs script."""
+    args = parse_arguments()
+
+    try:
+        files = []
+        for path in args.files:
+            if os.path.isdir(path):
+                import gdutils.datamine as dm
+                files += sorted(dm.list_files_of_type(
+                            args.filetypes or ['.csv', '.shp', '.zip'], path))
+            else:
+                files.append(path)
+
+        report = run_checks(files, checks=args.checks, workers=args.workers,
+                            report=args.report)
+        if args.report is None:
+            print(report.to_string(index=False))
+    except Exception as e:
+        print(e)
+
+    sys.exit()
+
+
+
+#########################################
+#                                       #
+#           Function Calls              #
+#                                       #
+#########################################
+
+if __name__ == "__main__":
+    main()
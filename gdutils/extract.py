@@ -28,6 +28,13 @@ Metadata
                 - ``numpy``
                 - ``pandas``
 
+                Dependencies are imported lazily, so importing the module
+                and running ``extract.py -h`` are fast. Reading any table,
+                including an attribute-only ``.csv``, still imports
+                ``geopandas``, since tables are held as GeoDataFrames, 
+                except for ``.csv`` files without geometries read and 
+                written with the ``'polars'`` backend.
+
 Documentation
 -------------
 Documentation for the ``extract`` module can be found as docstrings. 
@@ -48,20 +55,34 @@ To get help on using the ``extract.py`` script, run ``extract.py -h``.
     $ python extract.py -h
 
 """
+from __future__ import annotations
+
 import argparse
-import geopandas as gpd
-import numpy as np
 import os.path
-import pandas as pd
 import pathlib
-import shapely.wkt
 import sys
+import threading
+import time
 import zipfile
 
-from typing import List, NoReturn, Optional, Tuple, Union
+from typing import (IO, TYPE_CHECKING, Any, Dict, Iterator, List, 
+                    NoReturn, Optional, Tuple, Union)
 import warnings; warnings.filterwarnings(
     'ignore', 'GeoSeries.isna', UserWarning)
 
+if TYPE_CHECKING: # heavy dependencies are imported lazily where needed
+    import concurrent.futures
+    import duckdb
+    import polars as pl
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
 
 
 #########################################
@@ -89,9 +110,26 @@ class ExtractTable:
         Label of column to use as index for extracted table.
     value : str | List[str], optional, default = ``None``
         Value(s) of specified column in rows to extract.
+    stats : Dict[str, Dict[str, Any]]
+        Per-stage instrumentation of reads, filters, reindexes and writes.
+    max_memory : int, optional, default = ``None``
+        Memory budget, in bytes, for reading input files.
+    backend : str, default = ``'pandas'``
+        Library holding the table: ``'pandas'``, ``'dask'``, ``'duckdb'``
+        or ``'polars'``.
+    repair : bool, default = ``False``
+        Whether invalid geometries are repaired when read.
     
     """
 
+    __sample_rows = 1000 # rows sampled to estimate a table's memory usage
+    __backends = ('pandas', 'dask', 'duckdb', 'polars')
+    __na_values = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', 
+                   '-NaN', '-nan', '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 
+                   'NULL', 'NaN', 'n/a', 'nan', 'null'] # read as NaN by pandas
+    __zip_locks = {} # per-zipfile locks, as zipfiles unzip in place
+    __zip_locks_guard = threading.Lock()
+
     #===========================================+
     # Constructors                              |
     #===========================================+
@@ -102,7 +140,10 @@ class ExtractTable:
                                            pd.DataFrame]] = None, 
                  outfile:   Optional[str] = None, 
                  column:    Optional[str] = None, 
-                 value:     Optional[Union[str, List[str]]] = None):
+                 value:     Optional[Union[str, List[str]]] = None,
+                 max_memory: Optional[int] = None,
+                 backend:   Optional[str] = 'pandas',
+                 repair:    Optional[bool] = False):
         """
         ExtractTable initializer. Returns an ExtractTable instance.
 
@@ -118,12 +159,59 @@ class ExtractTable:
             Label of column to use as index for extracted table
         value : str | List[str] | None, optional, default = ``None``
             Value(s) of specified column in rows to extract.
+        max_memory : int | None, optional, default = ``None``
+            Memory budget, in bytes, for reading input files. A file's
+            in-memory size is estimated from its size and a sample of its
+            first rows. If the estimate exceeds the budget, a ``.csv`` file
+            with a given column and value is read in chunks, keeping only
+            the rows to extract, with the dtypes of a whole read; any other
+            file raises a MemoryError. Setting another value reads the file
+            again, and extracting without a value raises a MemoryError. If
+            ``None``, files are read without an estimate.
+        backend : str, optional, default = ``'pandas'``
+            Library holding the table. ``'pandas'`` reads the whole table
+            into memory. ``'dask'`` reads it lazily in partitions, using the
+            optional ``dask`` and ``dask-geopandas`` packages, so tables 
+            larger than memory can be filtered, reindexed and written 
+            partition by partition across all local cores; max_memory is 
+            then ignored. Reindexing sets the index within each partition,
+            keeping the table's row order as ``'pandas'`` does. 
+            ``'duckdb'`` scans ``.csv`` and ``.parquet`` files with the 
+            optional ``duckdb`` package, across all local cores, and 
+            materializes only the rows with the given column and value; 
+            other files are read as with ``'pandas'``. Values match as they
+            would with ``'pandas'``, e.g. a string never matches a numeric
+            column, and columns get the same names, types and values, as
+            ``.csv`` files are scanned as text and typed by pandas' rules.
+            ``'polars'`` reads, filters and reindexes ``.csv`` files 
+            without geometries with the optional, multithreaded ``polars``
+            package, with the same semantics as ``'duckdb'``, except that 
+            floats are parsed exactly, so may differ in their last digit 
+            from those pandas' default parser rounds; other files are read
+            as with ``'pandas'``. The table is only converted to a pandas 
+            DataFrame when extracted or written, so that values are written
+            as ``'pandas'`` writes them (e.g. ``True`` and ``1e-07``).
+        repair : bool, optional, default = ``False``
+            If True, invalid geometries are made valid as the table is read,
+            in parallel. See ``dataqa.repair_geometries``.
         
         Returns
         -------
         extract.ExtractTable
             An ExtractTable instance.
 
+        Raises
+        ------
+        AttributeError
+            Raised if initialization fails.
+        MemoryError
+            Raised if a file is estimated to exceed max_memory and cannot be
+            read in chunks.
+        ValueError
+            Raised if backend is unknown.
+        ImportError
+            Raised if the packages of backend are not installed.
+
         See Also
         --------
         extract.read_file
@@ -158,9 +246,27 @@ class ExtractTable:
         >>> et8 = extract.ExtractTable(pd.DataFrame())
         # initializes the input data source as a pandas DataFrame
 
+        >>> et9 = extract.ExtractTable('big.csv', column='ID', value='01',
+        ...                            max_memory=2 * 1024 ** 3)
+        # reads only the rows to extract, in chunks, if 'big.csv' is 
+        # estimated to take more than 2 GiB in memory
+
+        >>> et10 = extract.ExtractTable('huge.shp', 'out.gpkg', 'ID', '01',
+        ...                             backend='dask')
+        # filters and writes 'huge.shp' partition by partition
+
+        >>> et11 = extract.ExtractTable('precincts.shp', repair=True)
+        # makes the invalid geometries of 'precincts.shp' valid
+
         """
+        if backend not in self.__backends:
+            raise ValueError("Unknown backend '{}'. Choose one of {}".format(
+                                backend, ', '.join(self.__backends)))
+
         # Encapsulated attributes
         self.__infile =     None
+        self.__source =     None # infile as given, e.g. a zip's path
+        self.__instats =    None # unhashed fingerprint of source before read
         self.__outfile =    None
         self.__column =     None
         self.__value =      None
@@ -170,8 +276,15 @@ class ExtractTable:
         self.__coldata =    None
         self.__foundval =   False
         self.__extracted =  None
+        self.__stats =      {}
+        self.__max_memory = max_memory
+        self.__pending =    (column, value) # filter for chunked reads
+        self.__chunked =    None # (column, values) of rows read in chunks
+        self.__backend =    backend
+        self.__repair =     bool(repair)
 
         self.__sanitize_init(infile, outfile, column, value)
+        self.__pending =    (None, None)
     
 
     def __sanitize_init(self,
@@ -200,6 +313,8 @@ class ExtractTable:
         ------
         AttributeError
             Raised if setter throws an error.
+        MemoryError
+            Raised if infile is estimated to exceed the memory budget.
 
         """
         try:
@@ -208,6 +323,8 @@ class ExtractTable:
             self.column = column
             self.value = value
 
+        except (MemoryError, ImportError):
+            raise
         except Exception as e:
             raise AttributeError("Initialization failed. {}".format(e))
 
@@ -263,16 +380,12 @@ class ExtractTable:
         c          lkjh    3     None
 
         """
-        if self.__table is None:
-            raise RuntimeError("Unable to find tabular data to extract")
-        elif self.column:
-            return self.__reindex()
-        else:
-            return self.__table
+        return self.__compute(self.__select())
             
 
     def extract_to_file(self, outfile: Optional[str] = None,
-                        driver: Optional[str] = None
+                        driver: Optional[str] = None,
+                        incremental: Optional[bool] = False
                         ) -> NoReturn:
         """
         Writes the tabular extracted data to a file. 
@@ -286,6 +399,12 @@ class ExtractTable:
             Name of file to write extracted data.
         driver: str | None, optional, default = ``None``
             Name of Fiona supported OGR drivers to use for file writing.
+        incremental: bool, optional, default = ``False``
+            If True, skips writing an output that is up to date with the
+            input file and extraction options, and records a fingerprint
+            of them next to the written output. Has no effect when writing
+            to stdout or extracting from an in-memory table. See
+            ``extract.is_up_to_date``.
         
         Raises
         ------
@@ -316,26 +435,58 @@ class ExtractTable:
         >>> et2.extract_to_file('ESRI Shapefile')
         # extracts table to 'output' in specified format of 'ESRI Shapefile'
 
+        >>> et3 = extract.read_file('input.shp', 'col1', 'square')
+        >>> et3.extract_to_file('output.csv', incremental=True)
+        # writes 'output.csv' and 'output.csv.extract.json'
+        >>> et3.extract_to_file('output.csv', incremental=True)
+        # skips the write, since 'output.csv' is up to date
+
         """
-        gdf = self.extract()
-        is_geometric = self.__has_spatial_data(gdf)
+        import pandas as pd
 
         if outfile is None:
             filename = self.outfile
         else:
             filename = outfile
 
+        incremental = bool(incremental and filename is not None 
+                           and isinstance(self.__source, str))
+        if incremental and is_up_to_date(self.__source, filename, 
+                                         self.column, self.value, driver,
+                                         self.__repair):
+            return
+
+        table = self.__select()
+        is_geometric = self.__has_spatial_data(table)
+
+        start = time.perf_counter()
         if filename is None:
+            gdf = self.__compute(table)
             if is_geometric:
                 gdf.to_string(buf=sys.stdout)
             else:
                 pd.DataFrame(gdf).drop(
                         columns='geometry').to_string(buf=sys.stdout)
 
+            self.__record('write', start, rows_in=len(gdf), rows_out=len(gdf))
+
         else:
             ext = self.__get_extension(filename)
             try: 
-                if is_geometric and ext == '.shp':
+                partitioned = self.__is_lazy(table) and (ext == '.csv' or 
+                        is_geometric and ext != '.geojson' and 
+                        (ext in ('.shp', '.gpkg') or driver is not None))
+                native = self.__is_polars(table) and ext == '.csv'
+                gdf = None if partitioned or native else self.__compute(table)
+
+                if partitioned: # formats that can be appended to
+                    rows = self.__write_partitions(table, filename, ext, 
+                                                   driver, is_geometric)
+                elif native: # written by pandas, which formats values
+                    self.__extract_to_inferred_file(
+                            self.__polars_to_pandas(table), filename, ext)
+                    rows = len(table)
+                elif is_geometric and ext == '.shp':
                     gdf.to_file(filename)
                 elif is_geometric and ext == '.geojson':
                     gdf.to_file(filename, driver='GeoJSON')
@@ -353,9 +504,122 @@ class ExtractTable:
             except Exception as e:
                 try:
                     os.makedirs(self.__outfile.parent)
-                    self.extract_to_file(outfile, driver)
+                    self.extract_to_file(outfile, driver, incremental)
                 except:
                     raise RuntimeError("Extraction failed:", e)
+            else: # a retried write records its own stats
+                rows = rows if gdf is None else len(gdf)
+                self.__record('write', start, rows_in=rows, rows_out=rows,
+                              nbytes=self.__written_bytes(filename))
+                if incremental:
+                    mark_up_to_date(self.__source, filename, self.column, 
+                                    self.value, driver, self.__repair,
+                                    self.__instats)
+
+
+    async def aextract(self, 
+                       executor: Optional[concurrent.futures.Executor] = None
+                       ) -> gpd.GeoDataFrame:
+        """
+        Asynchronously returns a GeoPandas GeoDataFrame containing the 
+        extracted subtable. Runs ``extract.ExtractTable.extract`` on the 
+        given executor, so the event loop is not blocked.
+
+        Parameters
+        ----------
+        executor : concurrent.futures.Executor | None, optional
+            Executor to run on. Defaults to the event loop's default 
+            executor, a thread pool with a bounded number of workers.
+
+        Returns
+        -------
+        gpd.GeoDataFrame
+            A geopandas GeoDataFrame of the extracted table.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if trying to extract from non-existent tabular data.
+
+        See Also
+        --------
+        extract.aread_file
+
+        Examples
+        --------
+        >>> et = await extract.aread_file('input.csv', 'col1', 'c')
+        >>> gdf = await et.aextract()
+        >>> print(gdf.head())
+             Unnamed: 0 col2 geometry
+        col1                      
+        c          fdsa    d     None
+        c          lkjh    3     None
+
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.extract)
+
+
+    async def aextract_to_file(
+                self, 
+                outfile:     Optional[str] = None,
+                driver:      Optional[str] = None,
+                incremental: Optional[bool] = False,
+                executor:    Optional[concurrent.futures.Executor] = None
+                ) -> NoReturn:
+        """
+        Asynchronously writes the tabular extracted data to a file. Runs
+        ``extract.ExtractTable.extract_to_file`` on the given executor, so
+        the event loop is not blocked.
+
+        A write cannot be interrupted once started. If the awaiting task is 
+        cancelled before the write starts, no file is written; if it is 
+        cancelled afterwards, ``asyncio.CancelledError`` is raised at once 
+        while the write runs to completion in the background.
+
+        Parameters
+        ----------
+        outfile: str | None, optional, default = ``None``
+            Name of file to write extracted data.
+        driver: str | None, optional, default = ``None``
+            Name of Fiona supported OGR drivers to use for file writing.
+        incremental: bool, optional, default = ``False``
+            If True, skips writing an up-to-date output. See 
+            ``extract.ExtractTable.extract_to_file``.
+        executor : concurrent.futures.Executor | None, optional
+            Executor to run on. Defaults to the event loop's default 
+            executor, a thread pool with a bounded number of workers.
+
+        Raises
+        ------
+        RuntimeError
+            Raised if unable to extract to output file.
+
+        See Also
+        --------
+        extract.ExtractTable.extract_to_file
+
+        Examples
+        --------
+        >>> tables = await asyncio.gather(
+        ...         *(extract.aread_file(f, 'ID') for f in infiles))
+        # reads the input files concurrently
+        >>> await asyncio.gather(
+        ...         *(t.aextract_to_file(f + '.csv') 
+        ...           for (t, f) in zip(tables, infiles)))
+        # writes the output files concurrently
+
+        """
+        import asyncio
+        import functools
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+                executor, 
+                functools.partial(self.extract_to_file, outfile, driver,
+                                  incremental))
 
 
     def list_columns(self) -> np.ndarray:
@@ -385,8 +649,12 @@ class ExtractTable:
         ['Unnamed: 0' 'col1' 'col2']
 
         """
+        import pandas as pd
+
         if self.__table is None:
             raise RuntimeError("Unable to find tabular data to extract")
+        elif self.__is_polars(self.__table):
+            return pd.Index(self.__table.columns).values
         elif self.__has_spatial_data(self.__table):
             return self.__table.columns.values
         else:
@@ -457,20 +725,15 @@ class ExtractTable:
         if self.__table is None:
             raise RuntimeError("Unable to find tabular data to extract")
 
-        elif column is not None: 
+        self.__check_whole()
+        if column is not None: 
             try:
-                if unique:
-                    return self.__table[column].unique()
-                else:
-                    return self.__table[column].values
+                return self.__values(self.__table[column], unique)
             except:
                 raise KeyError("Unable to find column '{}'".format(column))
 
         elif column is None and self.column is not None:
-            if unique:
-                return self.__table[self.column].unique()
-            else:
-                return self.__table[self.column].values
+            return self.__values(self.__table[self.column], unique)
 
         else:
             raise RuntimeError("No initialized column exists")
@@ -480,287 +743,2328 @@ class ExtractTable:
     # Private Helper Methods                    |
     #===========================================+
 
-    def __reindex(self) -> gpd.GeoDataFrame:
-        if self.value is not None:
-            return self.__geometrize_gdf(gpd.GeoDataFrame(
-                        self.__extracted.set_index(self.column)))
-        else:
-            return self.__geometrize_gdf(gpd.GeoDataFrame(
-                        self.__table.set_index(self.column)))
+    def __select(self) -> gpd.GeoDataFrame:
+        """
+        Returns the extracted subtable, which is partitioned and not yet
+        computed if the backend is 'dask'.
 
+        """
+        if self.__table is None:
+            raise RuntimeError("Unable to find tabular data to extract")
+        elif self.value is None:
+            self.__check_whole()
 
-    def __get_extension(self, filename: str) -> str:
-        (_, extension) = os.path.splitext(filename)
-        return extension.lower()
+        if self.column:
+            return self.__reindex()
+        else:
+            return self.__table
 
 
-    def __read_file(self, filename: str) -> Tuple[str, gpd.GeoDataFrame]:
+    def __check_whole(self) -> NoReturn:
         """
-        Given a filename, returns a tuple of a tabular file's name and 
-        a GeoDataFrame containing tabular data.
+        Raises a MemoryError if the table holds only the rows that were 
+        read in chunks, rather than the whole table.
 
         """
-        ext = self.__get_extension(filename)
+        if self.__chunked is not None:
+            (column, values) = self.__chunked
+            raise MemoryError(
+                "Only the rows of {} whose column '{}' has value(s) {} fit "
+                "the memory budget and were read. Set a value to extract or "
+                "raise the budget.".format(self.__infile, column, values))
 
-        if ext != '.zip':
-            try: # gpd has df init problems. Fix: try converting a pd read
-                return (filename, self.__geometrize_gdf(
-                                        gpd.GeoDataFrame(self.__read_inferred(
-                                                            filename, ext))))
-            except:
-                return (filename, self.__geometrize_gdf(
-                                        gpd.read_file(filename)))
+
+    def __reindex(self) -> gpd.GeoDataFrame:
+        start = time.perf_counter()
+        if self.value is not None:
+            table = self.__extracted
         else:
-            return self.__read_zip(filename)
+            table = self.__table
+
+        if self.__is_polars(table): # the index is written as the 1st column
+            reindexed = table.select(
+                            [self.column] + 
+                            [c for c in table.columns if c != self.column])
+        elif self.__is_lazy(table): # keeps row order, unlike a shuffle
+            column = self.column
+            reindexed = table.map_partitions(
+                            lambda part: part.set_index(column),
+                            meta=self.__meta(table).set_index(column))
+        else:
+            import geopandas as gpd
 
+            reindexed = gpd.GeoDataFrame(table.set_index(self.column))
 
-    def __read_zip(self, filename: str) -> Tuple[str, gpd.GeoDataFrame]:
-        """
-        Helper to self.__read_file. Recursively unzips given zipfiles.
-        Unlike gpd, can handle relative paths and doesn't require
-        'zip:///' prepend.
+        self.__record('reindex', start, rows_in=self.__count(table), 
+                      rows_out=self.__count(reindexed))
+        return self.__geometrize_gdf(reindexed)
 
-        """
-        (name, gdf) = (None, None)
 
-        for file in self.__unzip(filename):
-            try:
-                (name, gdf) = self.__read_file(file)
-                break
-            except:
-                continue
+    def __is_lazy(self, obj: Any) -> bool:
+        return hasattr(obj, '__dask_graph__')
 
-        if gdf is None:
-            raise FileNotFoundError("No file found".format(name))
-        else:
-            return (name, gdf)
-        
 
-    def __unzip(self, filename: str) -> List[str]:
+    def __is_polars(self, obj: Any) -> bool:
+        return type(obj).__module__.startswith('polars')
+
+
+    def __compute(self, obj: Any) -> Any:
         """
-        Given a zipfile filename, returns a list of filenames in the 
-        unzipped directory.
+        Returns the given table as a GeoDataFrame, computing a partitioned
+        table and converting a Polars table.
 
         """
-        cwd = os.path.splitext(filename)[0]
-        with zipfile.ZipFile(filename, 'r') as zipped:
-            zipped.extractall(cwd)
-            
-        if os.path.isdir(cwd) is None:
-            raise IOError("Directory \'{}\' not found.".format(cwd))
+        if self.__is_polars(obj):
+            return self.__from_polars(obj)
         else:
-            (_, _, files) = next(os.walk(cwd))
-            return [os.path.join(cwd, file) for file in files]
+            return obj.compute() if self.__is_lazy(obj) else obj
 
 
-    def __has_spatial_data(self, gdf: gpd.GeoDataFrame) -> bool:
-        return not gdf['geometry'].isna().all()
-
+    def __count(self, table: gpd.GeoDataFrame) -> Optional[int]:
+        """
+        Returns the number of rows in the given table, or None if counting
+        them would require computing a partitioned table.
 
-    def __read_inferred(self, filename: str, ext: str) -> pd.DataFrame:
-        if ext == '.csv':
-            try:
-                return pd.read_csv(filename, low_memory=False) 
-            except:
-                return pd.read_csv(filename, encoding='ISO-8859-1', 
-                                   low_memory=False)
-        elif ext == '.pkl' or ext == '.bz2' or ext == '.zip' or \
-             ext == '.gzip' or ext == '.xz':
-            return pd.read_pickle(filename)
-        elif ext == '.xlsx':
-            return pd.read_excel(filename)
-        elif ext == '.html':
-            return pd.read_html(filename)
-        elif ext == '.json':
-            return pd.read_json(filename)
+        """
+        return None if self.__is_lazy(table) else len(table)
+
+
+    def __values(self, 
+                 series: Union[gpd.GeoSeries, pd.Series], 
+                 unique: bool
+                 ) -> Union[np.ndarray, gpd.array.GeometryArray]:
+        if self.__is_polars(series):
+            import pandas as pd
+
+            values = series.unique(maintain_order=True) if unique else series
+            return self.__like_pandas(
+                        pd.DataFrame({'values': values.to_numpy()})
+                        )['values'].values
+        elif not self.__is_lazy(series):
+            return series.unique() if unique else series.values
+        elif unique:
+            return series.unique().compute().values
         else:
-            raise FileNotFoundError('Cannot read {}'.format(filename))
-
+            return series.values.compute()
 
-    def __extract_to_inferred_file(
-            self, 
-            df: Union[gpd.GeoDataFrame, pd.DataFrame], 
-            filename: pathlib.Path, 
-            ext: str
-            ) -> NoReturn:
-        has_index = self.column is not None
 
-        if ext == '.csv':
-            df.to_csv(path_or_buf=filename, index=has_index)
-        elif ext == '.pkl' or ext == '.bz2' or ext == '.zip' or \
-             ext == '.gzip' or ext == '.xz':
-            df.to_pickle(filename)
-        elif ext == '.xlsx':
-            df.to_excel(filename, index=has_index)
-        elif ext == '.html':
-            df.to_html(buf=filename, index_names=has_index)
-        elif ext == '.json':
-            df.to_json(path_or_buf=filename)
-        elif ext == '.tex':
-            df.to_latex(buf=filename, index=has_index)
-        else:
-            with open(filename, 'w') as out:
-                if ext == '.md':
-                    out.write(df.to_markdown())
-                else:
-                    out.write(df.to_string())
-    
+    def __import_dask(self) -> Tuple[Any, Any, Any]:
+        """
+        Returns the modules dask, dask.dataframe and dask_geopandas.
 
-    def __geometrize_gdf(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
         try:
-            geometry = gdf['geometry'].map(shapely.wkt.loads)
-            geometrized = gdf.drop(columns='geometry')
-            return gpd.GeoDataFrame(geometrized, geometry=geometry)
-
-        except:
-            if 'geometry' not in gdf.columns:
-                return gpd.GeoDataFrame(gdf, geometry=gpd.GeoSeries())
-            else:
-                return gdf
+            import dask
+            import dask.dataframe as dd
+            import dask_geopandas
+        except ImportError:
+            raise ImportError(
+                "The 'dask' backend requires dask and dask-geopandas. "
+                "Run 'pip3 install dask-geopandas'.")
 
+        return (dask, dd, dask_geopandas)
 
-    #===========================================+
-    # Getters and Setters                       |
-    #===========================================+
 
-    @property
-    def infile(self) -> str:
+    def __meta(self, table: Any) -> gpd.GeoDataFrame:
         """
-        {str} 
-            Name/path of input file of tabular data to read
-        
+        Returns the empty table describing the columns and dtypes of the
+        given partitioned table.
+
         """
-        return self.__infile
+        (_, dd, _) = self.__import_dask()
+        return dd.utils.make_meta(table)
 
-    @infile.setter
-    def infile(self, 
-               infile: Optional[Union[str, 
-                                      gpd.GeoDataFrame,
-                                      pd.DataFrame]]) -> NoReturn:
-        if infile is not None and self.__infile is not None:
-            raise Exception("Infile '{}' is already set".format(self.__infile))
-        elif infile is not None:
-            try:
-                (self.__infile, self.__table) = self.__read_file(infile)
-            except:
-                try:
-                    self.__infile = None
-                    self.__table = self.__geometrize_gdf(
-                                        gpd.GeoDataFrame(infile))
 
-                except Exception as e:
-                    raise FileNotFoundError(
-                            "{} not found. {}".format(infile, e))
+    def __partition(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """
+        Splits an in-memory table into one partition per core.
 
+        """
+        (_, _, dask_geopandas) = self.__import_dask()
+        return dask_geopandas.from_geopandas(
+                    gdf, npartitions=os.cpu_count() or 1)
 
-    @property
-    def outfile(self) -> Optional[pathlib.Path]:
+
+    def __iter_partitions(self, table: gpd.GeoDataFrame):
         """
-        {pathlib.Path | None}
-            Path of output file for writing. Defaults to stdout
+        Yields the computed partitions of the given table in order, 
+        computing one partition per core at a time.
 
         """
-        return self.__outfile
+        (dask, _, _) = self.__import_dask()
 
-    @outfile.setter
-    def outfile(self, filename: Optional[str] = None) -> NoReturn:
-        try:
-            self.__outfile = pathlib.Path(filename)
-        except:
-            self.__outfile = None
+        parts = table.to_delayed()
+        batch = os.cpu_count() or 1
+        for i in range(0, len(parts), batch):
+            yield from dask.compute(*parts[i:i + batch])
 
 
-    @property
-    def column(self) -> str:
+    def __write_partitions(self, 
+                           table: gpd.GeoDataFrame, 
+                           filename: str, 
+                           ext: str, 
+                           driver: Optional[str],
+                           is_geometric: bool) -> int:
         """
-        {str}
-           Label of column to use as index for extracted table
-        
+        Writes a partitioned table to a .csv file, or to a spatial file
+        whose driver can append, one partition at a time. Returns the 
+        number of rows written.
+
         """
-        return self.__column
+        import pandas as pd
+
+        drivers = {'.shp': 'ESRI Shapefile', '.gpkg': 'GPKG'}
+        (rows, first) = (0, True)
+
+        for part in self.__iter_partitions(table):
+            if ext == '.csv':
+                df = pd.DataFrame(part)
+                if not is_geometric:
+                    df = df.drop(columns='geometry')
+                df.to_csv(filename, mode='w' if first else 'a', 
+                          header=first, index=self.column is not None)
+            elif len(part) > 0:
+                part.to_file(filename, driver=drivers.get(ext, driver),
+                             mode='w' if first else 'a')
+            else:
+                continue
 
-    @column.setter
-    def column(self, column: Optional[str]) -> NoReturn:
-        if column is not None:
-            try:
-                self.__coldata = self.__table[column]
-            except Exception as e:
-                raise KeyError("Column not found: {}".format(e))
+            (rows, first) = (rows + len(part), False)
 
-            self.__column = column
-            self.__value = None
+        return rows
 
 
-    @property
-    def value(self) -> Optional[Union[str, List[str]]]:
-        """ 
-        {str | List[str] | None}
-           Value(s) of specified column in rows to extract 
+    def __record(self, 
+                 stage:     str, 
+                 start:     float, 
+                 rows_in:   Optional[int] = None, 
+                 rows_out:  Optional[int] = None, 
+                 nbytes:    Optional[int] = None) -> NoReturn:
+        """
+        Adds the time elapsed since start and the given row and byte counts
+        to the statistics of the given stage.
 
         """
-        return self.__value
+        entry = self.__stats.setdefault(stage, {'calls': 0, 'seconds': 0.0})
+        entry['calls'] += 1
+        entry['seconds'] += time.perf_counter() - start
+
+        if rows_in is not None:
+            entry['rows_in'] = rows_in
+        if rows_out is not None:
+            entry['rows_out'] = rows_out
+        if nbytes is not None:
+            entry['bytes'] = nbytes
+        if resource is not None: # ru_maxrss is in bytes on macOS, else KiB
+            maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            entry['peak_rss_bytes'] = (
+                    maxrss if sys.platform == 'darwin' else maxrss * 1024)
+
+
+    def __written_bytes(self, filename: str) -> int:
+        """
+        Returns the number of bytes in the given output, including the
+        sidecar files of a shapefile and the files of an output directory.
+
+        """
+        path = pathlib.Path(filename)
+
+        if path.is_dir():
+            return sum(f.stat().st_size for f in path.rglob('*') 
+                                        if f.is_file())
+        elif self.__get_extension(filename) == '.shp':
+            return sum(f.stat().st_size for f in path.parent.iterdir()
+                                        if f.stem == path.stem and f.is_file())
+        else:
+            return path.stat().st_size
+
+
+    def __get_extension(self, filename: str) -> str:
+        (_, extension) = os.path.splitext(filename)
+        return extension.lower()
+
+
+    def __read_file(self, filename: str) -> Tuple[str, gpd.GeoDataFrame]:
+        """
+        Given a filename, returns a tuple of a tabular file's name and 
+        a GeoDataFrame containing tabular data. Geometries stored as text
+        are not yet parsed.
+
+        """
+        ext = self.__get_extension(filename)
+
+        if ext == '.csv' and self.__backend == 'polars':
+            table = self.__read_polars(filename)
+            if table is not None: # else the file is spatial or unparseable
+                return (filename, table)
+
+        import geopandas as gpd
+
+        if ext != '.zip' and self.__backend == 'dask':
+            return (filename, self.__read_partitioned(filename, ext))
+        elif ext in ('.csv', '.parquet') and self.__backend == 'duckdb':
+            table = self.__query(filename, ext)
+            if table is not None: # else the engine can't parse the file
+                return (filename, gpd.GeoDataFrame(table))
+
+        if ext != '.zip' and self.__max_memory is not None:
+            estimate = self.__estimate_memory(filename, ext)
+        else:
+            estimate = None
+
+        if estimate is not None and estimate > self.__max_memory:
+            table = self.__read_chunked(filename, ext, estimate)
+            (column, value) = self.__pending
+            self.__chunked = (column, 
+                              value if isinstance(value, list) else [value])
+            return (filename, gpd.GeoDataFrame(table))
+        elif ext != '.zip':
+            try: # gpd has df init problems. Fix: try converting a pd read
+                return (filename, gpd.GeoDataFrame(
+                                        self.__read_inferred(filename, ext)))
+            except:
+                return (filename, gpd.read_file(filename))
+        else:
+            return self.__read_zip(filename)
+
+
+    def __read_partitioned(self, filename: str, ext: str) -> gpd.GeoDataFrame:
+        """
+        Lazily reads the given file in partitions. Formats that cannot be
+        read in partitions are read into memory and then partitioned.
+
+        """
+        import geopandas as gpd
+
+        (_, dd, dask_geopandas) = self.__import_dask()
+
+        if ext == '.csv':
+            try:
+                return dd.read_csv(filename, low_memory=False)
+            except UnicodeDecodeError:
+                return dd.read_csv(filename, low_memory=False, 
+                                   encoding='ISO-8859-1')
+
+        try:
+            table = dask_geopandas.read_file(
+                        filename, npartitions=os.cpu_count() or 1)
+        except Exception:
+            try:
+                table = gpd.GeoDataFrame(self.__read_inferred(filename, ext))
+            except:
+                table = gpd.read_file(filename)
+
+            return self.__partition(table)
+
+        # dask_geopandas reads with pyogrio, whose dtypes (e.g. int32) can
+        # differ from those of an eager read
+        sample = gpd.read_file(filename, rows=1)
+        dtypes = {column: dtype for (column, dtype) in sample.dtypes.items()
+                  if column != 'geometry' and column in table.columns and
+                     table[column].dtype != dtype}
+        return table.astype(dtypes) if dtypes else table
+
+
+    def __query(self, filename: str, ext: str) -> Optional[pd.DataFrame]:
+        """
+        Scans the given .csv or .parquet file with DuckDB and returns only
+        the rows whose pending column contains the pending value(s), or all
+        rows if there is no pending value. Returns None if DuckDB fails to
+        read the file.
+
+        """
+        try:
+            import duckdb
+        except ImportError:
+            raise ImportError("The 'duckdb' backend requires duckdb. "
+                              "Run 'pip3 install duckdb'.")
+
+        if ext == '.csv': # read as text, then parsed by pandas' rules
+            source = ("read_csv(?, header=true, sample_size=-1, nullstr=?, "
+                      "all_varchar=true)")
+            sourced = [filename, self.__na_values]
+        else:
+            source = "read_parquet(?)"
+            sourced = [filename]
+
+        (column, value) = self.__pending
+        connection = duckdb.connect()
+        try:
+            described = connection.execute(
+                            "DESCRIBE SELECT * FROM " + source, 
+                            sourced).fetchall()
+            (columns, types) = zip(*[row[:2] for row in described])
+
+            if ext == '.csv': # e.g. pandas names a blank header 'Unnamed: 0'
+                names = list(self.__read_csv(filename, nrows=0).columns)
+                dtypes = self.__infer_csv_dtypes(connection, source, sourced,
+                                                 columns)
+            else:
+                names = list(columns)
+                dtypes = ['object' if t == 'VARCHAR' else t for t in types]
+            if len(names) != len(columns):
+                return None
+
+            (query, params) = ("SELECT * FROM " + source, list(sourced))
+            if column in names and value is not None:
+                i = names.index(column)
+                (quoted, dtype) = ('"{}"'.format(
+                                        columns[i].replace('"', '""')), 
+                                   dtypes[i])
+                values = [v for v in (value if isinstance(value, list) 
+                                      else [value])
+                          if self.__matches_dtype(v, dtype)]
+                if ext == '.csv' and dtype in ('bool', 'boolean'):
+                    quoted = "(lower({}) = 'true')".format(quoted)
+                elif ext == '.csv' and dtype != 'object':
+                    quoted = 'TRY_CAST(trim({}) AS {})'.format(
+                                quoted, 
+                                'BIGINT' if dtype == 'int64' else 'DOUBLE')
+                query += ' WHERE {} IN ({})'.format(
+                            quoted, ', '.join(['?'] * len(values))) \
+                         if values else ' WHERE FALSE'
+                params += values
+
+            table = connection.execute(query, params).df()
+        except duckdb.Error:
+            return None
+        finally:
+            connection.close()
+
+        table.columns = names
+        if ext == '.csv':
+            table = self.__parse_like_pandas(table, dict(zip(names, dtypes)))
+        return self.__like_pandas(table)
+
+
+    def __infer_csv_dtypes(self, 
+                           connection: duckdb.DuckDBPyConnection,
+                           source:     str,
+                           sourced:    List[Any],
+                           columns:    List[str]) -> List[str]:
+        """
+        Returns the dtype pandas infers for each column of a .csv file that
+        DuckDB scans as text, from one pass over all rows: 'bool' for 
+        columns of True/False ('boolean' if some are missing), 'int64' for
+        integers ('float64' if some are missing), 'float64' for numbers and
+        for columns of missing values, and 'object' otherwise.
+
+        """
+        bools = "('True', 'TRUE', 'true', 'False', 'FALSE', 'false')"
+        aggregates = []
+        for column in columns:
+            quoted = '"{}"'.format(column.replace('"', '""'))
+            present = ' FILTER (WHERE {} IS NOT NULL)'.format(quoted)
+            aggregates += [
+                'count({})'.format(quoted),
+                'bool_and({} IN {})'.format(quoted, bools) + present,
+                "bool_and(regexp_full_match(trim({0}), '[+-]?[0-9]+') AND "
+                "TRY_CAST(trim({0}) AS HUGEINT) BETWEEN -9223372036854775808 "
+                "AND 9223372036854775807)".format(quoted) + present,
+                'bool_and(TRY_CAST(trim({}) AS DOUBLE) IS NOT NULL)'.format(
+                            quoted) + present]
+
+        counted = connection.execute(
+                        "SELECT count(*), {} FROM {}".format(
+                                ', '.join(aggregates), source),
+                        sourced).fetchone()
+
+        dtypes = []
+        for i in range(len(columns)):
+            (count, is_bool, is_int, is_float) = counted[1 + 4 * i:5 + 4 * i]
+            complete = count == counted[0]
+            if count == 0:
+                dtypes.append('float64')
+            elif is_bool:
+                dtypes.append('bool' if complete else 'boolean')
+            elif is_int:
+                dtypes.append('int64' if complete else 'float64')
+            elif is_float:
+                dtypes.append('float64')
+            else:
+                dtypes.append('object')
+
+        return dtypes
+
+
+    def __matches_dtype(self, value: Any, dtype: str) -> bool:
+        """
+        Returns whether the given value can equal a value of the given 
+        dtype, as strings never equal numbers or booleans in pandas.
+
+        """
+        import numpy as np
+
+        if dtype == 'object':
+            return isinstance(value, str)
+        elif dtype in ('bool', 'boolean', 'BOOLEAN'):
+            return isinstance(value, (bool, np.bool_))
+        else:
+            return not isinstance(value, (str, bool, np.bool_))
+
+
+    def __parse_like_pandas(self, 
+                            table:  pd.DataFrame, 
+                            dtypes: Dict[str, str]) -> pd.DataFrame:
+        """
+        Returns the given table of text read by DuckDB, parsed by pandas
+        into the given dtypes, so that values (e.g. the last digits of 
+        floats) are exactly those pandas would have read.
+
+        """
+        import io
+
+        import numpy as np
+        import pandas as pd
+
+        buffer = io.StringIO()
+        table.to_csv(buffer, index=False)
+        buffer.seek(0)
+        parsed = pd.read_csv(buffer, dtype=dtypes, low_memory=False,
+                             keep_default_na=False, na_values=[''])
+
+        for (name, dtype) in dtypes.items(): # as pandas reads it with NaN
+            if dtype == 'boolean':
+                parsed[name] = parsed[name].astype(object).where(
+                                    parsed[name].notna(), np.nan)
+
+        return parsed
+
+
+    def __read_polars(self, filename: str) -> Optional[pl.DataFrame]:
+        """
+        Reads the given .csv file with Polars. Returns None if the file has
+        a geometry column or Polars fails to read it.
+
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("The 'polars' backend requires polars. "
+                              "Run 'pip3 install polars'.")
+
+        try: # types are inferred from all rows, as in pandas
+            table = pl.read_csv(filename, infer_schema_length=None, 
+                                null_values=self.__na_values)
+            names = list(self.__read_csv(filename, nrows=0).columns)
+        except Exception:
+            return None
+
+        if 'geometry' in names or len(names) != table.width:
+            return None
+
+        table = table.rename(dict(zip(table.columns, names)))
+        return table.with_columns([ # pandas reads these as float64
+                    pl.col(name).cast(pl.Float64) 
+                    for (name, dtype) in table.schema.items()
+                    if dtype.is_integer() and table[name].null_count()])
+
+
+    def __from_polars(self, table: pl.DataFrame) -> gpd.GeoDataFrame:
+        """
+        Returns the given Polars table as the GeoDataFrame the 'pandas'
+        backend would have extracted.
+
+        """
+        import geopandas as gpd
+
+        return self.__parse_geometry(
+                    gpd.GeoDataFrame(self.__polars_to_pandas(table)))
+
+
+    def __polars_to_pandas(self, table: pl.DataFrame) -> pd.DataFrame:
+        """
+        Returns the given Polars table as a DataFrame with the missing 
+        values, dtypes and index of the 'pandas' backend. Doesn't import
+        geopandas.
+
+        """
+        import pandas as pd
+
+        try:
+            df = table.to_pandas()
+        except ImportError: # pyarrow is not installed
+            df = pd.DataFrame({name: table[name].to_numpy() 
+                               for name in table.columns})
+
+        df = self.__like_pandas(df)
+        if self.column:
+            df = df.set_index(self.column)
+
+        return df
+
+
+    def __polars_filter(self, value: Union[str, List[str]]) -> pl.Expr:
+        """
+        Returns an expression selecting the rows whose column contains the
+        given value(s), which match as with 'pandas': strings only match 
+        text columns, and other values only other columns.
+
+        """
+        import polars as pl
+
+        is_text = self.__table.schema[self.column] == pl.Utf8
+        values = [v for v in (value if isinstance(value, list) else [value])
+                  if isinstance(v, str) == is_text]
+
+        return pl.col(self.column).is_in(values) if values else pl.lit(False)
+
+
+    def __like_pandas(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the given DataFrame, read by another engine, with missing
+        values and dtypes as pandas would read them: NaN in text columns, 
+        and float64 for integer columns with missing values.
+
+        """
+        import numpy as np
+        import pandas as pd
+
+        for column in df.columns[df.isna().any().values]:
+            if pd.api.types.is_integer_dtype(df[column].dtype) or \
+               pd.api.types.is_float_dtype(df[column].dtype):
+                df[column] = df[column].astype('float64')
+            else:
+                df[column] = df[column].astype(object).where(
+                                df[column].notna(), np.nan)
+
+        for column in df.columns[df.dtypes.map(
+                    pd.api.types.is_extension_array_dtype).values]:
+            df[column] = df[column].astype(str(df[column].dtype).lower())
+
+        return df
+
+
+    def __read_zip(self, filename: str) -> Tuple[str, gpd.GeoDataFrame]:
+        """
+        Helper to self.__read_file. Recursively unzips given zipfiles.
+        Unlike gpd, can handle relative paths and doesn't require
+        'zip:///' prepend. Reads of the same zipfile are serialised, so
+        concurrent reads (e.g. by aread_file) don't extract over each other.
+
+        """
+        (name, gdf) = (None, None)
+
+        with self.__zip_lock(filename):
+            for file in self.__unzip(filename):
+                try:
+                    (name, gdf) = self.__read_file(file)
+                    break
+                except (MemoryError, ImportError):
+                    raise
+                except:
+                    continue
+
+        if gdf is None:
+            raise FileNotFoundError("No file found".format(name))
+        else:
+            return (name, gdf)
+        
+
+    def __zip_lock(self, filename: str) -> threading.Lock:
+        """
+        Returns the lock guarding the directory the given zipfile is
+        unzipped into.
+
+        """
+        with self.__zip_locks_guard:
+            return self.__zip_locks.setdefault(
+                        os.path.abspath(filename), threading.Lock())
+
+
+    def __unzip(self, filename: str) -> List[str]:
+        """
+        Given a zipfile filename, returns a list of filenames in the 
+        unzipped directory.
+
+        """
+        cwd = os.path.splitext(filename)[0]
+        with zipfile.ZipFile(filename, 'r') as zipped:
+            zipped.extractall(cwd)
+            
+        if os.path.isdir(cwd) is None:
+            raise IOError("Directory \'{}\' not found.".format(cwd))
+        else:
+            (_, _, files) = next(os.walk(cwd))
+            return [os.path.join(cwd, file) for file in files]
+
+
+    def __has_spatial_data(self, gdf: gpd.GeoDataFrame) -> bool:
+        if self.__is_polars(gdf): # only read without geometries
+            return False
+        else:
+            return not self.__compute(gdf['geometry'].isna().all())
+
+
+    def __estimate_memory(self, filename: str, ext: str) -> int:
+        """
+        Returns an estimate of the number of bytes the given file takes in
+        memory, extrapolated from the file's size and the in-memory size of
+        a sample of its first rows.
+
+        """
+        import geopandas as gpd
+
+        size = os.path.getsize(filename)
+        try:
+            if ext == '.csv':
+                sample = self.__read_csv(filename, nrows=self.__sample_rows)
+                with open(filename, 'rb') as infile: # header + sampled rows
+                    sample_size = sum(len(line) for (_, line) in 
+                                      zip(range(len(sample) + 1), infile))
+            else:
+                sample = gpd.read_file(filename, 
+                                       rows=slice(0, self.__sample_rows))
+                sample_size = size * len(sample) / max(
+                                        self.__count_features(filename), 1)
+
+            per_byte = sample.memory_usage(deep=True).sum() / sample_size
+            return int(size * max(per_byte, 1))
+
+        except Exception: # unsampleable formats are assumed to expand 5x
+            return size * 5
+
+
+    def __count_features(self, filename: str) -> int:
+        import fiona
+
+        with fiona.open(filename) as collection:
+            return len(collection)
+
+
+    def __read_chunked(self, 
+                       filename: str, 
+                       ext: str, 
+                       estimate: int) -> pd.DataFrame:
+        """
+        Reads only the rows of the given file whose pending column contains
+        the pending value(s), in chunks that fit the memory budget.
+
+        """
+        import pandas as pd
+
+        (column, value) = self.__pending
+
+        if ext != '.csv' or column is None or value is None:
+            raise MemoryError(
+                "{} is estimated to take {:.1f} MB in memory, more than the "
+                "{:.1f} MB budget. Only .csv files with a column and value "
+                "to extract can be read in chunks; specify them or raise "
+                "the budget.".format(filename, estimate / 1024 ** 2,
+                                     self.__max_memory / 1024 ** 2))
+
+        values = value if isinstance(value, list) else [value]
+        sample = self.__read_csv(filename, nrows=self.__sample_rows)
+        if column not in sample.columns:
+            raise KeyError("Column not found: '{}'".format(column))
+
+        row_bytes = max(sample.memory_usage(deep=True).sum() / len(sample), 1)
+        chunksize = max(int(self.__max_memory / 4 / row_bytes), 1)
+
+        for encoding in (None, 'ISO-8859-1'):
+            try: # decoding errors may only surface in a later chunk
+                dtypes = self.__infer_dtypes(
+                            pd.read_csv(filename, encoding=encoding, 
+                                        chunksize=chunksize, 
+                                        low_memory=False))
+                chunks = [chunk[chunk[column].isin(values)] for chunk in 
+                          pd.read_csv(filename, encoding=encoding, 
+                                      chunksize=chunksize, low_memory=False,
+                                      dtype=dtypes)]
+                break
+            except UnicodeDecodeError:
+                continue
+
+        return pd.concat(chunks) if chunks else sample.iloc[:0]
+
+
+    def __infer_dtypes(self, chunks: Iterator[pd.DataFrame]
+                       ) -> Dict[str, Any]:
+        """
+        Returns the dtypes pandas infers for the columns of a whole table, 
+        given the table in chunks, whose dtypes are inferred separately: 
+        integers that are floats in some chunk are floats, and columns that
+        are text in some chunk are text. Columns of booleans with missing 
+        values are left to be inferred per chunk, as a whole read does.
+
+        """
+        import numpy as np
+
+        kinds = {}
+        for chunk in chunks:
+            for (column, values) in chunk.items():
+                if values.isna().all():
+                    kind = 'missing'
+                elif values.dtype == object and values.dropna().map(
+                        lambda v: isinstance(v, (bool, np.bool_))).all():
+                    kind = 'bool'
+                elif values.dtype == object:
+                    kind = 'text'
+                else:
+                    kind = values.dtype
+                kinds.setdefault(column, set()).add(kind)
+
+        dtypes = {}
+        for (column, kind) in kinds.items():
+            missing = 'missing' in kind
+            kind.discard('missing')
+            numeric = {k for k in kind if isinstance(k, np.dtype) and 
+                       k.kind in 'iuf'}
+            if 'text' in kind or (kind - numeric and numeric):
+                dtypes[column] = str
+            elif len(numeric) > 1 or (missing and numeric):
+                dtypes[column] = np.float64
+        return dtypes
+
+
+    def __was_read(self, value: Union[str, List[str]]) -> bool:
+        """
+        Returns True if the rows with the given value(s) of the current 
+        column were among the rows read in chunks.
+
+        """
+        (column, values) = self.__chunked
+        return self.column == column and all(
+                    v in values for v in 
+                    (value if isinstance(value, list) else [value]))
+
+
+    def __reread(self, value: Union[str, List[str]]) -> NoReturn:
+        """
+        Reads the rows with the given value(s) of the current column again,
+        in chunks that fit the memory budget.
+
+        """
+        self.__pending = (self.column, value)
+        self.__instats = self.__stat_source(self.__source)
+        try:
+            (_, table) = self.__read_file(self.__infile)
+        finally:
+            self.__pending = (None, None)
+        self.__table = self.__repair_geometries(self.__geometrize_gdf(table))
+        self.__coldata = self.__table[self.column]
+
+
+    def __stat_source(self, infile: Any) -> Optional[Dict[str, Any]]:
+        """
+        Returns the unhashed fingerprint of the given input file, to be 
+        taken before the file is read, or None if it is not a file. Hashing
+        is left to an incremental write, which hashes the file if unchanged.
+
+        """
+        try:
+            return fingerprint_input(infile, hashed=False)
+        except (OSError, TypeError, ValueError):
+            return None
+
+
+    def __read_csv(self, filename: str, nrows: int) -> pd.DataFrame:
+        import pandas as pd
+
+        try:
+            return pd.read_csv(filename, nrows=nrows, low_memory=False)
+        except UnicodeDecodeError:
+            return pd.read_csv(filename, nrows=nrows, low_memory=False,
+                               encoding='ISO-8859-1')
+
+
+    def __read_inferred(self, filename: str, ext: str) -> pd.DataFrame:
+        import pandas as pd
+
+        if ext == '.csv':
+            try:
+                return pd.read_csv(filename, low_memory=False) 
+            except:
+                return pd.read_csv(filename, encoding='ISO-8859-1', 
+                                   low_memory=False)
+        elif ext == '.pkl' or ext == '.bz2' or ext == '.zip' or \
+             ext == '.gzip' or ext == '.xz':
+            return pd.read_pickle(filename)
+        elif ext == '.xlsx':
+            return pd.read_excel(filename)
+        elif ext == '.html':
+            return pd.read_html(filename)
+        elif ext == '.json':
+            return pd.read_json(filename)
+        elif ext == '.parquet':
+            return pd.read_parquet(filename)
+        else:
+            raise FileNotFoundError('Cannot read {}'.format(filename))
+
+
+    def __extract_to_inferred_file(
+            self, 
+            df: Union[gpd.GeoDataFrame, pd.DataFrame], 
+            filename: pathlib.Path, 
+            ext: str
+            ) -> NoReturn:
+        has_index = self.column is not None
+
+        if ext == '.csv':
+            df.to_csv(path_or_buf=filename, index=has_index)
+        elif ext == '.pkl' or ext == '.bz2' or ext == '.zip' or \
+             ext == '.gzip' or ext == '.xz':
+            df.to_pickle(filename)
+        elif ext == '.xlsx':
+            df.to_excel(filename, index=has_index)
+        elif ext == '.html':
+            df.to_html(buf=filename, index_names=has_index)
+        elif ext == '.json':
+            df.to_json(path_or_buf=filename)
+        elif ext == '.tex':
+            df.to_latex(buf=filename, index=has_index)
+        else:
+            with open(filename, 'w') as out:
+                if ext == '.md':
+                    out.write(df.to_markdown())
+                else:
+                    out.write(df.to_string())
+    
+
+    def __geometrize_gdf(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        start = time.perf_counter()
+        if self.__is_polars(gdf): # only read without geometries
+            geometrized = gdf
+        elif self.__is_lazy(gdf):
+            geometrized = gdf.map_partitions(
+                                self.__parse_geometry,
+                                meta=self.__parse_geometry(self.__meta(gdf)))
+        else:
+            geometrized = self.__parse_geometry(gdf)
+
+        self.__record('geometrize', start, rows_in=self.__count(gdf), 
+                      rows_out=self.__count(geometrized))
+        return geometrized
+
+
+    def __repair_geometries(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        if (not self.__repair or self.__is_polars(gdf) or 
+            'geometry' not in gdf.columns):
+            return gdf
+
+        import gdutils.dataqa as dq
+
+        start = time.perf_counter()
+        if self.__is_lazy(gdf): # partitions are already repaired in parallel
+            repaired = gdf.map_partitions(dq.repair_geometries, workers=1,
+                                          meta=self.__meta(gdf))
+        else:
+            repaired = dq.repair_geometries(gdf)
+
+        self.__record('repair', start, rows_in=self.__count(gdf), 
+                      rows_out=self.__count(repaired))
+        return repaired
+
+
+    def __parse_geometry(self, gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        import geopandas as gpd
+        import shapely.wkt
+
+        try:
+            geometry = gdf['geometry'].map(shapely.wkt.loads)
+            geometrized = gdf.drop(columns='geometry')
+            return gpd.GeoDataFrame(geometrized, geometry=geometry)
+
+        except:
+            if 'geometry' not in gdf.columns:
+                return gpd.GeoDataFrame(gdf, geometry=gpd.GeoSeries())
+            else:
+                return gdf
+
+
+    #===========================================+
+    # Getters and Setters                       |
+    #===========================================+
+
+    @property
+    def max_memory(self) -> Optional[int]:
+        """
+        {int | None}
+            Memory budget, in bytes, for reading input files
+
+        """
+        return self.__max_memory
+
+    @property
+    def backend(self) -> str:
+        """
+        {str}
+            Library holding the table, 'pandas', 'dask', 'duckdb' or 
+            'polars'
+
+        """
+        return self.__backend
+
+    @property
+    def repair(self) -> bool:
+        """
+        {bool}
+            Whether invalid geometries are repaired when read
+
+        """
+        return self.__repair
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        {Dict[str, Dict[str, Any]]}
+            Instrumentation of each stage run so far ('read', 'geometrize',
+            'repair', 'filter', 'reindex', 'write'). Each stage records its
+            number of calls, total wall time in seconds, rows in and out and
+            bytes read or written by its latest call, and the process' peak
+            resident memory in bytes after its latest call. Row counts of a
+            'dask' table are only recorded once written. E.g.
+            ``{'read': {'calls': 1, 'seconds': 0.02, 'rows_out': 5, 
+            'bytes': 96, 'peak_rss_bytes': 104857600}, ...}``
+
+        """
+        return {stage: dict(entry) for stage, entry in self.__stats.items()}
+
+    @property
+    def infile(self) -> str:
+        """
+        {str} 
+            Name/path of input file of tabular data to read
+        
+        """
+        return self.__infile
+
+    @infile.setter
+    def infile(self, 
+               infile: Optional[Union[str, 
+                                      gpd.GeoDataFrame,
+                                      pd.DataFrame]]) -> NoReturn:
+        if infile is not None and self.__infile is not None:
+            raise Exception("Infile '{}' is already set".format(self.__infile))
+        elif infile is not None:
+            try:
+                start = time.perf_counter()
+                instats = self.__stat_source(infile)
+                (self.__infile, table) = self.__read_file(infile)
+                (self.__source, self.__instats) = (infile, instats)
+                self.__record('read', start, rows_out=self.__count(table),
+                              nbytes=os.path.getsize(infile))
+                self.__table = self.__repair_geometries(
+                                    self.__geometrize_gdf(table))
+            except (MemoryError, ImportError):
+                raise
+            except:
+                import geopandas as gpd
+
+                try:
+                    self.__infile = None
+                    table = gpd.GeoDataFrame(infile)
+                    if self.__backend == 'dask':
+                        table = self.__partition(table)
+                    self.__table = self.__repair_geometries(
+                                        self.__geometrize_gdf(table))
+
+                except ImportError:
+                    raise
+                except Exception as e:
+                    raise FileNotFoundError(
+                            "{} not found. {}".format(infile, e))
+
+
+    @property
+    def outfile(self) -> Optional[pathlib.Path]:
+        """
+        {pathlib.Path | None}
+            Path of output file for writing. Defaults to stdout
+
+        """
+        return self.__outfile
+
+    @outfile.setter
+    def outfile(self, filename: Optional[str] = None) -> NoReturn:
+        try:
+            self.__outfile = pathlib.Path(filename)
+        except:
+            self.__outfile = None
+
+
+    @property
+    def column(self) -> str:
+        """
+        {str}
+           Label of column to use as index for extracted table
+        
+        """
+        return self.__column
+
+    @column.setter
+    def column(self, column: Optional[str]) -> NoReturn:
+        if column is not None:
+            try:
+                self.__coldata = self.__table[column]
+            except Exception as e:
+                raise KeyError("Column not found: {}".format(e))
+
+            self.__column = column
+            self.__value = None
+
+
+    @property
+    def value(self) -> Optional[Union[str, List[str]]]:
+        """ 
+        {str | List[str] | None}
+           Value(s) of specified column in rows to extract 
+
+        """
+        return self.__value
 
     @value.setter
     def value(self, value: Optional[Union[str, List[str]]]) -> NoReturn:
         if value is not None and self.__table is None:
             raise KeyError("Cannot set value without specifying tabular data")
 
-        elif value is not None and self.column is None:
-            raise KeyError("Cannot set value without specifying column")
+        elif value is not None and self.column is None:
+            raise KeyError("Cannot set value without specifying column")
+
+        elif value is not None:
+            if self.__chunked is not None and not self.__was_read(value):
+                self.__reread(value)
+
+            start = time.perf_counter()
+            if self.__is_polars(self.__table):
+                self.__extracted = \
+                    self.__table.filter(self.__polars_filter(value))
+            elif self.__is_lazy(self.__table) and isinstance(value, list):
+                # partitioned comparisons only fail once computed
+                self.__extracted = \
+                    self.__table[self.__table[self.column].isin(value)]
+            else:
+                try: # value is a singleton
+                    self.__extracted = \
+                        self.__table[self.__table[self.column] == value]
+                except: # value is a list
+                    self.__extracted = \
+                        self.__table[self.__table[self.column].isin(value)]
+
+            self.__record('filter', start, rows_in=self.__count(self.__table),
+                          rows_out=self.__count(self.__extracted))
+            if len(self.__extracted.head(1, npartitions=-1)
+                   if self.__is_lazy(self.__extracted) 
+                   else self.__extracted) == 0:
+                raise KeyError(
+                    "Column '{}' has no value '{}'".format(self.column, value))
+            else:
+                self.__value = value
+
+
+
+#########################################
+#                                       #
+#       Module Functions                #
+#                                       #
+#########################################
+
+def read_file(filename:   str, 
+              column:     Optional[str] = None, 
+              value:      Optional[Union[str, List[str]]] = None,
+              max_memory: Optional[int] = None,
+              backend:    Optional[str] = 'pandas',
+              repair:     Optional[bool] = False):
+    """
+    Returns an ExtractTable instance with a specified input filename.
+
+    Parameters
+    ----------
+    filename : str
+        Name/path of input file of tabular data to read.
+    column : str | None, optional, default = ``None``
+        Label of column to use as index for extracted table.
+    value : str | List[str] | None, optional, default = ``None``
+        Value(s) of specified column in rows to extract.
+    max_memory : int | None, optional, default = ``None``
+        Memory budget, in bytes, for reading the file. See
+        ``extract.ExtractTable.__init__``.
+    backend : str, optional, default = ``'pandas'``
+        Library holding the table, ``'pandas'``, ``'dask'``, 
+        ``'duckdb'`` or ``'polars'``. See
+        ``extract.ExtractTable.__init__``.
+    repair : bool, optional, default = ``False``
+        If True, invalid geometries are made valid as the file is read.
+
+    Returns
+    -------
+    extract.ExtractTable
+
+    Examples
+    --------
+    >>> et1 = extract.read_file('example/input.shp')
+
+    >>> et2 = extract.read_file('example/file.csv', column='ID')
+
+    >>> et3 = extract.read_file('in.shp', column='foo', value='bar')
+
+    >>> et4 = extract.read_file('in.csv', column='X', value=['1','3'])
+
+    >>> et5 = extract.read_file('in.csv', 'X', '1', max_memory=10 ** 9)
+
+    >>> et6 = extract.read_file('huge.shp', 'X', '1', backend='dask')
+
+    >>> et7 = extract.read_file('precincts.shp', repair=True)
+
+    """
+    return ExtractTable(filename, None, column=column, value=value,
+                        max_memory=max_memory, backend=backend, repair=repair)
+
+
+async def aread_file(
+            filename:   str, 
+            column:     Optional[str] = None, 
+            value:      Optional[Union[str, List[str]]] = None,
+            max_memory: Optional[int] = None,
+            backend:    Optional[str] = 'pandas',
+            executor:   Optional[concurrent.futures.Executor] = None
+            ) -> ExtractTable:
+    """
+    Asynchronously returns an ExtractTable instance with a specified input
+    filename. Reads and parses the file on the given executor, so the event
+    loop is not blocked and many files can be read concurrently.
+
+    The read cannot be interrupted once started. If the awaiting task is 
+    cancelled, ``asyncio.CancelledError`` is raised at once, a read that has
+    not yet started is skipped, and the result of a running read is 
+    discarded.
+
+    Parameters
+    ----------
+    filename : str
+        Name/path of input file of tabular data to read.
+    column : str | None, optional, default = ``None``
+        Label of column to use as index for extracted table.
+    value : str | List[str] | None, optional, default = ``None``
+        Value(s) of specified column in rows to extract.
+    max_memory : int | None, optional, default = ``None``
+        Memory budget, in bytes, for reading the file. See
+        ``extract.ExtractTable.__init__``.
+    backend : str, optional, default = ``'pandas'``
+        Library holding the table, ``'pandas'``, ``'dask'``, 
+        ``'duckdb'`` or ``'polars'``. See
+        ``extract.ExtractTable.__init__``.
+    executor : concurrent.futures.Executor | None, optional
+        Executor to run on. Defaults to the event loop's default executor,
+        a thread pool with a bounded number of workers. Pass a 
+        ``concurrent.futures.ThreadPoolExecutor`` to choose the bound.
+
+    Returns
+    -------
+    extract.ExtractTable
+
+    See Also
+    --------
+    extract.read_file
+
+    Examples
+    --------
+    >>> et1 = await extract.aread_file('example/input.shp')
+
+    >>> pool = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+    >>> ets = await asyncio.gather(
+    ...         *(extract.aread_file(f, 'ID', executor=pool) for f in files))
+    # reads the files concurrently, at most 4 at a time
+
+    """
+    import asyncio
+    import functools
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+                executor, 
+                functools.partial(read_file, filename, column, value, 
+                                  max_memory, backend))
+
+
+def iter_chunks(filename:  str, 
+                chunksize: Optional[int] = 100000,
+                columns:   Optional[List[str]] = None
+                ) -> Iterator[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    """
+    Reads the given file chunk by chunk, yielding tables of at most 
+    chunksize rows, so that files larger than memory can be processed. 
+    Only one chunk is held in memory at a time.
+
+    ``.csv`` files are read with pandas, and geometries stored in their 
+    'geometry' column as text are parsed. ``.parquet`` files are read 
+    with the optional ``pyarrow`` package. Spatial files, e.g. ``.shp``, 
+    ``.geojson`` and ``.gpkg``, are read feature by feature with Fiona. 
+    ``.zip`` files are unzipped and their first readable file is read, 
+    preferring spatial files. Other files are read whole, then split.
+
+    Parameters
+    ----------
+    filename : str
+        Name/path of input file of tabular data to read.
+    chunksize : int, optional, default = ``100000``
+        Maximum number of rows per chunk.
+    columns : List[str] | None, optional, default = ``None``
+        Columns to read. If ``None``, reads all columns. The geometries of
+        spatial files are always read.
+
+    Yields
+    ------
+    pd.DataFrame | gpd.GeoDataFrame
+        Consecutive chunks of the file's table, with a RangeIndex 
+        continuing from the previous chunk. Chunks with geometries are
+        GeoDataFrames. As with ``extract.read_file``, chunks of a file 
+        without geometries get a 'geometry' column of missing values, 
+        unless columns are given without 'geometry'.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the file cannot be read.
+    ImportError
+        Raised if reading a ``.parquet`` file without ``pyarrow``.
+
+    See Also
+    --------
+    extract.read_file
+
+    Examples
+    --------
+    >>> total = 0
+    >>> for chunk in extract.iter_chunks('huge.csv', columns=['votes']):
+    ...     total += chunk['votes'].sum()
+    # sums a column of a file larger than memory
+
+    >>> for chunk in extract.iter_chunks('precincts.shp', chunksize=1000):
+    ...     print(chunk.geometry.is_valid.all())
+
+    """
+    if not os.path.isfile(filename):
+        raise FileNotFoundError("{} not found".format(filename))
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == '.csv':
+        chunks = __iter_csv(filename, chunksize, columns)
+    elif ext == '.parquet':
+        chunks = __iter_parquet(filename, chunksize, columns)
+    elif ext == '.zip':
+        chunks = __iter_zip(filename, chunksize, columns)
+    elif ext in ('.xlsx', '.pkl', '.bz2', '.gzip', '.xz', '.html', '.json'):
+        chunks = __iter_whole(filename, chunksize, columns)
+    else:
+        chunks = __iter_features(filename, chunksize, columns)
+
+    start = 0
+    for chunk in chunks:
+        chunk.index = range(start, start + len(chunk))
+        start += len(chunk)
+        if 'geometry' not in chunk.columns and \
+           (columns is None or 'geometry' in columns):
+            chunk = __with_missing_geometries(chunk)
+        yield chunk
+
+
+def __with_missing_geometries(df: pd.DataFrame) -> gpd.GeoDataFrame:
+    import geopandas as gpd
+
+    return gpd.GeoDataFrame(df, geometry=gpd.GeoSeries([None] * len(df), 
+                                                       index=df.index))
+
+
+def __iter_csv(filename:  str, 
+               chunksize: int, 
+               columns:   Optional[List[str]]
+               ) -> Iterator[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    import pandas as pd
+
+    usecols = None if columns is None else (lambda column: column in columns)
+    if columns is not None and \
+       not set(__read_csv_header(filename)).intersection(columns):
+        usecols = [0] # rows are only counted if a column is read
+
+    yielded = 0
+    for encoding in (None, 'ISO-8859-1'): # as read by ExtractTable
+        try:
+            with pd.read_csv(filename, chunksize=chunksize, usecols=usecols,
+                             encoding=encoding) as reader:
+                for (i, chunk) in enumerate(reader):
+                    if i >= yielded: # else yielded before a decoding error
+                        yielded += 1
+                        if columns is not None:
+                            chunk = chunk[[c for c in chunk.columns 
+                                           if c in columns]]
+                        yield __parse_wkt(chunk)
+            return
+        except UnicodeDecodeError:
+            if encoding is not None:
+                raise
+
+
+def __parse_wkt(df: pd.DataFrame) -> Union[pd.DataFrame, gpd.GeoDataFrame]:
+    if 'geometry' not in df.columns:
+        return df
+
+    import geopandas as gpd
+
+    try:
+        return gpd.GeoDataFrame(
+                    df, geometry=gpd.GeoSeries.from_wkt(df['geometry']))
+    except Exception: # not text geometries
+        return df
+
+
+def __iter_parquet(filename:  str, 
+                   chunksize: int, 
+                   columns:   Optional[List[str]]) -> Iterator[pd.DataFrame]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading .parquet files in chunks requires "
+                          "pyarrow. Run 'pip install pyarrow'")
+
+    parquet = pq.ParquetFile(filename)
+    if columns is not None:
+        columns = [c for c in parquet.schema_arrow.names if c in columns]
+    for batch in parquet.iter_batches(batch_size=chunksize, columns=columns):
+        yield batch.to_pandas()
+
+
+def __iter_features(filename:  str, 
+                    chunksize: int, 
+                    columns:   Optional[List[str]]
+                    ) -> Iterator[gpd.GeoDataFrame]:
+    import fiona
+    import geopandas as gpd
+
+    def to_gdf(features, source):
+        gdf = gpd.GeoDataFrame.from_features(
+                    features, crs=source.crs_wkt or None,
+                    columns=list(source.schema['properties']) + ['geometry'])
+        if columns is not None:
+            gdf = gdf[[c for c in gdf.columns 
+                       if c in columns or c == 'geometry']]
+        return gdf
+
+    try:
+        source = fiona.open(filename)
+    except Exception as e:
+        raise FileNotFoundError("Cannot read {}. {}".format(filename, e))
+
+    with source:
+        features = []
+        for feature in source:
+            features.append(feature)
+            if len(features) == chunksize:
+                yield to_gdf(features, source)
+                features = []
+        if features:
+            yield to_gdf(features, source)
+
+
+def __iter_zip(filename:  str, 
+               chunksize: int, 
+               columns:   Optional[List[str]]
+               ) -> Iterator[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    (member, _) = __read_zip_columns(filename)
+    directory = os.path.splitext(filename)[0]
+    with zipfile.ZipFile(filename, 'r') as zipped:
+        zipped.extractall(directory)
+
+    yield from iter_chunks(os.path.join(directory, member), chunksize, 
+                           columns)
+
+
+def __zip_members(names: List[str]) -> List[str]:
+    """
+    Given the names of the members of a zipfile, or of the files it unzips
+    to, returns its top-level files in the order they are read: spatial 
+    files first, then tables, then other files, each by name.
+
+    """
+    preferred = ['.shp', '.gpkg', '.geojson', '.csv', '.parquet']
+
+    def rank(name: str) -> Tuple[int, str]:
+        ext = os.path.splitext(name)[1].lower()
+        return (preferred.index(ext) if ext in preferred else len(preferred),
+                name)
+
+    return sorted([name for name in names if '/' not in name], key=rank)
 
-        elif value is not None:
-            try: # value is a singleton
-                self.__extracted = \
-                    self.__table[self.__table[self.column] == value]
-            except: # value is a list
-                self.__extracted = \
-                    self.__table[self.__table[self.column].isin(value)]
 
-            if self.__extracted.empty:
-                raise KeyError(
-                    "Column '{}' has no value '{}'".format(self.column, value))
-            else:
-                self.__value = value
+def __iter_whole(filename:  str, 
+                 chunksize: int, 
+                 columns:   Optional[List[str]]
+                 ) -> Iterator[Union[pd.DataFrame, gpd.GeoDataFrame]]:
+    table = read_file(filename).extract()
+    if columns is not None:
+        table = table[[c for c in table.columns if c in columns]]
+    for start in range(0, len(table), chunksize):
+        yield table.iloc[start:start + chunksize]
+
+
+def read_columns(filename: str) -> List[str]:
+    """
+    Returns the names of the columns of the given file, reading only its 
+    header or schema rather than its rows, so that the columns of many or 
+    large files can be listed quickly.
+
+    Reads the first line of ``.csv`` files, the DBF header of shapefiles 
+    (``.shp`` and ``.dbf``), the footer of ``.parquet`` files, with the 
+    optional ``pyarrow`` package, and the layer schema of other spatial 
+    files, e.g. ``.geojson`` and ``.gpkg``. The columns of spatial files 
+    end with ``'geometry'``. Of a ``.zip`` file, the top-level member 
+    ``extract.iter_chunks`` would read is read, preferring spatial files,
+    without unzipping the other members. Other files are read whole.
+
+    Parameters
+    ----------
+    filename : str
+        Name/path of input file of tabular data.
+
+    Returns
+    -------
+    List[str]
+        Names of the file's columns, in the file's order.
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if the file cannot be read.
+    ImportError
+        Raised if reading a ``.parquet`` file without ``pyarrow``.
+
+    See Also
+    --------
+    extract.ExtractTable.list_columns
+
+    Examples
+    --------
+    >>> print(extract.read_columns('precincts.zip'))
+    ['ID', 'NAME', 'TOTPOP', 'geometry']
+
+    >>> print(extract.read_columns('input.csv'))
+    ['Unnamed: 0', 'col1', 'col2']
+
+    """
+    import pandas as pd
+
+    if not os.path.isfile(filename):
+        raise FileNotFoundError("{} not found".format(filename))
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == '.csv':
+        return __read_csv_header(filename)
+    elif ext in ('.shp', '.dbf'):
+        dbf = os.path.splitext(filename)[0] + '.dbf'
+        if ext == '.shp' and not os.path.isfile(dbf):
+            return __read_schema(filename)
+        with open(dbf, 'rb') as infile:
+            names = __read_dbf_header(infile)
+        return names + ['geometry'] if ext == '.shp' else names
+    elif ext == '.parquet':
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Reading the schema of .parquet files requires "
+                              "pyarrow. Run 'pip install pyarrow'")
+        return pq.read_schema(filename).names
+    elif ext == '.zip':
+        return __read_zip_columns(filename)[1]
+    elif ext == '.xlsx':
+        return [str(column) for column in 
+                pd.read_excel(filename, nrows=0).columns]
+    elif ext in ('.pkl', '.bz2', '.gzip', '.xz', '.html', '.json'):
+        return [str(column) for column in 
+                read_file(filename).extract().columns]
+    else:
+        return __read_schema(filename)
+
+
+def __read_csv_header(infile: Union[str, IO[bytes]]) -> List[str]:
+    import pandas as pd
+
+    for encoding in (None, 'ISO-8859-1'): # as read by ExtractTable
+        try:
+            if hasattr(infile, 'seek'):
+                infile.seek(0)
+            return [str(column) for column in 
+                    pd.read_csv(infile, nrows=0, encoding=encoding).columns]
+        except UnicodeDecodeError:
+            if encoding is not None:
+                raise
+
+
+def __read_dbf_header(infile: IO[bytes]) -> List[str]:
+    import struct
+
+    header = infile.read(32)
+    if len(header) < 32:
+        raise FileNotFoundError("Cannot read DBF header")
+    (header_length,) = struct.unpack('<H', header[8:10])
+
+    names = []
+    for _ in range((header_length - 33) // 32):
+        field = infile.read(32)
+        if len(field) < 32 or field[0] == 0x0D: # end of field descriptors
+            break
+        name = field[:11].split(b'\x00')[0]
+        try:
+            names.append(name.decode('utf-8'))
+        except UnicodeDecodeError:
+            names.append(name.decode('ISO-8859-1'))
+    return names
+
+
+def __read_schema(filename: str) -> List[str]:
+    import fiona
+
+    try:
+        with fiona.open(filename) as source:
+            return list(source.schema['properties']) + ['geometry']
+    except Exception as e:
+        raise FileNotFoundError("Cannot read {}. {}".format(filename, e))
+
+
+def zip_member(filename: str) -> str:
+    """
+    Returns the name of the member of the given zipfile that 
+    ``extract.iter_chunks`` and ``extract.read_columns`` read: the first 
+    top-level file whose columns can be read, preferring spatial files 
+    (``.shp``, ``.gpkg``, ``.geojson``), then ``.csv`` and ``.parquet`` 
+    files, then other files, each by name.
+
+    Parameters
+    ----------
+    filename : str
+        Name/path of a ``.zip`` file.
+
+    Returns
+    -------
+    str
+
+    Raises
+    ------
+    FileNotFoundError
+        Raised if no member of the zipfile can be read.
+
+    See Also
+    --------
+    extract.iter_chunks
+    extract.read_columns
+
+    Examples
+    --------
+    >>> extract.zip_member('precincts.zip')
+    'precincts.shp'
+
+    """
+    return __read_zip_columns(filename)[0]
+
+
+def __read_zip_columns(filename: str) -> Tuple[str, List[str]]:
+    """
+    Returns the member of the given zipfile that is read, and its columns.
+
+    """
+    with zipfile.ZipFile(filename, 'r') as zipped:
+        members = __zip_members(zipped.namelist())
+        for member in members:
+            ext = os.path.splitext(member)[1].lower()
+            try:
+                if ext == '.shp':
+                    dbf = os.path.splitext(member)[0] + '.dbf'
+                    dbf = next(m for m in members if m.lower() == dbf.lower())
+                    with zipped.open(dbf) as infile:
+                        columns = __read_dbf_header(infile) + ['geometry']
+                elif ext == '.csv':
+                    with zipped.open(member) as infile:
+                        columns = __read_csv_header(infile)
+                elif ext == '.parquet':
+                    import pyarrow.parquet as pq
+                    with zipped.open(member) as infile:
+                        columns = pq.read_schema(infile).names
+                elif ext in ('.gpkg', '.geojson'):
+                    columns = __read_schema('zip://{}!{}'.format(
+                                    os.path.abspath(filename), member))
+                else: # e.g. .xlsx files are read whole
+                    import tempfile
+
+                    with tempfile.TemporaryDirectory() as directory:
+                        columns = read_columns(zipped.extract(member, 
+                                                              directory))
+            except ImportError:
+                raise
+            except Exception:
+                continue
+            return (member, columns)
+
+    raise FileNotFoundError("No readable file found in {}".format(filename))
 
 
 
 #########################################
 #                                       #
-#       Module Functions                #
+#       Warm Server                     #
 #                                       #
 #########################################
 
-def read_file(filename: str, 
-              column:   Optional[str] = None, 
-              value:    Optional[Union[str, List[str]]] = None):
+def serve(address: str, 
+          max_tables: Optional[int] = 8,
+          timeout: Optional[float] = 5.0) -> NoReturn:
     """
-    Returns an ExtractTable instance with a specified input filename.
+    Runs a local extraction server listening on the given Unix socket.
+    
+    The server keeps recently read tables in memory so that repeated
+    extractions from the same input files skip interpreter startup,
+    dependency imports, and file reads. A cached table is re-read if its
+    file's modification time or size changes. Requests are sent using
+    ``extract.send_request`` or the script's ``--connect`` option. The
+    socket is only accessible to the current user. Runs until interrupted.
 
     Parameters
     ----------
-    filename : str
-        Name/path of input file of tabular data to read.
+    address : str
+        Path of the Unix socket on which to listen.
+    max_tables : int, optional, default = ``8``
+        Maximum number of tables to keep in memory. The least recently
+        used table is evicted first.
+    timeout : float, optional, default = ``5.0``
+        Seconds to wait on a client connection before dropping it, so that
+        a stalled client cannot block later requests.
+
+    Raises
+    ------
+    RuntimeError
+        Raised if another server is already listening on the socket.
+    FileExistsError
+        Raised if the given address exists and is not a socket.
+
+    See Also
+    --------
+    extract.send_request
+
+    Examples
+    --------
+    >>> extract.serve('/tmp/extract.sock')
+    # serves extraction requests until interrupted
+
+    """
+    import collections
+    import contextlib
+    import io
+    import json
+    import signal
+    import socket
+    import socketserver
+    import stat
+    import threading
+
+    address = os.path.abspath(address) # requests change the cwd
+    tables = collections.OrderedDict()
+
+    def load(infile: str, max_memory: Optional[int]) -> gpd.GeoDataFrame:
+        infile = os.path.abspath(infile)
+        fstat = os.stat(infile)
+        fingerprint = (fstat.st_mtime_ns, fstat.st_size)
+
+        if infile in tables and tables[infile][0] == fingerprint:
+            tables.move_to_end(infile)
+        else:
+            tables[infile] = (fingerprint, ExtractTable(
+                                    infile, max_memory=max_memory).extract())
+            while len(tables) > max_tables:
+                tables.popitem(last=False)
+
+        return tables[infile][1]
+
+    def is_socket(path: str) -> bool:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            (out, err) = (io.StringIO(), io.StringIO())
+            cwd = os.getcwd()
+            try:
+                with contextlib.redirect_stdout(out), \
+                     contextlib.redirect_stderr(err):
+                    req = json.loads(self.rfile.read().decode())
+                    os.chdir(req['cwd']) # requests are handled one at a time
+                    args = parse_arguments(req['argv'])
+
+                    try:
+                        table = load(args.infile, args.max_memory)
+                    except (OSError, MemoryError): # read directly, as usual
+                        table = args.infile
+
+                    et = ExtractTable(table, args.outfile, args.column, 
+                                      args.value, args.max_memory, 
+                                      repair=args.repair)
+                    et.extract_to_file()
+                    if args.profile:
+                        print(json.dumps(et.stats), file=err)
+            except SystemExit: # argparse reports errors to stderr
+                pass
+            except Exception as e: # reported on stdout, as by the script
+                out.write('{}\n'.format(e))
+            finally:
+                os.chdir(cwd)
+
+            self.wfile.write(json.dumps({'stdout': out.getvalue(),
+                                         'stderr': err.getvalue()}).encode())
+
+    Handler.timeout = timeout
+
+    if os.path.exists(address) and not is_socket(address):
+        raise FileExistsError("{} exists and is not a socket".format(address))
+    elif os.path.exists(address):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(address)
+                raise RuntimeError(
+                        "A server is already listening on {}".format(address))
+            except (ConnectionRefusedError, FileNotFoundError):
+                os.remove(address) # stale socket from an unclean shutdown
+
+    umask = os.umask(0o177)
+    try:
+        server = socketserver.UnixStreamServer(address, Handler)
+    finally:
+        os.umask(umask)
+
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit())
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(address) and is_socket(address):
+            os.remove(address)
+
+
+def send_request(address: str, 
+                 argv: List[str], 
+                 cwd: Optional[str] = None
+                 ) -> Tuple[str, str]:
+    """
+    Sends command-line arguments to a server started with ``extract.serve``
+    and returns a tuple of the text the extraction wrote to stdout and to
+    stderr.
+
+    Parameters
+    ----------
+    address : str
+        Path of the Unix socket on which the server listens.
+    argv : List[str]
+        Command-line arguments of the ``extract.py`` script.
+    cwd : str | None, optional, default = ``None``
+        Directory against which relative paths in argv are resolved.
+        Defaults to the current working directory.
+    
+    Returns
+    -------
+    Tuple[str, str]
+        The server's stdout (left) and stderr (right) output.
+
+    Raises
+    ------
+    ConnectionError
+        Raised if unable to reach the server.
+
+    See Also
+    --------
+    extract.serve
+
+    Examples
+    --------
+    >>> (out, err) = extract.send_request('/tmp/extract.sock', 
+    ...                                   ['in.csv', '-c', 'col1', '-v', 'c'])
+    >>> print(out)
+         Unnamed: 0 col2
+    col1                      
+    c          fdsa    d
+    c          lkjh    3
+
+    """
+    import json
+    import socket
+
+    req = json.dumps({'argv': argv, 'cwd': cwd or os.getcwd()}).encode()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        sock.sendall(req)
+        sock.shutdown(socket.SHUT_WR)
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+    res = json.loads(b''.join(chunks).decode())
+    return (res['stdout'], res['stderr'])
+
+
+
+#########################################
+#                                       #
+#       Incremental Extraction          #
+#                                       #
+#########################################
+
+def is_up_to_date(infile:  str, 
+                  outfile: str, 
+                  column:  Optional[str] = None, 
+                  value:   Optional[Union[str, List[str]]] = None, 
+                  driver:  Optional[str] = None,
+                  repair:  Optional[bool] = False) -> bool:
+    """
+    Returns True if the given output was written by an incremental 
+    extraction from the same input file with the same options, and neither
+    file has changed since. Reads no tabular data, so can be checked before
+    reading a large input file.
+
+    The fingerprint recorded next to the output, in ``<outfile>.extract.json``,
+    holds the input's size, modification time and SHA-256 hash, the output's
+    size and modification time, and the extraction options. A shapefile's
+    ``.dbf``, ``.shx``, ``.prj`` and ``.cpg`` files are fingerprinted with
+    it. An input whose modification time changed but whose contents did not
+    (e.g. a fresh copy) is still up to date.
+
+    Parameters
+    ----------
+    infile : str
+        Name/path of input file of tabular data.
+    outfile : str
+        Name/path of output file.
     column : str | None, optional, default = ``None``
-        Label of column to use as index for extracted table.
+        Label of column used as index for the extracted table.
     value : str | List[str] | None, optional, default = ``None``
-        Value(s) of specified column in rows to extract.
+        Value(s) of column in rows extracted.
+    driver : str | None, optional, default = ``None``
+        Name of Fiona supported OGR driver used for file writing.
+    repair : bool, optional, default = ``False``
+        Whether invalid geometries were repaired when read.
 
     Returns
     -------
-    extract.ExtractTable
+    bool
+
+    See Also
+    --------
+    extract.mark_up_to_date
+    extract.ExtractTable.extract_to_file
 
     Examples
     --------
-    >>> et1 = extract.read_file('example/input.shp')
+    >>> if not extract.is_up_to_date('in.shp', 'out.csv', 'ID', '01'):
+    ...     et = extract.ExtractTable('in.shp', 'out.csv', 'ID', '01')
+    ...     et.extract_to_file(incremental=True)
 
-    >>> et2 = extract.read_file('example/file.csv', column='ID')
+    """
+    import json
 
-    >>> et3 = extract.read_file('in.shp', column='foo', value='bar')
+    try:
+        with open(__sidecar(outfile)) as sidecar:
+            recorded = json.load(sidecar)
+        current = fingerprint_input(infile, hashed=False)
+        outstat = os.stat(outfile)
+    except (OSError, ValueError):
+        return False
+
+    if recorded.get('options') != __options(outfile, column, value, driver,
+                                            repair):
+        return False
+    elif recorded.get('outfile') != [outstat.st_size, outstat.st_mtime_ns]:
+        return False
+
+    (recorded, current) = (__file_fields(recorded), __file_fields(current))
+    if recorded.keys() != current.keys():
+        return False
+    elif all(recorded[part][:2] == current[part][:2] for part in current):
+        return True
+    elif any(recorded[part][0] != current[part][0] for part in current):
+        return False
+    else:
+        try:
+            hashed = __file_fields(fingerprint_input(infile))
+        except OSError:
+            return False
+        return all(recorded[part][2] == hashed[part][2] for part in current)
+
+
+def mark_up_to_date(infile:      str, 
+                    outfile:     str, 
+                    column:      Optional[str] = None, 
+                    value:       Optional[Union[str, List[str]]] = None, 
+                    driver:      Optional[str] = None,
+                    repair:      Optional[bool] = False,
+                    fingerprint: Optional[Dict[str, Any]] = None
+                    ) -> NoReturn:
+    """
+    Records a fingerprint of the given input file, output file and 
+    extraction options in ``<outfile>.extract.json``, so that 
+    ``extract.is_up_to_date`` returns True until one of them changes.
 
-    >>> et4 = extract.read_file('in.csv', column='X', value=['1','3'])
+    Parameters
+    ----------
+    infile : str
+        Name/path of input file of tabular data.
+    outfile : str
+        Name/path of written output file.
+    column : str | None, optional, default = ``None``
+        Label of column used as index for the extracted table.
+    value : str | List[str] | None, optional, default = ``None``
+        Value(s) of column in rows extracted.
+    driver : str | None, optional, default = ``None``
+        Name of Fiona supported OGR driver used for file writing.
+    repair : bool, optional, default = ``False``
+        Whether invalid geometries were repaired when read.
+    fingerprint : Dict[str, Any] | None, optional, default = ``None``
+        Fingerprint of the input taken by ``extract.fingerprint_input`` 
+        before the input was read, so that changes made to the input while
+        it was read leave the output out of date. Defaults to a fingerprint
+        taken now. Hashes missing from an unhashed fingerprint are taken 
+        now if the input is unchanged since, and are otherwise recorded as
+        ``None``, which leaves the output out of date.
+
+    See Also
+    --------
+    extract.is_up_to_date
+    extract.fingerprint_input
+
+    Examples
+    --------
+    >>> fingerprint = extract.fingerprint_input('in.shp')
+    >>> et = extract.ExtractTable('in.shp', 'out.csv', 'ID', '01')
+    >>> et.extract_to_file()
+    >>> extract.mark_up_to_date('in.shp', 'out.csv', 'ID', '01', 
+    ...                         fingerprint=fingerprint)
+
+    """
+    import json
+
+    if fingerprint is None:
+        fingerprint = fingerprint_input(infile)
+    elif all(fields[2] is None 
+             for fields in __file_fields(fingerprint).values()) and \
+         fingerprint_input(infile, hashed=False) == fingerprint:
+        fingerprint = fingerprint_input(infile)
+
+    outstat = os.stat(outfile)
+    recorded = dict(fingerprint, 
+                    outfile=[outstat.st_size, outstat.st_mtime_ns],
+                    options=__options(outfile, column, value, driver, 
+                                      repair))
+
+    with open(__sidecar(outfile), 'w') as sidecar:
+        json.dump(recorded, sidecar)
+
+
+def fingerprint_input(infile: str, 
+                      hashed: Optional[bool] = True) -> Dict[str, Any]:
+    """
+    Returns the fingerprint of the given input file recorded by 
+    ``extract.mark_up_to_date``: the size, modification time and SHA-256 
+    hash of the file and, for a shapefile, of its ``.dbf``, ``.shx``, 
+    ``.prj`` and ``.cpg`` files.
+
+    Parameters
+    ----------
+    infile : str
+        Name/path of input file of tabular data.
+    hashed : bool, optional, default = ``True``
+        Whether files are hashed. If ``False``, hashes are ``None``, which
+        only takes a ``stat`` of each file.
+
+    Returns
+    -------
+    Dict[str, Any]
+
+    Raises
+    ------
+    OSError
+        Raised if the input file cannot be found.
+
+    See Also
+    --------
+    extract.mark_up_to_date
+
+    Examples
+    --------
+    >>> extract.fingerprint_input('in.shp', hashed=False)
+    {'infile': [1024, 1600000000000000000], 'sha256': None, 'sidecars': 
+    {'.dbf': [512, 1600000000000000000, None]}}
+
+    """
+    instat = os.stat(infile)
+    fingerprint = {'infile':    [instat.st_size, instat.st_mtime_ns],
+                   'sha256':    __hash_file(infile) if hashed else None}
+
+    (base, ext) = os.path.splitext(str(infile))
+    if ext.lower() == '.shp':
+        sidecars = {}
+        for part in ['.dbf', '.shx', '.prj', '.cpg']:
+            for filename in [base + part, base + part.upper()]:
+                if os.path.isfile(filename):
+                    stat = os.stat(filename)
+                    sidecars[part] = [stat.st_size, stat.st_mtime_ns, 
+                                      __hash_file(filename) if hashed 
+                                      else None]
+                    break
+        fingerprint['sidecars'] = sidecars
+
+    return fingerprint
+
+
+def __file_fields(fingerprint: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Returns the [size, modification time, hash] of each file of the given
+    fingerprint, keyed by the file's extension ('' for the input itself).
+
+    """
+    fields = {'': list(fingerprint.get('infile') or [None, None]) + 
+                  [fingerprint.get('sha256')]}
+    for (part, recorded) in fingerprint.get('sidecars', {}).items():
+        fields[part] = list(recorded)
+
+    return fields
+
+
+def __sidecar(outfile: str) -> str:
+    return str(outfile).rstrip(os.sep) + '.extract.json'
+
+
+def __options(outfile: str, 
+              column:  Optional[str], 
+              value:   Optional[Union[str, List[str]]], 
+              driver:  Optional[str],
+              repair:  Optional[bool] = False) -> Dict[str, Any]:
+    """
+    Returns the extraction options of a fingerprint, as loaded from JSON.
+    Repairs are only recorded if enabled, so older fingerprints still match.
+
+    """
+    import json
+
+    options = {'format':  os.path.splitext(str(outfile))[1].lower(),
+               'column':  column,
+               'value':   value,
+               'driver':  driver}
+    if repair:
+        options['repair'] = True
+    return json.loads(json.dumps(options, default=str))
+
+
+def __hash_file(filename: str) -> str:
+    import hashlib
+
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as infile:
+        for block in iter(lambda: infile.read(1 << 20), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+
+
+#########################################
+#                                       #
+#       Batch Jobs                      #
+#                                       #
+#########################################
+
+def run_manifest(manifest:    Union[str, List[Dict[str, Any]]],
+                 workers:     Optional[int] = None,
+                 incremental: Optional[bool] = False
+                 ) -> List[Dict[str, Any]]:
+    """
+    Runs a batch of extraction jobs and returns a summary of their outcomes
+    and timings, in the order of the jobs.
+
+    Jobs are grouped by input file so that each file is read once, and the
+    groups are run across a pool of processes. A failing job does not stop
+    the other jobs.
+
+    Parameters
+    ----------
+    manifest : str | List[Dict[str, Any]]
+        Name/path of a ``.json``, ``.yaml`` or ``.yml`` manifest file, or a
+        list of jobs. A manifest file contains either a list of jobs or a 
+        mapping with key ``'jobs'``. Each job is a mapping with keys 
+        ``'infile'`` and ``'outfile'`` (required), and ``'column'``, 
+        ``'value'`` and ``'driver'`` (optional), with the meanings of the 
+        same arguments of ``extract.ExtractTable`` and 
+        ``extract.ExtractTable.extract_to_file``. Relative paths in a
+        manifest file are relative to the manifest's directory.
+    workers : int | None, optional, default = ``None``
+        Number of worker processes. Defaults to the number of CPUs.
+    incremental : bool, optional, default = ``False``
+        If True, skips jobs whose outputs are up to date, and input files
+        all of whose jobs are skipped are not read. See 
+        ``extract.is_up_to_date``.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        A summary for each job: its ``'infile'``, ``'outfile'``, 
+        ``'column'`` and ``'value'``, its ``'status'`` (``'ok'``, 
+        ``'skipped'`` or ``'failed'``), an ``'error'`` message (or 
+        ``None``), the seconds
+        spent reading its input file (``'read_seconds'``, shared by jobs 
+        with the same input), and the seconds spent on the job itself
+        (``'seconds'``).
+
+    Raises
+    ------
+    ValueError
+        Raised if the manifest is malformed.
+    ImportError
+        Raised if reading a YAML manifest without ``PyYAML`` installed.
+
+    Examples
+    --------
+    >>> jobs = [{'infile': 'in.csv', 'outfile': 'a.csv', 'column': 'ID'},
+    ...         {'infile': 'in.csv', 'outfile': 'b.csv', 'column': 'ID',
+    ...          'value': ['01', '02']},
+    ...         {'infile': 'in.shp', 'outfile': 'c.geojson'}]
+    >>> summary = extract.run_manifest(jobs)
+    # reads 'in.csv' once for the first two jobs
+    >>> print([job['status'] for job in summary])
+    ['ok', 'ok', 'ok']
+
+    >>> summary = extract.run_manifest('nightly.yaml', workers=4)
+
+    >>> summary = extract.run_manifest('nightly.yaml', incremental=True)
+    # runs only the jobs whose inputs or options changed since last run
+
+    """
+    import concurrent.futures
+
+    jobs = __load_manifest(manifest)
+    summary = [None] * len(jobs)
+
+    groups = {}
+    for (i, job) in enumerate(jobs):
+        if incremental and is_up_to_date(job['infile'], job['outfile'], 
+                                         job.get('column'), job.get('value'),
+                                         job.get('driver')):
+            summary[i] = {'infile':         job['infile'],
+                          'outfile':        job['outfile'],
+                          'column':         job.get('column'),
+                          'value':          job.get('value'),
+                          'status':         'skipped',
+                          'error':          None,
+                          'read_seconds':   0.0,
+                          'seconds':        0.0}
+        else:
+            groups.setdefault(
+                os.path.abspath(job['infile']), []).append((i, job))
+
+    flags = [incremental] * len(groups)
+    if workers == 1 or len(groups) <= 1:
+        results = list(map(__run_jobs, groups.keys(), groups.values(), flags))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+            results = list(pool.map(__run_jobs, groups.keys(), 
+                                    groups.values(), flags))
+
+    for (i, result) in (item for group in results for item in group):
+        summary[i] = result
+
+    return summary
+
+
+def __load_manifest(manifest: Union[str, List[Dict[str, Any]]]
+                    ) -> List[Dict[str, Any]]:
+    """
+    Returns the validated list of jobs of the given manifest.
+
+    """
+    if isinstance(manifest, str):
+        ext = os.path.splitext(manifest)[1].lower()
+        with open(manifest) as infile:
+            if ext in ('.yaml', '.yml'):
+                try:
+                    import yaml
+                except ImportError:
+                    raise ImportError(
+                        "Reading YAML manifests requires PyYAML. "
+                        "Run 'pip3 install pyyaml' or use a JSON manifest.")
+                loaded = yaml.safe_load(infile)
+            else:
+                import json
+                loaded = json.load(infile)
+
+        jobs = loaded.get('jobs') if isinstance(loaded, dict) else loaded
+        root = os.path.dirname(os.path.abspath(manifest))
+    else:
+        (jobs, root) = (manifest, os.getcwd())
+
+    if not isinstance(jobs, list):
+        raise ValueError("Manifest must contain a list of jobs")
+
+    resolved = []
+    for (i, job) in enumerate(jobs):
+        if not isinstance(job, dict) or 'infile' not in job or \
+           'outfile' not in job:
+            raise ValueError(
+                "Job {} must specify an 'infile' and an 'outfile'".format(i))
+        unknown = set(job) - {'infile', 'outfile', 'column', 'value', 
+                              'driver'}
+        if unknown:
+            raise ValueError("Job {} has unknown keys {}".format(i, unknown))
+
+        resolved.append(dict(job, infile=os.path.join(root, job['infile']),
+                             outfile=os.path.join(root, job['outfile'])))
+
+    return resolved
+
+
+def __run_jobs(infile: str, 
+               jobs: List[Tuple[int, Dict[str, Any]]],
+               incremental: bool
+               ) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Reads the given input file once and runs each of the given numbered
+    jobs on it, fingerprinting their outputs if incremental. Returns a list
+    of numbered job summaries.
 
     """
-    return ExtractTable(filename, None, column=column, value=value)
+    start = time.perf_counter()
+    try:
+        fingerprint = fingerprint_input(infile) if incremental else None
+        (table, error) = (ExtractTable(infile).extract(), None)
+    except Exception as e:
+        (table, error) = (None, str(e))
+    read_seconds = time.perf_counter() - start
+
+    results = []
+    for (i, job) in jobs:
+        start = time.perf_counter()
+        result = {'infile':         job['infile'],
+                  'outfile':        job['outfile'],
+                  'column':         job.get('column'),
+                  'value':          job.get('value'),
+                  'status':         'failed',
+                  'error':          error,
+                  'read_seconds':   read_seconds}
+        if table is not None:
+            try:
+                et = ExtractTable(table, job['outfile'], job.get('column'),
+                                  job.get('value'))
+                et.extract_to_file(driver=job.get('driver'))
+                if incremental:
+                    mark_up_to_date(infile, job['outfile'], job.get('column'),
+                                    job.get('value'), job.get('driver'),
+                                    fingerprint=fingerprint)
+                result['status'] = 'ok'
+            except Exception as e:
+                result['error'] = str(e)
+
+        result['seconds'] = time.perf_counter() - start
+        results.append((i, result))
+
+    return results
 
 
 
@@ -770,10 +3074,15 @@ def read_file(filename: str,
 #                                       #
 #########################################
 
-def parse_arguments() -> argparse.Namespace:
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """
     Parses command-line arguments and returns a Namespace of input values.
 
+    Parameters
+    ----------
+    argv : List[str] | None, optional, default = ``None``
+        Arguments to parse. Defaults to ``sys.argv[1:]``.
+
     Returns
     -------
     An argparse Namespace object
@@ -783,6 +3092,23 @@ def parse_arguments() -> argparse.Namespace:
     column_help = "label of column to use as index for extracted table"
     value_help = "value(s) of specified column in rows to extract"
     outfile_help = "name/path of output file for writing"
+    serve_help = "run a server on Unix socket SOCKET that keeps tables warm"
+    connect_help = "send the extraction to the server on Unix socket SOCKET"
+    profile_help = "write per-stage statistics to stderr as JSON"
+    manifest_help = ("run the extraction jobs in the JSON/YAML file MANIFEST "
+                     "instead of INFILE")
+    workers_help = "number of processes that run MANIFEST's jobs"
+    summary_help = "write MANIFEST's job summary as JSON to SUMMARY"
+    repair_help = "make invalid geometries valid, in parallel, when read"
+    incremental_help = ("skip outputs that are up to date with their input "
+                        "and options, recording a fingerprint next to each")
+    max_memory_help = ("memory budget for reading INFILE, e.g. 512M or 2G; "
+                       "larger .csv files are filtered in chunks, others fail")
+    backend_help = ("library holding the table; 'dask' processes INFILE in "
+                    "partitions across all cores, 'duckdb' scans .csv and "
+                    ".parquet files for the rows to extract, 'polars' "
+                    "processes .csv files without geometries in parallel "
+                    "(default: pandas)")
 
     description = """Script to extract tabular data. 
 
@@ -793,7 +3119,7 @@ are specified, outputs subtable indexed with given column and containing
 only rows equal to given value(s).
 
 supported input filetypes:
-    .csv .geojson .shp .xlsx .zip
+    .csv .geojson .parquet .shp .xlsx .zip
 
 supported output filetypes:
     .bz2 .csv .geojson .gpkg .gzip .html .json .md .pkl .tex .xlsx .zip 
@@ -804,7 +3130,13 @@ supported output filetypes:
     python extract.py input.xlsx -c ID > output.csv
     python extract.py foo.csv -o bar.csv -c "state fips" -v 01
     python extract.py input.csv -o ../output.csv -c Name -v "Rick Astley"
-    python extract.py in.csv -o out.csv -c NUM -v 0 1 2 3"""
+    python extract.py in.csv -o out.csv -c NUM -v 0 1 2 3
+    python extract.py big.csv -o out.csv -c ID -v 01 --max-memory 2G
+    python extract.py in.shp -o out.csv -c ID -v 01 --incremental
+    python extract.py precincts.shp -o repaired.shp --repair
+    python extract.py --manifest nightly.yaml --workers 8 --summary out.json
+    python extract.py --serve /tmp/extract.sock &
+    python extract.py in.csv -c NUM -v 0 --connect /tmp/extract.sock"""
 
     parser = argparse.ArgumentParser(
                 description=description,
@@ -813,6 +3145,7 @@ supported output filetypes:
     parser.add_argument(
                 'infile',
                 metavar='INFILE', 
+                nargs='?',
                 help=infile_help)
     parser.add_argument(
                 '-o', 
@@ -836,8 +3169,89 @@ supported output filetypes:
                 type=str,
                 nargs='+',
                 help=value_help)
+    parser.add_argument(
+                '--max-memory',
+                dest='max_memory',
+                metavar='SIZE',
+                type=__parse_memory_size,
+                help=max_memory_help)
+    parser.add_argument(
+                '--backend',
+                dest='backend',
+                choices=['pandas', 'dask', 'duckdb', 'polars'],
+                default='pandas',
+                help=backend_help)
+    parser.add_argument(
+                '--repair',
+                dest='repair',
+                action='store_true',
+                help=repair_help)
+    parser.add_argument(
+                '--manifest',
+                dest='manifest',
+                metavar='MANIFEST',
+                type=str,
+                help=manifest_help)
+    parser.add_argument(
+                '--workers',
+                dest='workers',
+                metavar='N',
+                type=int,
+                help=workers_help)
+    parser.add_argument(
+                '--summary',
+                dest='summary',
+                metavar='SUMMARY',
+                type=str,
+                help=summary_help)
+    parser.add_argument(
+                '--incremental',
+                dest='incremental',
+                action='store_true',
+                help=incremental_help)
+    parser.add_argument(
+                '--profile',
+                dest='profile',
+                action='store_true',
+                help=profile_help)
+    parser.add_argument(
+                '--serve',
+                dest='serve',
+                metavar='SOCKET',
+                type=str,
+                help=serve_help)
+    parser.add_argument(
+                '--connect',
+                dest='connect',
+                metavar='SOCKET',
+                type=str,
+                help=connect_help)
+
+    args = parser.parse_args(argv)
+    if args.infile is None and args.serve is None and args.manifest is None:
+        parser.error("the following arguments are required: INFILE")
+
+    return args
+
+
+def __parse_memory_size(size: str) -> int:
+    """
+    Given a size such as ``'512M'``, ``'2G'``, ``'1.5GB'`` or ``'1048576'``,
+    returns the number of bytes. Suffixes are powers of 1024.
+
+    """
+    units = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 
+             'T': 1024 ** 4}
+    text = size.strip().upper()
+    if text.endswith('B'):
+        text = text[:-1]
 
-    return parser.parse_args()
+    unit = text[-1:] if text[-1:] in units else ''
+    try:
+        return int(float(text[:len(text) - len(unit)]) * units[unit])
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+                "invalid memory size '{}'; e.g. 512M or 2G".format(size))
 
 
 
@@ -855,11 +3269,45 @@ def main() -> NoReturn:
     column = args.column
     value = args.value
 
-    try:
-        et = ExtractTable(infile, outfile, column, value)
-        et.extract_to_file()
-    except Exception as e:
-        print(e)
+    if args.serve is not None:
+        serve(args.serve)
+
+    elif args.manifest is not None:
+        import json
+
+        try:
+            summary = run_manifest(args.manifest, args.workers, 
+                                   args.incremental)
+            if args.summary is None:
+                print(json.dumps(summary, indent=2))
+            else:
+                with open(args.summary, 'w') as outfile:
+                    json.dump(summary, outfile, indent=2)
+        except Exception as e:
+            print(e)
+
+    elif args.connect is not None:
+        try:
+            (out, err) = send_request(args.connect, sys.argv[1:])
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+        except Exception as e:
+            print(e)
+
+    elif args.incremental and outfile is not None and \
+         is_up_to_date(infile, outfile, column, value, repair=args.repair):
+        print("'{}' is up to date".format(outfile))
+
+    else:
+        try:
+            et = ExtractTable(infile, outfile, column, value, args.max_memory,
+                              args.backend, args.repair)
+            et.extract_to_file(incremental=args.incremental)
+            if args.profile:
+                import json
+                print(json.dumps(et.stats), file=sys.stderr)
+        except Exception as e:
+            print(e)
 
     sys.exit()
 
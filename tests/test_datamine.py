@@ -1,6 +1,9 @@
+import pandas as pd
 import os
 import json
+import shutil
 import subprocess
+import zipfile
 
 import pytest
 
@@ -205,3 +208,55 @@ def test_remove_repos():
 
     dm.remove_repos(os.path.join('tests', 'dumps')) # should not raise anything
 
+
+def test_catalog(tmp_path):
+    catalog = str(tmp_path / 'catalog.db')
+    data = tmp_path / 'data'
+    data.mkdir()
+    shutil.copy(os.path.join('tests', 'inputs', 'CT_precincts.zip'), data)
+    shutil.copy(os.path.join('tests', 'inputs', 'test1.csv'), data)
+    (data / 'bad.shp').write_text('not a shapefile')
+    (zipped, csv, bad) = [str(data / file) for file in 
+                          ['CT_precincts.zip', 'test1.csv', 'bad.shp']]
+
+    with pytest.raises(FileNotFoundError):
+        dm.read_catalog(catalog)
+    assert dm.build_catalog(catalog, data) == {
+        'added': 3, 'updated': 0, 'unchanged': 0, 'removed': 0, 'failed': 1}
+
+    files = dm.read_catalog(catalog).set_index('path')
+    assert files.index.tolist() == [zipped, bad, csv]
+    assert files.loc[zipped, 'rows'] == 739
+    assert files.loc[zipped, 'crs'] == 'EPSG:26956'
+    assert files.loc[zipped, 'columns'][-1] == 'geometry'
+    assert files.loc[csv, 'columns'] == ['Unnamed: 0', 'col1', 'col2']
+    assert files.loc[csv, 'rows'] == 5
+    assert files.loc[bad, 'error'] is not None
+    assert files.loc[bad, 'rows'] is pd.NA
+
+    assert dm.files_with_columns(catalog, ['AG18D', 'geometry']) == [zipped]
+    assert dm.files_with_columns(catalog, ['AG18D', 'col1'], 
+                                 match_all=False) == [zipped, csv]
+    assert dm.files_with_columns(catalog, ['AG18D', 'col1']) == []
+    assert dm.files_intersecting(catalog, (3e5, 2e5, 3e5, 2e5)) == [zipped]
+    assert dm.files_intersecting(catalog, (3e5, 2e5, 3e5, 2e5), 
+                                 crs='EPSG:4269') == []
+    assert dm.files_intersecting(catalog, (0, 0, 1, 1)) == []
+
+    os.utime(csv, ns=(0, 0)) # touched, not changed
+    assert dm.build_catalog(catalog, data)['unchanged'] == 3
+    with open(csv, 'a') as outfile:
+        outfile.write('5,x,y\n')
+    os.remove(bad)
+    assert dm.build_catalog(catalog, data) == {
+        'added': 0, 'updated': 1, 'unchanged': 1, 'removed': 1, 'failed': 0}
+    assert dm.read_catalog(catalog)['rows'].tolist() == [739, 6]
+
+    with zipfile.ZipFile(data / 'table.zip', 'w') as table: # no geometries
+        table.write(csv, 'table.csv')
+    assert dm.build_catalog(catalog, data)['added'] == 1
+    files = dm.read_catalog(catalog).set_index('path')
+    table = str(data / 'table.zip')
+    assert files.loc[table, 'error'] is None
+    assert files.loc[table, 'rows'] == 6
+    assert files.loc[table, 'columns'] == ['Unnamed: 0', 'col1', 'col2']
@@ -3,7 +3,9 @@ import pandas as pd
 import geopandas as gpd
 import os
 import json
+import math
 import subprocess
+import sys
 
 import pytest
 
@@ -111,6 +113,18 @@ def test_compare_column_names():
                                 'POPULATION', 'ASIAN', 'AMIN'}
 
 
+def test_compare_column_names_of_files():
+    standards = ['AG18D', 'AG18R', 'geometry', 'asdf']
+    path = os.path.join('tests', 'inputs', 'CT_precincts.zip')
+    assert dq.compare_column_names(path, standards) == \
+                dq.compare_column_names(et.read_file(path).extract(), 
+                                        standards)
+    (matches, discrepancies) = dq.compare_column_names(
+            os.path.join('tests', 'inputs', 'test1.csv'), ['col1'])
+    assert matches == {'col1'}
+    assert discrepancies == {'Unnamed: 0', 'col2'}
+
+
 def test_sum_column_values():
     path_to_ak_shp = os.path.join('tests', 'dumps', 'AK-shapefiles')
     ak_gdf = et.read_file(os.path.join(
@@ -144,6 +158,40 @@ def test_sum_column_values():
     dm.remove_repos(path_to_ak_shp)
 
 
+def test_sum_column_values_by():
+    df = pd.DataFrame({'county': ['b', 'a', 'b', None, 'a'],
+                       'district': [1, 1, 1, 2, 2],
+                       'votes': [2 ** 62, 1, 2 ** 62, 5, 2],
+                       'share': [1e16, 0.1, -1e16, np.nan, 0.2],
+                       'blank': pd.array([1, None, 2, 3, 4], dtype='Int64'),
+                       'name': list('vwxyz')})
+
+    with pytest.raises(TypeError):
+        dq.sum_column_values_by(df, ['name'], 'county')
+    with pytest.raises(KeyError):
+        dq.sum_column_values_by(df, ['votes'], 'asdf')
+
+    sums = dq.sum_column_values_by(df, ['votes', 'share'], 'county')
+    assert sums.columns.tolist() == ['county', 'column', 'sum']
+    assert sums['county'].tolist()[:4] == ['a', 'a', 'b', 'b']
+    assert sums['county'].isna().tolist() == [False] * 4 + [True] * 2
+    assert sums['column'].tolist() == ['votes', 'share'] * 3
+    assert sums['sum'].tolist()[:4] == [3, 0.30000000000000004, 2 ** 63, 0.0]
+    assert sums['sum'][5] == 0.0
+
+    sums = dq.sum_column_values_by(df, ['share'], 'district')
+    assert sums['sum'].tolist() == [0.1, 0.2] # compensates for cancellation
+    df.loc[1, 'share'] = 1.0
+    sums = dq.sum_column_values_by(df, ['share'], 'district')
+    assert sums['sum'].tolist() == [1.0, 0.2]
+
+    sums = dq.sum_column_values_by(df, ['blank'], ['district', 'county'])
+    assert sums['district'].tolist() == [1, 1, 2, 2]
+    assert sums['county'].fillna('-').tolist() == ['a', 'b', 'a', '-']
+    assert sums['sum'].tolist() == [0, 3, 4, 3]
+    assert sums['sum'].dtype == np.int64
+
+
 def test_compare_column_values(): # remove 'no' prefix once ready to test
     df1 = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]],
                        columns=['COL1', 'COL2', 'COL3'])
@@ -217,6 +265,142 @@ def test_compare_column_values(): # remove 'no' prefix once ready to test
                        medsl_et.extract()['Attorney General democrat'][0])
 
 
+def test_diff_column_values():
+    df1 = pd.DataFrame(data=[[1, 2.5, 3], [4, 5.5, 6], [7, 8.5, 9]],
+                       columns=['COL1', 'COL2', 'COL3'], index=['a', 'b', 'c'])
+    df2 = pd.DataFrame(data=[[4, 5], [1, 2], [0, 0]],
+                       columns=['col2', 'col1'], index=['c', 'b', 'a'])
+
+    with pytest.raises(ValueError):
+        dq.diff_column_values(df1, df2.iloc[:2], ['COL1'], ['col1'])
+    with pytest.raises(ValueError):
+        dq.diff_column_values(df1, df2, ['COL1'], ['col1'], ['a'])
+    with pytest.raises(KeyError):
+        dq.diff_column_values(df1, df2, ['COL1'], ['col1'], ['a'], ['d'])
+
+    diff = dq.diff_column_values(df1, df2, ['COL1', 'COL2'], ['col1', 'col2'])
+    assert diff.columns.tolist() == ['COL1 [vs] col1', 'COL2 [vs] col2']
+    assert diff.index.names == ['row1', 'row2']
+    assert diff.index.tolist() == [('a', 'c'), ('b', 'b'), ('c', 'a')]
+    assert diff['COL1 [vs] col1'].tolist() == [-4, 2, 7]
+    assert diff['COL2 [vs] col2'].tolist() == [-1.5, 4.5, 8.5]
+
+    diff = dq.diff_column_values(df1, df2, ['COL3'], ['col2'], 
+                                 ['a', 'c'], ['a', 'c'])
+    assert diff['COL3 [vs] col2'].tolist() == [3, 5]
+
+    # duplicate rows are compared with their first occurrence
+    df3 = pd.concat([df1, df1.iloc[[0]] * 10])
+    diff = dq.diff_column_values(df3, df3, ['COL1'], ['COL3'], ['a'], ['a'])
+    assert diff['COL1 [vs] COL3'].tolist() == [-2]
+
+
+def test_align_tables():
+    df1 = pd.DataFrame({'GEOID': ['01', '02', '03', '05'], 
+                        'pop': [1, 2, 3, 5], 'vap': [1, 1, 2, 4]})
+    df2 = pd.DataFrame({'geoid': ['04', '03', '01', '05'], 
+                        'pop': [4, 3, 2, 7], 'vap': [4, 2, 1, 3]})
+
+    with pytest.raises(KeyError):
+        dq.align_tables(df1, df2, 'GEOID')
+    with pytest.raises(ValueError):
+        dq.align_tables(pd.concat([df1, df1]), df2, 'GEOID', 'geoid')
+
+    (aligned1, aligned2, only1, only2) = dq.align_tables(df1, df2, 'GEOID', 
+                                                         'geoid')
+    assert aligned1.index.tolist() == aligned2.index.tolist()
+    assert aligned1.index.tolist() == ['01', '03', '05']
+    assert aligned1['pop'].tolist() == [1, 3, 5]
+    assert aligned2['pop'].tolist() == [2, 3, 7]
+    assert (only1.tolist(), only2.tolist()) == (['02'], ['04'])
+
+    (aligned1, aligned2, only1, only2) = dq.align_tables(
+                df1, df2.rename(columns={'geoid': 'GEOID'}), ['GEOID', 'vap'])
+    assert aligned1.index.tolist() == [('01', 1), ('03', 2)]
+    assert aligned2['pop'].tolist() == [2, 3]
+    assert only2.tolist() == [('04', 4), ('05', 3)]
+
+    diff = dq.diff_column_values(df1, df2, ['pop', 'vap'], ['pop', 'vap'],
+                                 keys1='GEOID', keys2='geoid')
+    assert diff.index.tolist() == ['01', '03', '05']
+    assert diff['pop [vs] pop'].tolist() == [-1, 0, -2]
+    assert diff['vap [vs] vap'].tolist() == [0, 0, 1]
+    results = dq.compare_column_values(df1, df2, ['pop'], ['pop'],
+                                       keys1='GEOID', keys2='geoid')
+    assert results == {'pop [vs] pop': [('01', -1), ('03', 0), ('05', -2)]}
+    with pytest.raises(ValueError):
+        dq.diff_column_values(df1, df2, ['pop'], ['pop'], [0], [0], 'GEOID')
+
+
+def test_summarize_column_differences():
+    df1 = pd.DataFrame({'GEOID': ['01', '02', '03', '04'],
+                        'pop': [100, 200, 300, np.nan], 
+                        'vap': [1.0, np.nan, 3.0, 4.0],
+                        'name': ['a', 'b', 'c', 'd']})
+    df2 = pd.DataFrame({'GEOID': ['04', '03', '02', '01'],
+                        'pop': [5, 330, 202, 100], 
+                        'vap': [4.0, 3.0, np.nan, 1.0],
+                        'name': ['a', 'b', 'c', 'd']})
+
+    with pytest.raises(ValueError):
+        dq.summarize_column_differences(df1, df2, ['name'], ['name'])
+    with pytest.raises(ValueError):
+        dq.summarize_column_differences(df1, df2, ['pop'], ['pop', 'vap'])
+
+    summary = dq.summarize_column_differences(
+                df1, df2, ['pop', 'vap'], ['pop', 'vap'], keys1='GEOID')
+    assert summary.index.tolist() == ['pop [vs] pop', 'vap [vs] vap']
+    assert summary['compared'].tolist() == [4, 4]
+    assert summary['different'].tolist() == [3, 0]
+    assert summary.at['pop [vs] pop', 'max_abs_diff'] == 30
+    assert summary.at['pop [vs] pop', 'max_rel_diff'] == 30 / 330
+    assert summary.at['pop [vs] pop', 'top_rows'] == ['04', '03', '02']
+    assert summary.at['vap [vs] vap', 'top_rows'] == []
+
+    summary = dq.summarize_column_differences(
+                df1, df2, ['pop'], ['pop'], keys1='GEOID', atol=1, rtol=0.1,
+                top=1)
+    assert summary.at['pop [vs] pop', 'different'] == 1
+    assert summary.at['pop [vs] pop', 'top_rows'] == ['04']
+
+    summary = dq.summarize_column_differences(df1, df2, ['vap'], ['pop'])
+    assert summary.at['vap [vs] pop', 'different'] == 4
+    assert summary.at['vap [vs] pop', 'max_abs_diff'] == 199
+    assert summary.at['vap [vs] pop', 'top_rows'][0] == (1, 1)
+
+
+def test_diff_rows(tmp_path):
+    old = gpd.GeoDataFrame({'ID': ['a', 'b', 'c', 'd'], 'VOTES': [1, 2, 3, 4],
+                            'geometry': [Pt(0, 0), Pt(1, 1), None, Pt(2, 2)]})
+    new = gpd.GeoDataFrame({'id': ['e', 'd', 'c', 'b'], 
+                            'votes': [5.0, 4.0, 3.0, 2.0],
+                            'geometry': [Pt(3, 3), Pt(2, 2.5), None, 
+                                         Pt(1, 1)]})
+
+    with pytest.raises(KeyError):
+        dq.diff_rows(old, new, 'asdf')
+    with pytest.raises(ValueError):
+        dq.diff_rows(old, old.iloc[[0, 0]], 'ID')
+    with pytest.raises(ValueError):
+        dq.diff_rows(old, new, 'ID', 'id', ['VOTES'], [])
+
+    changes = dq.diff_rows(old, new, 'ID', 'id', ['VOTES', 'geometry'], 
+                           ['votes', 'geometry'])
+    assert {change: keys.tolist() for (change, keys) in changes.items()} == \
+                {'added': ['e'], 'removed': ['a'], 'changed': ['d']}
+    changes = dq.diff_rows(old, new, 'ID', 'id', ['VOTES'], ['votes'])
+    assert changes['changed'].tolist() == [] # ints are compared as floats
+
+    new['ID'] = new['id']
+    assert dq.diff_rows(old, new, 'ID')['changed'].tolist() == ['d']
+    changes = dq.diff_rows(old, new, ['ID', 'VOTES'], ['id', 'votes'],
+                           delta=str(tmp_path / 'delta.csv'))
+    assert changes['added'].tolist() == [('e', 5.0)]
+    delta = pd.read_csv(tmp_path / 'delta.csv')
+    assert delta['change'].tolist() == ['added', 'changed', 'removed']
+    assert delta['id'].tolist() == ['e', 'd', 'a']
+
+
 def test_compare_column_sums():
     df1 = pd.DataFrame(data=[[1, 2, 3], [4, 5, 6]],
                        columns=['COL1', 'COL2', 'COL3'])
@@ -269,6 +453,50 @@ def test_compare_column_sums():
     assert set(results) == set(to_comp)
 
 
+def test_compare_column_sums_by():
+    df1 = pd.DataFrame({'county': ['a', 'b', 'b', 'c', 'd', 'd'],
+                        'district': [1, 1, 1, 2, 2, 2],
+                        'votes': [10, 20, 5, 7, 1, 1],
+                        'share': [0.5, 0.25, 0.25, 1.0, 0.5, 0.5]})
+    df2 = pd.DataFrame({'fips': ['b', 'a', 'c', 'e'],
+                        'dist': [1, 1, 2, 2],
+                        'VOTES': [24, 10, 9, 3],
+                        'SHARE': [0.5, 0.5, 1.0, 1.0]})
+
+    with pytest.raises(ValueError):
+        dq.compare_column_sums_by(df1, df2, ['votes'], ['VOTES', 'SHARE'],
+                                  'county', 'fips')
+    with pytest.raises(ValueError):
+        dq.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'], 'county',
+                                  ['fips', 'dist'])
+    with pytest.raises(KeyError):
+        dq.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'], 'county')
+
+    diffs = dq.compare_column_sums_by(df1, df2, ['votes', 'share'], 
+                                      ['VOTES', 'SHARE'], 'county', 'fips')
+    assert diffs.columns.tolist() == ['county', 'column', 'sum1', 'sum2', 
+                                      'diff']
+    assert diffs[['county', 'column', 'diff']].values.tolist() == \
+                [['e', 'votes [vs] VOTES', -3], 
+                 ['c', 'votes [vs] VOTES', -2],
+                 ['d', 'votes [vs] VOTES', 2], 
+                 ['b', 'votes [vs] VOTES', 1], 
+                 ['d', 'share [vs] SHARE', 1.0],
+                 ['e', 'share [vs] SHARE', -1.0]]
+    assert diffs['sum2'].tolist()[:4] == [3, 9, 0, 24]
+
+    diffs = dq.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'], 
+                                      'county', 'fips', atol=1, rtol=0.5)
+    assert diffs['county'].tolist() == ['e', 'd']
+
+    diffs = dq.compare_column_sums_by(df1, df2, ['votes'], ['VOTES'], 
+                                      ['district', 'county'], ['dist', 'fips'])
+    assert diffs[['district', 'county']].values.tolist()[:2] == \
+                [[2, 'e'], [2, 'c']]
+    assert dq.compare_column_sums_by(df1, df1, ['votes'], ['votes'], 
+                                     'district').empty
+
+
 def test_geometries():
     missing_gdf = gpd.GeoDataFrame({'col': ['v1', 'v2', 'v3'], 
                     'geometry'  : [None, Pt(1, 2), Pt(2, 1)]})
@@ -282,4 +510,220 @@ def test_geometries():
     assert dq.has_empty_geometries(empty_gdf)
     assert not dq.has_empty_geometries(empty_gdf, threshold=0.5)
     assert dq.has_empty_geometries(empty_gdf, threshold=0.1)
-    
\ No newline at end of file
+    
+
+def test_geometry_profile():
+    bowtie = Pg([(0, 0), (2, 2), (2, 0), (0, 2)])
+    gdf = gpd.GeoDataFrame({'col': ['v1', 'v2', 'v3', 'v4', 'v5'],
+                            'geometry': [None, Pt(1, 2), Pg([]), bowtie,
+                                         Pg([(0, 0), (1, 1), (1, 0)])]},
+                           index=[3, 3, 1, 0, 2])
+
+    with pytest.raises(ValueError):
+        dq.geometry_profile(gdf, include=['asdf'])
+    with pytest.raises(KeyError):
+        dq.geometry_profile(pd.DataFrame({'col': [1]}))
+
+    profile = dq.geometry_profile(gdf)
+    assert profile['rows'] == 5
+    assert (profile['missing'], profile['empty']) == (1, 1)
+    assert (profile['invalid'], profile['non_simple']) == (1, 1)
+    assert profile['geom_types'] == {'GeometryCollection': 1, 'Point': 1,
+                                     'Polygon': 2}
+    assert profile['total_bounds'] == (0.0, 0.0, 2.0, 2.0)
+    assert profile['vertices'] == {'min': 0, 'median': 2.5, 'mean': 2.5, 
+                                   'max': 5, 'total': 10}
+
+    assert dq.geometry_profile(gdf, include=['empty', 'missing']) == \
+                {'rows': 5, 'empty': 1, 'missing': 1}
+
+
+def test_streaming(tmp_path):
+    path = os.path.join('tests', 'inputs', 'CT_precincts.zip')
+    gdf = et.read_file(path).extract()
+    cols = ['AG18D', 'AG18R']
+    assert dq.sum_column_values(path, cols) == \
+                dq.sum_column_values(gdf, cols) == \
+                [('AG18D', 691496), ('AG18R', 605504)]
+    assert dq.geometry_profile(path) == dq.geometry_profile(gdf)
+    assert not dq.has_missing_geometries(path)
+    assert not dq.has_empty_geometries(et.read_file(path))
+
+    df = pd.DataFrame({'a': [0.1] * 10, 'b': [2 ** 62] * 10,
+                       'c': [1e16, 1.0, -1e16, np.nan, 1.0] * 2})
+    csv = str(tmp_path / 'df.csv')
+    df.to_csv(csv, index=False)
+    totals = [('a', 1.0), ('b', 10 * 2 ** 62), ('c', 4.0)]
+    assert dq.sum_column_values(df, ['a', 'b', 'c']) == totals
+    assert dq.sum_column_values(csv, ['a', 'b', 'c']) == totals
+    assert dq.compare_column_sums(df, csv, ['a', 'c'], ['a', 'c']) == \
+                [('a [vs] a', 0.0), ('c [vs] c', 0.0)]
+
+    floats = np.random.default_rng(0).standard_normal(1000) * \
+                10.0 ** np.arange(-150, 150, 0.3)
+    assert dq.sum_column_values(pd.DataFrame({'d': floats}), ['d']) == \
+                [('d', math.fsum(floats.tolist()))]
+
+    gdf = et.read_file(csv).extract() # CSVs are read without geometries
+    assert dq.has_missing_geometries(csv) and dq.has_missing_geometries(gdf)
+    assert str(dq.geometry_profile(csv)) == str(dq.geometry_profile(gdf))
+
+
+def test_compare_geometries():
+    from shapely.geometry import Polygon, box
+    from shapely.geometry.polygon import orient
+    gdf1 = gpd.GeoDataFrame({'ID': ['a', 'b', 'c', 'd', 'e', 'f'],
+                             'geometry': [box(0, 0, 1, 1), box(1, 0, 2, 1),
+                                          box(2, 0, 3, 1), None, 
+                                          box(5, 5, 6, 6), box(7, 7, 8, 8)]})
+    gdf2 = gpd.GeoDataFrame({'id': ['c', 'b', 'a', 'd', 'e', 'g'],
+                             'geometry': [box(2, 0, 3, 1.5), 
+                                          box(1, 0, 2, 1.001),
+                                          orient(box(0, 0, 1, 1), -1), None, 
+                                          None, box(7, 7, 8, 8)]})
+
+    with pytest.raises(KeyError):
+        dq.compare_geometries(gdf1, gdf2, 'ID')
+    with pytest.raises(ValueError):
+        dq.compare_geometries(gdf1, gdf1.iloc[[0, 0]], 'ID')
+
+    deviations = dq.compare_geometries(gdf1, gdf2, 'ID', 'id')
+    assert deviations.index.tolist() == ['b', 'c', 'e']
+    assert deviations.columns.tolist() == ['hausdorff', 'sym_diff_area']
+    assert deviations.loc['c'].tolist() == [0.5, 0.5]
+    assert deviations.loc['e'].isna().all()
+    assert dq.compare_geometries(gdf1, gdf2, 'ID', 'id', workers=2, 
+                                 chunksize=2).equals(deviations)
+
+    deviations = dq.compare_geometries(gdf1, gdf2, 'ID', 'id', 
+                                       tolerance=0.01, area_tolerance=0.1)
+    assert deviations.index.tolist() == ['c', 'e']
+    deviations = dq.compare_geometries(gdf1, gdf2, 'ID', 'id', 
+                                       tolerance=0.01, area_tolerance=1)
+    assert deviations.index.tolist() == ['c', 'e'] # c's hausdorff is 0.5
+
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+    stretched = Polygon([(0, 0), (1, 1.5), (1, 0), (0, 1)])
+    gdf1 = gpd.GeoDataFrame({'ID': ['a', 'b'], 'geometry': [bowtie] * 2})
+    gdf2 = gpd.GeoDataFrame({'ID': ['a', 'b'], 
+                             'geometry': [bowtie, stretched]})
+    deviations = dq.compare_geometries(gdf1, gdf2, 'ID')
+    assert deviations.index.tolist() == ['b']
+    assert deviations.loc['b', 'hausdorff'] == 0.5
+    assert deviations.loc['b', 'sym_diff_area'] > 0
+    assert dq.compare_geometries(gdf1, gdf2, 'ID', workers=2, 
+                                 chunksize=1).equals(deviations)
+
+
+def sum_votes(table):
+    return int(table['AG18D'].sum())
+
+
+def test_run_checks(tmp_path):
+    shp = os.path.join('tests', 'inputs', 'CT_precincts.zip')
+    data = tmp_path / 'data'
+    data.mkdir()
+    pd.DataFrame({'a': [1, 1, 2], 'b': ['x', 'x', 'y']}).to_csv(
+        data / 'good.csv', index=False)
+    (data / 'bad.shp').write_text('not a shapefile')
+    with pytest.raises(ValueError):
+        dq.run_checks(str(data), checks=['asdf'])
+    with pytest.raises(ValueError):
+        dq.run_checks(shp, report=str(tmp_path / 'report.txt'))
+    report = dq.run_checks(str(tmp_path / 'asdf.csv'))
+    assert report['status'].tolist() == ['failed']
+
+    report = dq.run_checks(str(data), ['.csv', '.shp'], workers=2,
+                           checks=['rows', 'geometries', 'duplicates'],
+                           report=str(tmp_path / 'report.json'))
+    assert report['file'].tolist() == [str(data / 'bad.shp'), 
+                                       str(data / 'good.csv')]
+    assert report['status'].tolist() == ['failed', 'ok']
+    assert report['error'][0] and report['error'][1] is None
+    assert report['rows'].tolist() == [pd.NA, 3]
+    assert report['duplicate_rows'][1] == 1
+    assert 'missing' not in report # CSVs without geometries are skipped
+    assert dq.run_checks(shp, checks=['geometries'], workers=1)[
+                'missing'].tolist() == [0]
+    assert (report['read_seconds'] >= 0).all()
+    assert (report['seconds'] >= 0).all()
+    with open(tmp_path / 'report.json') as infile:
+        assert [row['status'] for row in json.load(infile)] == \
+                    ['failed', 'ok']
+
+    report = dq.run_checks([shp, str(data / 'good.csv')], workers=1,
+                           checks=['columns', sum_votes],
+                           report=str(tmp_path / 'report.csv'))
+    assert report['status'].tolist() == ['ok', 'failed']
+    assert report['error'][1].startswith('sum_votes: ')
+    assert report['columns'].tolist() == [48, 3]
+    assert report['sum_votes'].tolist() == [691496, pd.NA]
+    assert pd.read_csv(tmp_path / 'report.csv')['columns'].tolist() == \
+                [48, 3]
+
+    res = subprocess.run([sys.executable, '-m', 'gdutils.dataqa', 
+                          str(data), '-t', '.csv', '-c', 'rows', 
+                          '-o', str(tmp_path / 'cli.csv')], 
+                         capture_output=True, text=True)
+    assert res.returncode == 0
+    assert pd.read_csv(tmp_path / 'cli.csv')['rows'].tolist() == [3]
+
+
+def test_validity():
+    bowtie = Pg([(0, 0), (2, 2), (2, 0), (0, 2)])
+    gdf = gpd.GeoDataFrame({'col': ['v1', 'v2', 'v3', 'v4'],
+                            'geometry': [Pt(1, 2), bowtie, None, bowtie]},
+                           index=[3, 2, 1, 0])
+
+    reasons = dq.check_validity(gdf)
+    assert reasons.index.tolist() == [3, 2, 1, 0]
+    assert reasons[3] == 'Valid Geometry'
+    assert reasons[2].startswith('Self-intersection')
+    assert reasons[1] is None
+    assert dq.check_validity(gdf, workers=2, chunksize=1).equals(reasons)
+
+    repaired = dq.repair_geometries(gdf, workers=2, chunksize=3)
+    assert isinstance(repaired, gpd.GeoDataFrame)
+    assert repaired['col'].tolist() == gdf['col'].tolist()
+    assert repaired.geometry[3].equals(Pt(1, 2))
+    assert repaired.geometry[1] is None
+    assert repaired.geometry[[2, 0]].is_valid.all()
+    assert repaired.geometry[0].area == 2
+    assert not gdf.geometry[0].is_valid # unchanged
+    assert dq.repair_geometries(gdf, workers=1).equals(repaired)
+
+
+def test_overlaps_and_gaps(tmp_path):
+    from shapely.geometry import Polygon, box
+
+    # a 3x3 grid of unit squares missing its center, one square shifted
+    cells = [box(x, y, x + 1, y + 1) for x in range(3) for y in range(3)
+             if (x, y) != (1, 1)]
+    cells[0] = box(0.25, 0, 1.25, 1) # overlaps its neighbor by 0.25
+    gdf = gpd.GeoDataFrame({'col': list('abcdefgh')}, geometry=cells,
+                           index=list('ABCDEFGH'))
+    gdf.loc['Z', 'geometry'] = None
+
+    overlaps = dq.find_overlaps(gdf)
+    assert overlaps.columns.tolist() == ['row1', 'row2', 'area']
+    assert overlaps[['row1', 'row2']].values.tolist() == [['A', 'D']]
+    assert overlaps['area'].tolist() == [0.25]
+    assert dq.find_overlaps(gdf, tolerance=0.5).empty
+    assert dq.find_overlaps(gdf, workers=2, chunksize=2).equals(overlaps)
+
+    gaps = dq.find_gaps(gdf)
+    assert gaps['area'].tolist() == [1.0]
+    assert gaps.geometry[0].equals(box(1, 1, 2, 2))
+    assert dq.find_gaps(gdf, tolerance=1.0).empty
+    assert dq.find_gaps(gdf.drop(index='B')).empty # opens onto the edge
+
+    bowtie = Polygon([(0, 0), (2, 2), (2, 0), (0, 2)]) # invalid
+    invalid = gpd.GeoDataFrame(geometry=[bowtie, bowtie, box(5, 5, 6, 6)])
+    overlaps = dq.find_overlaps(invalid)
+    assert overlaps[['row1', 'row2']].values.tolist() == [[0, 1]]
+    assert overlaps['area'].tolist() == [2.0]
+    assert dq.find_gaps(invalid).empty
+    invalid.to_file(str(tmp_path / 'invalid.geojson'), driver='GeoJSON')
+    report = dq.run_checks([str(tmp_path / 'invalid.geojson')], 
+                           checks=['overlaps'])
+    assert report['overlaps'][0] == 1
@@ -2,7 +2,14 @@ import pandas as pd
 import geopandas as gpd
 import numpy as np
 from pathlib import PosixPath
+import json
 import os
+import shutil
+import socket
+import subprocess
+import sys
+import time
+import zipfile
 
 import pytest
 
@@ -399,3 +406,545 @@ def notest_large():
                               column='NAME10')
     test_et.extract_to_file()
 
+
+
+def test_lazy_imports():
+    heavy = ['geopandas', 'numpy', 'pandas', 'shapely']
+    check = ("import sys, gdutils.extract, gdutils.dataqa; "
+             "print([m for m in {} if m in sys.modules])".format(heavy))
+    res = subprocess.run([sys.executable, '-c', check], 
+                         capture_output=True, text=True)
+    assert res.returncode == 0
+    assert res.stdout.strip() == '[]'
+
+    res = subprocess.run([sys.executable, 'gdutils/extract.py', '-h'],
+                         capture_output=True, text=True)
+    assert res.returncode == 0
+    assert 'usage' in res.stdout
+
+
+def test_serve(tmp_path):
+    sock = str(tmp_path / 'extract.sock')
+    server = subprocess.Popen([sys.executable, 'gdutils/extract.py', 
+                               '--serve', sock])
+    try:
+        for _ in range(100):
+            if os.path.exists(sock):
+                break
+            time.sleep(0.1)
+
+        argv = [good_inf1, '-c', good_col1a, '-v', good_val1a]
+        direct = subprocess.run([sys.executable, 'gdutils/extract.py'] + argv,
+                                capture_output=True, text=True)
+        for _ in range(2): # second request is served from the warm cache
+            (out, err) = et.send_request(sock, argv)
+            assert out == direct.stdout
+            assert err == ''
+
+        (out, _) = et.send_request(sock, [good_inf1, '-c', bad_col])
+        assert 'Column not found' in out
+
+        direct = subprocess.run([sys.executable, 'gdutils/extract.py', bad_inf],
+                                capture_output=True, text=True)
+        (out, _) = et.send_request(sock, [bad_inf])
+        assert out == direct.stdout
+
+        stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stalled.connect(sock) # never sends its request
+        (out, _) = et.send_request(sock, argv)
+        assert out == et.send_request(sock, argv)[0]
+        stalled.close()
+
+        outfile = str(tmp_path / 'out.csv')
+        et.send_request(sock, [good_inf1, '-o', outfile])
+        assert pd.read_csv(outfile).equals(pd.read_csv(good_inf1))
+
+        with pytest.raises(RuntimeError):
+            et.serve(sock)
+
+        regular = tmp_path / 'keep.txt'
+        regular.write_text('keep')
+        with pytest.raises(FileExistsError):
+            et.serve(str(regular))
+        assert regular.read_text() == 'keep'
+    finally:
+        server.terminate()
+        server.wait()
+
+    assert not os.path.exists(sock)
+
+
+def test_stats():
+    del_outs()
+
+    test_et = et.ExtractTable(good_inf1, good_out, good_col1a, good_val1a)
+    assert set(test_et.stats) == {'read', 'geometrize', 'filter'}
+    assert test_et.stats['read']['rows_out'] == len(full_vals1)
+    assert test_et.stats['read']['bytes'] == os.path.getsize(good_inf1)
+    assert test_et.stats['filter']['rows_in'] == len(full_vals1)
+    assert test_et.stats['filter']['rows_out'] == full_vals1.count(good_val1a)
+
+    test_et.extract_to_file()
+    assert test_et.stats['reindex']['rows_out'] == \
+                full_vals1.count(good_val1a)
+    assert test_et.stats['write']['bytes'] == os.path.getsize(good_out)
+    assert all(entry['seconds'] >= 0 and entry['calls'] >= 1
+               for entry in test_et.stats.values())
+
+    res = subprocess.run([sys.executable, 'gdutils/extract.py', good_inf1,
+                          '-c', good_col1a, '--profile'],
+                         capture_output=True, text=True)
+    stats = json.loads(res.stderr)
+    assert stats['write']['rows_out'] == len(full_vals1)
+
+    test_et = et.ExtractTable(zip_inf)
+    assert test_et.stats['read']['bytes'] == os.path.getsize(zip_inf)
+
+    del_outs()
+
+
+def test_max_memory(tmp_path):
+    medsl = 'tests/inputs/medsl18_ct_clean.csv'
+    eager = et.ExtractTable(medsl, column='precinct', value='1a Town Hall')
+    chunked = et.ExtractTable(medsl, column='precinct', value='1a Town Hall',
+                              max_memory=100 * 1024)
+    assert chunked.max_memory == 100 * 1024
+    assert chunked.extract().equals(eager.extract())
+    assert chunked.stats['read']['rows_out'] == 1
+
+    chunked.value = ['1 Town Hall', '1a Town Hall'] # read again
+    eager.value = ['1 Town Hall', '1a Town Hall']
+    assert len(chunked.extract()) == 2
+    assert chunked.extract().equals(eager.extract())
+    chunked.column = 'Attorney General democrat'
+    with pytest.raises(MemoryError): # only some rows were read
+        chunked.extract()
+    with pytest.raises(MemoryError):
+        chunked.list_values()
+
+    df = pd.DataFrame({'id': ['a'] * 3000, 'n': range(3000), 
+                       'text': range(3000), 'flag': [True] * 3000})
+    (df.loc[0, 'id'], df.loc[2999, 'text']) = ('b', 'x')
+    (df.loc[2999, 'n'], df.loc[2998, 'flag']) = (np.nan, np.nan)
+    csv = os.path.join(str(tmp_path), 'dtypes.csv')
+    df.to_csv(csv, index=False)
+    whole = et.ExtractTable(csv, column='id', value='a')
+    chunks = et.ExtractTable(csv, column='id', value='a', 
+                             max_memory=20 * 1024)
+    assert chunks.stats['read']['rows_out'] == 2999
+    assert chunks.extract().equals(whole.extract()) # dtypes of whole file
+
+    big = et.read_file(medsl, 'precinct', ['1a Town Hall'], 
+                       max_memory=10 ** 10)
+    assert len(big.list_values()) == eager.stats['read']['rows_out']
+
+    with pytest.raises(MemoryError):
+        et.ExtractTable(medsl, max_memory=100 * 1024)
+    with pytest.raises(MemoryError):
+        et.ExtractTable(zip_inf, column='PRECINCT', max_memory=100 * 1024)
+    with pytest.raises(Exception):
+        et.ExtractTable(medsl, column=bad_col, value=bad_val, 
+                        max_memory=100 * 1024)
+
+    assert et.parse_arguments([medsl, '--max-memory', '2G']).max_memory == \
+                2 * 1024 ** 3
+    assert et.parse_arguments([medsl, '--max-memory', '1.5kb']).max_memory == \
+                1536
+    with pytest.raises(SystemExit):
+        et.parse_arguments([medsl, '--max-memory', 'lots'])
+
+
+def test_run_manifest(tmp_path):
+    csv = os.path.abspath('tests/inputs/test1.csv')
+    jobs = [{'infile': csv, 'outfile': 'a.csv', 'column': 'col1'},
+            {'infile': csv, 'outfile': 'b.csv', 'column': 'col1', 
+             'value': ['a']},
+            {'infile': 'missing.csv', 'outfile': 'c.csv'},
+            {'infile': csv, 'outfile': 'd.csv', 'column': bad_col}]
+    manifest = tmp_path / 'jobs.json'
+    manifest.write_text(json.dumps({'jobs': jobs}))
+
+    summary = et.run_manifest(str(manifest), workers=2)
+    assert [job['status'] for job in summary] == \
+                ['ok', 'ok', 'failed', 'failed']
+    assert summary[0]['read_seconds'] == summary[1]['read_seconds']
+    assert summary[3]['error'] is not None
+    assert et.read_file(str(tmp_path / 'b.csv'), 'col1').list_values() == \
+                ['a']
+    assert not (tmp_path / 'c.csv').exists()
+
+    yaml_manifest = tmp_path / 'jobs.yaml'
+    yaml_manifest.write_text("- {infile: %s, outfile: e.csv}\n" % csv)
+    assert et.run_manifest(str(yaml_manifest))[0]['status'] == 'ok'
+
+    with pytest.raises(ValueError):
+        et.run_manifest([{'infile': csv}])
+    with pytest.raises(ValueError):
+        et.run_manifest([{'infile': csv, 'outfile': 'x.csv', 'bad': 1}])
+
+    assert et.parse_arguments(['--manifest', str(manifest), 
+                               '--workers', '2']).workers == 2
+
+
+def test_async(tmp_path):
+    import asyncio
+    import concurrent.futures
+    import threading
+
+    csv = 'tests/inputs/test1.csv'
+
+    async def read_and_write():
+        tables = await asyncio.gather(et.aread_file(csv, 'col1', 'c'),
+                                      et.aread_file(zip_inf))
+        await tables[0].aextract_to_file(str(tmp_path / 'out.csv'))
+        return (tables, await tables[0].aextract())
+
+    ((t1, t2), gdf) = asyncio.run(read_and_write())
+    assert gdf.equals(et.read_file(csv, 'col1', 'c').extract())
+    assert t2.extract().equals(et.read_file(zip_inf).extract())
+    assert (tmp_path / 'out.csv').exists()
+
+    async def read_missing():
+        await et.aread_file('missing.csv')
+
+    with pytest.raises(AttributeError):
+        asyncio.run(read_missing())
+
+    zipped = str(tmp_path / 'precincts.zip')
+    shutil.copy(zip_inf, zipped)
+
+    async def read_zip_concurrently():
+        return await asyncio.gather(*[et.aread_file(zipped) 
+                                      for _ in range(4)])
+
+    expected = et.read_file(zip_inf).extract()
+    for table in asyncio.run(read_zip_concurrently()):
+        assert table.extract().equals(expected)
+
+    release = threading.Event()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(release.wait) # occupies the only worker
+
+        async def cancel_write():
+            task = asyncio.ensure_future(t1.aextract_to_file(
+                        str(tmp_path / 'cancelled.csv'), executor=pool))
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_write())
+        release.set()
+
+    assert not (tmp_path / 'cancelled.csv').exists()
+
+
+def test_backend(tmp_path):
+    medsl = 'tests/inputs/medsl18_ct_clean.csv'
+    assert et.read_file(medsl).backend == 'pandas'
+    with pytest.raises(ValueError):
+        et.ExtractTable(medsl, backend='spark')
+
+    try:
+        import dask_geopandas
+    except ImportError:
+        with pytest.raises(ImportError):
+            et.ExtractTable(medsl, backend='dask')
+
+    assert et.parse_arguments([medsl, '--backend', 'dask']).backend == 'dask'
+
+
+def test_dask_backend(tmp_path):
+    pytest.importorskip('dask_geopandas')
+    medsl = 'tests/inputs/medsl18_ct_clean.csv'
+
+    for (infile, column, value) in [(medsl, 'precinct', '1a Town Hall'),
+                                    (zip_inf, 'NAME10', None),
+                                    (zip_inf, 'NAME10', 'Bethel 1')]:
+        eager = et.ExtractTable(infile, column=column, value=value)
+        lazy = et.ExtractTable(infile, column=column, value=value, 
+                               backend='dask')
+        assert lazy.extract().equals(eager.extract())
+        assert list(lazy.list_values()) == list(eager.list_values())
+
+        eager.extract_to_file(str(tmp_path / 'eager.csv'))
+        lazy.extract_to_file(str(tmp_path / 'lazy.csv'))
+        assert (tmp_path / 'eager.csv').read_text() == \
+                    (tmp_path / 'lazy.csv').read_text()
+
+    repaired = et.ExtractTable(zip_inf, backend='dask', repair=True)
+    assert repaired.extract().equals(
+                et.ExtractTable(zip_inf, repair=True).extract())
+
+
+def test_incremental(tmp_path):
+    infile = tmp_path / 'in.csv'
+    infile.write_text(open('tests/inputs/test1.csv').read())
+    (inf, outf) = (str(infile), str(tmp_path / 'out.csv'))
+
+    assert not et.is_up_to_date(inf, outf, 'col1', 'c')
+    t = et.ExtractTable(inf, outf, 'col1', 'c')
+    t.extract_to_file(incremental=True)
+    assert os.path.exists(outf + '.extract.json')
+    assert et.is_up_to_date(inf, outf, 'col1', 'c')
+    assert not et.is_up_to_date(inf, outf, 'col1', ['c'])
+    assert not et.is_up_to_date(inf, outf, 'col2', 'c')
+
+    t.extract_to_file(incremental=True)
+    assert t.stats['write']['calls'] == 1
+
+    os.utime(inf, ns=(0, 0)) # touched but unchanged
+    assert et.is_up_to_date(inf, outf, 'col1', 'c')
+    infile.write_text(infile.read_text() + 'zzzz,e,f\n')
+    assert not et.is_up_to_date(inf, outf, 'col1', 'c')
+
+    t = et.ExtractTable(inf, outf, 'col1', 'c')
+    t.extract_to_file(incremental=True)
+    assert et.is_up_to_date(inf, outf, 'col1', 'c')
+    with open(outf, 'a') as f: # edited output
+        f.write('x')
+    assert not et.is_up_to_date(inf, outf, 'col1', 'c')
+
+    zipped = str(tmp_path / 'zipped.csv')
+    et.read_file(zip_inf).extract_to_file(zipped, incremental=True)
+    assert et.is_up_to_date(zip_inf, zipped)
+
+    shp = str(tmp_path / 'shapes.shp')
+    et.read_file(zip_inf).extract().head(3).to_file(shp)
+    shpout = str(tmp_path / 'shapes.csv')
+    et.read_file(shp).extract_to_file(shpout, incremental=True)
+    assert et.is_up_to_date(shp, shpout)
+    assert set(et.fingerprint_input(shp)['sidecars']) >= {'.dbf', '.shx'}
+    with open(str(tmp_path / 'shapes.prj'), 'a') as f: # edited sidecar
+        f.write(' ')
+    assert not et.is_up_to_date(shp, shpout)
+
+    t = et.ExtractTable(inf, outf)
+    infile.write_text(infile.read_text() + 'yyyy,g,h\n') # edited after read
+    t.extract_to_file(incremental=True)
+    assert not et.is_up_to_date(inf, outf)
+
+    fingerprint = et.fingerprint_input(inf)
+    infile.write_text(infile.read_text() + 'xxxx,i,j\n')
+    et.ExtractTable(inf, outf).extract_to_file()
+    et.mark_up_to_date(inf, outf, fingerprint=fingerprint)
+    assert not et.is_up_to_date(inf, outf)
+    et.mark_up_to_date(inf, outf)
+    assert et.is_up_to_date(inf, outf)
+
+    jobs = [{'infile': inf, 'outfile': str(tmp_path / 'a.csv')},
+            {'infile': inf, 'outfile': str(tmp_path / 'b.csv'), 
+             'column': 'col1'}]
+    assert [j['status'] for j in et.run_manifest(jobs, incremental=True)] \
+                == ['ok', 'ok']
+    assert [j['status'] for j in et.run_manifest(jobs, incremental=True)] \
+                == ['skipped', 'skipped']
+
+
+def test_duckdb_backend(tmp_path):
+    try:
+        import duckdb
+    except ImportError:
+        with pytest.raises(ImportError):
+            et.ExtractTable('tests/inputs/test1.csv', backend='duckdb')
+        return
+
+    medsl = 'tests/inputs/medsl18_ct_clean.csv'
+    for (infile, column, value) in [
+                ('tests/inputs/test1.csv', 'col1', ['a', 'c']),
+                ('tests/inputs/test2.csv', 'featurecla', 'Country'),
+                (medsl, 'precinct', '1a Town Hall'),
+                (medsl, None, None)]:
+        eager = et.ExtractTable(infile, column=column, value=value)
+        scanned = et.ExtractTable(infile, column=column, value=value, 
+                                  backend='duckdb')
+        pd.testing.assert_frame_equal(scanned.extract(), eager.extract())
+    assert scanned.stats['read']['rows_out'] == \
+                eager.stats['read']['rows_out']
+
+    scanned = et.ExtractTable(medsl, column='precinct', 
+                              value='1a Town Hall', backend='duckdb')
+    assert scanned.stats['read']['rows_out'] == 1
+
+    missing = tmp_path / 'missing.csv'
+    missing.write_text('a,b,n\nx,NA,1\ny,foo,NA\nz,null,3\n')
+    pd.testing.assert_frame_equal(
+                et.ExtractTable(str(missing), backend='duckdb').extract(),
+                et.ExtractTable(str(missing)).extract())
+
+    numeric = tmp_path / 'numeric.csv'
+    numeric.write_text('n,s\n1,a\n2,b\n')
+    with pytest.raises(Exception): # strings never match numbers
+        et.ExtractTable(str(numeric), column='n', value='1', backend='duckdb')
+    assert len(et.ExtractTable(str(numeric), column='n', value=[1, 2], 
+                               backend='duckdb').extract()) == 2
+
+    typed = tmp_path / 'typed.csv'
+    typed.write_text('code,flag,maybe,x,name\n' + ''.join(
+                '{},{},{},{!r},k{}\n'.format(
+                    '' if i % 7 == 0 else '{:02d}'.format(i % 10),
+                    bool(i % 2), '' if i % 5 == 0 else str(i % 3 > 0),
+                    1e-7 if i == 3 else 0.1 * i + 1 / 3, i % 4)
+                for i in range(30)))
+    for (column, value) in [(None, None), ('name', 'k1'), ('flag', True),
+                            ('code', 1), ('x', 1e-7)]:
+        eager = et.ExtractTable(str(typed), column=column, value=value)
+        scanned = et.ExtractTable(str(typed), column=column, value=value,
+                                  backend='duckdb')
+        pd.testing.assert_frame_equal(scanned.extract(), eager.extract())
+        eager.extract_to_file(str(tmp_path / 'eager.csv'))
+        scanned.extract_to_file(str(tmp_path / 'scanned.csv'))
+        assert (tmp_path / 'eager.csv').read_text() == \
+                    (tmp_path / 'scanned.csv').read_text()
+
+    parquet = str(tmp_path / 'test1.parquet')
+    duckdb.sql("COPY (SELECT * FROM read_csv('tests/inputs/test1.csv')) "
+               "TO '{}' (FORMAT PARQUET)".format(parquet))
+    assert list(et.ExtractTable(parquet, column='col1', value='c', 
+                                backend='duckdb').list_values('col2')) == \
+                ['d', '3', '5']
+
+
+def test_polars_backend(tmp_path):
+    try:
+        import polars
+    except ImportError:
+        with pytest.raises(ImportError):
+            et.ExtractTable('tests/inputs/test1.csv', backend='polars')
+        return
+
+    missing = tmp_path / 'missing.csv'
+    missing.write_text('a,b,n\nx,NA,1\ny,foo,NA\nz,null,3\n')
+    for (infile, column, value) in [
+                ('tests/inputs/test1.csv', 'col1', ['a', 'c']),
+                ('tests/inputs/test1.csv', None, None),
+                ('tests/inputs/medsl18_ct_clean.csv', 'precinct', 
+                 '1a Town Hall'),
+                (str(missing), 'n', [1.0, 3.0])]:
+        eager = et.ExtractTable(infile, column=column, value=value)
+        fast = et.ExtractTable(infile, column=column, value=value, 
+                               backend='polars')
+        pd.testing.assert_frame_equal(fast.extract(), eager.extract())
+        assert list(fast.list_columns()) == list(eager.list_columns())
+
+        eager.extract_to_file(str(tmp_path / 'eager.csv'))
+        fast.extract_to_file(str(tmp_path / 'fast.csv'))
+        assert (tmp_path / 'eager.csv').read_text() == \
+                    (tmp_path / 'fast.csv').read_text()
+
+    assert list(fast.list_values('a')) == ['x', 'y', 'z']
+    with pytest.raises(Exception): # strings never match numbers
+        et.ExtractTable(str(missing), column='n', value='1', backend='polars')
+
+    typed = tmp_path / 'typed.csv'
+    typed.write_text('code,flag,x,name\n' + ''.join(
+                '{},{},{!r},k{}\n'.format(
+                    '' if i % 7 == 0 else '{:02d}'.format(i % 10),
+                    bool(i % 2), 1e-7 if i == 3 else i / 4, i % 4)
+                for i in range(30)))
+    for (column, value) in [(None, None), ('name', 'k1'), ('flag', True)]:
+        eager = et.ExtractTable(str(typed), column=column, value=value)
+        fast = et.ExtractTable(str(typed), column=column, value=value, 
+                               backend='polars')
+        pd.testing.assert_frame_equal(fast.extract(), eager.extract())
+        eager.extract_to_file(str(tmp_path / 'eager.csv'))
+        fast.extract_to_file(str(tmp_path / 'fast.csv'))
+        assert (tmp_path / 'eager.csv').read_text() == \
+                    (tmp_path / 'fast.csv').read_text()
+
+    check = ("import sys, gdutils.extract as et; "
+             "et.ExtractTable('tests/inputs/test1.csv', {!r}, 'col1', 'c', "
+             "backend='polars').extract_to_file(); "
+             "print('geopandas' in sys.modules)".format(
+                    str(tmp_path / 'out.csv')))
+    res = subprocess.run([sys.executable, '-c', check], 
+                         capture_output=True, text=True)
+    assert res.stdout.strip() == 'False'
+
+    spatial = et.ExtractTable('tests/inputs/test2.csv', backend='polars')
+    assert 'geometry' in spatial.list_columns()
+    assert et.parse_arguments(['in.csv', '--backend', 'polars']).backend \
+                == 'polars'
+
+
+def test_repair(tmp_path):
+    infile = tmp_path / 'in.csv'
+    infile.write_text('id,geometry\n'
+                      'a,"POLYGON ((0 0, 2 2, 2 0, 0 2, 0 0))"\n'
+                      'b,"POINT (1 2)"\n')
+    (inf, outf) = (str(infile), str(tmp_path / 'out.csv'))
+
+    assert not et.read_file(inf).extract().geometry.is_valid.all()
+    t = et.read_file(inf, 'id', repair=True)
+    assert t.repair
+    assert t.extract().geometry.is_valid.all()
+    assert t.extract().geometry['a'].area == 2
+    assert t.stats['repair']['rows_out'] == 2
+
+    t = et.ExtractTable(inf, outf, repair=True)
+    t.extract_to_file(incremental=True)
+    assert et.is_up_to_date(inf, outf, repair=True)
+    assert not et.is_up_to_date(inf, outf)
+
+    assert et.parse_arguments([inf, '--repair']).repair
+
+
+def test_iter_chunks(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(et.iter_chunks('asdf.csv'))
+
+    path = os.path.join('tests', 'inputs', 'CT_precincts.zip')
+    gdf = et.read_file(path).extract()
+    chunks = list(et.iter_chunks(path, chunksize=300, 
+                                 columns=['AG18D', 'geometry']))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 139]
+    streamed = pd.concat(chunks)
+    assert isinstance(streamed, gpd.GeoDataFrame)
+    assert streamed.columns.tolist() == ['AG18D', 'geometry']
+    assert streamed.index.tolist() == list(range(len(gdf)))
+    assert streamed['AG18D'].equals(gdf['AG18D'])
+    assert streamed.geometry.geom_equals(gdf.geometry).all()
+
+    df = pd.DataFrame({'a': range(5), 'b': list('abcde')})
+    csv = str(tmp_path / 'df.csv')
+    df.to_csv(csv, index=False)
+    chunks = list(et.iter_chunks(csv, chunksize=2, columns=['b']))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert pd.concat(chunks).equals(df[['b']])
+
+    chunks = list(et.iter_chunks(csv, chunksize=2))
+    assert pd.concat(chunks).equals(et.read_file(csv).extract())
+    assert [len(chunk) for chunk in 
+            et.iter_chunks(csv, chunksize=2, columns=['geometry'])] == [2, 2, 1]
+
+
+def test_read_columns(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        et.read_columns('asdf.shp')
+
+    path = os.path.join('tests', 'inputs', 'CT_precincts.zip')
+    columns = et.read_file(path).extract().columns.tolist()
+    assert et.read_columns(path) == columns
+    assert et.read_columns(os.path.join('tests', 'inputs', 'test1.csv')) == \
+                ['Unnamed: 0', 'col1', 'col2']
+
+    gdf = et.read_file(path).extract().iloc[:3]
+    gdf.to_file(tmp_path / 'ct.shp')
+    gdf.to_file(tmp_path / 'ct.geojson', driver='GeoJSON')
+    assert et.read_columns(str(tmp_path / 'ct.shp')) == columns
+    assert et.read_columns(str(tmp_path / 'ct.dbf')) == columns[:-1]
+    assert et.read_columns(str(tmp_path / 'ct.geojson')) == columns
+    
+    with zipfile.ZipFile(tmp_path / 'ct.zip', 'w') as zipped:
+        zipped.write(os.path.join('tests', 'inputs', 'test1.csv'), 'a.csv')
+        zipped.write(tmp_path / 'ct.geojson', 'nested/ct.geojson')
+    zipped = str(tmp_path / 'ct.zip') # only top-level members are read
+    assert et.read_columns(zipped) == \
+                et.read_columns(os.path.join('tests', 'inputs', 'test1.csv'))
+    assert next(et.iter_chunks(zipped)).columns.tolist() == \
+                et.read_columns(zipped) + ['geometry']
+
+    with zipfile.ZipFile(tmp_path / 'both.zip', 'w') as both:
+        both.write(os.path.join('tests', 'inputs', 'test1.csv'), 'a.csv')
+        both.write(tmp_path / 'ct.geojson', 'ct.geojson')
+    assert et.read_columns(str(tmp_path / 'both.zip')) == columns